@@ -1,63 +1,76 @@
+import argparse
+import contextlib
+import io
 import json
 import os
 import glob
+import time
 from datetime import datetime
+from functools import lru_cache
 import random
 
+import assets
+import checkpoint
+import gtfs_import
+import headway
+import locales
+import manifest
+import minify
+import profiler
+import render_cache
+import route_index
+import service_worker
+import shard
+import size_report
+import trips
+
 # 📂 폴더 경로 설정 (GitHub Actions 환경에 맞게)
 data_folder = "data"
 output_folder = "outputs"
 route_file_path = "route/total_route.json"
 published_dates_file = os.path.join(output_folder, "published_dates.json")
 
-# 📂 출력 폴더 생성
-if not os.path.exists(output_folder):
-    os.makedirs(output_folder)
-
-# 🔍 data 폴더의 모든 JSON 파일 찾기
-json_files = glob.glob(os.path.join(data_folder, "*_schedules.json"))
-
-if not json_files:
-    print(f"🚫 {data_folder} 폴더에 '*_schedules.json' 파일을 찾을 수 없습니다.")
-    exit(1)
-
-print(f"✅ 발견된 JSON 파일: {len(json_files)}개")
-for file in json_files:
-    print(f"  📄 {file}")
-
 # ✅ 오늘 날짜
 today_date = datetime.today().strftime("%Y-%m-%d")
 update_date = datetime.today().strftime("%Y년 %m월 %d일")
 year = datetime.today().year
 
-# ✅ 파일별 발행일 관리
-if os.path.exists(published_dates_file):
+# 📅 노선 페이지의 날짜 필드 - 렌더링 캐시에는 자리표시자로 저장하고 꺼낼 때 그날 값으로 채움
+#    (날짜가 캐시 키에 들어가면 매일 밤 빌드에서 페이지 캐시가 한 번도 적중하지 않음)
+date_fields = ("today_date", "year", "update_date", "published_date", "last_modified_date")
+date_placeholders = {name: f"\x00{name}\x00" for name in date_fields}
+
+def load_published_dates():
+    """파일별 발행일 불러오기 (파일이 없거나 손상되었으면 빈 딕셔너리)"""
+    if os.path.exists(published_dates_file):
+        try:
+            with open(published_dates_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            print("🚫 'published_dates.json' 파일이 손상되었습니다. 새로 생성합니다.")
+            return {}
+    return {}
+
+def save_published_dates(published_dates):
+    """파일별 발행일 저장"""
+    with open(published_dates_file, "w", encoding="utf-8") as f:
+        json.dump(published_dates, f, ensure_ascii=False, indent=4)
+
+def load_route_map():
+    """출발지 기준 도착지 리스트 불러오기 (파일이 없으면 빈 딕셔너리)"""
     try:
-        with open(published_dates_file, "r", encoding="utf-8") as f:
-            published_dates = json.load(f)
+        with open(route_file_path, "r", encoding="utf-8") as f:
+            route_map = json.load(f)
+        print(f"✅ 노선 데이터 로드 완료: {route_file_path}")
+        return route_map
+    except FileNotFoundError:
+        print(f"⚠️  노선 파일을 찾을 수 없습니다: {route_file_path}")
+        print("📝 내부 링크 생성을 건너뛰고 계속 진행합니다.")
+        return {}
     except json.JSONDecodeError:
-        print("🚫 'published_dates.json' 파일이 손상되었습니다. 새로 생성합니다.")
-        published_dates = {}
-else:
-    published_dates = {}
-
-# ✅ 출발지 기준 도착지 리스트 불러오기 (파일이 없으면 빈 딕셔너리)
-try:
-    with open(route_file_path, "r", encoding="utf-8") as f:
-        route_map = json.load(f)
-    print(f"✅ 노선 데이터 로드 완료: {route_file_path}")
-except FileNotFoundError:
-    print(f"⚠️  노선 파일을 찾을 수 없습니다: {route_file_path}")
-    print("📝 내부 링크 생성을 건너뛰고 계속 진행합니다.")
-    route_map = {}
-except json.JSONDecodeError:
-    print(f"🚫 노선 파일이 손상되었습니다: {route_file_path}")
-    print("📝 내부 링크 생성을 건너뛰고 계속 진행합니다.")
-    route_map = {}
-
-# ✅ 생성된 HTML 파일 목록
-all_created_files = []
-all_skipped_destinations = []
+        print(f"🚫 노선 파일이 손상되었습니다: {route_file_path}")
+        print("📝 내부 링크 생성을 건너뛰고 계속 진행합니다.")
+        return {}
 
 def extract_duration_minutes(info_text):
     """차편정보에서 소요시간(분) 추출"""
@@ -106,36 +119,140 @@ def sanitize_filename(filename):
     
     return sanitized
 
-def generate_internal_links(route_map, dep_terminal, arr_terminal, max_links=7):
-    """내부 링크 생성 함수 - route_map이 비어있으면 빈 문자열 반환"""
-    if not route_map or dep_terminal not in route_map:
-        return ""  # 📝 노선 데이터가 없으면 내부 링크를 생성하지 않음
-        
-    links_html = ""
-    others = [to for to in route_map.get(dep_terminal, []) if to != arr_terminal]
-    
-    if not others:  # 다른 노선이 없으면 빈 문자열 반환
-        return ""
-        
-    random.shuffle(others)
-    max_links = min(len(others), max_links)
-    others = others[:max_links]
-    
-    links_html += f"""
+# ✅ 내부 링크 블록 템플릿
+related_links_open_template = """
     <div class='other-routes'>
         <h3>🚌 {dep_terminal}에서 출발하는 다른 주요 노선</h3>
         <div class='route-grid'>
     """
-    for to in others:
-        links_html += f"""
-            <a href="/{dep_terminal}-에서-{to}-가는-시외버스-시간표" class="route-card">
+related_link_template = """
+            <a href="/{dep_terminal}-에서-{to_slug}-가는-시외버스-시간표" class="route-card">
                 <span class="route-text">{dep_terminal} → {to}</span>
                 <span class="route-arrow">→</span>
             </a>
         """
+
+def route_slug(dep_terminal, arr_terminal):
+    """노선 페이지 주소 (확장자 제외, 도착지는 파일명과 같이 특수문자 처리)"""
+    return f"{dep_terminal}-에서-{sanitize_filename(str(arr_terminal))}-가는-시외버스-시간표"
+
+def linked_arrivals(schedules):
+    """노선 페이지가 만들어질 도착지 집합 (출발시각이 있는 버스가 하나라도 있는 도착지)"""
+    return {arr_terminal for arr_terminal, schedule_list in schedules.items()
+            if any(str(bus.get('TIM_TIM') or bus.get('출발시각', '')).strip() for bus in schedule_list or [])}
+
+def terminal_link_targets(dep_terminal, schedules):
+    """출발지 하나에서 만들어질 노선 페이지 주소 집합"""
+    return {route_slug(dep_terminal, arr_terminal) for arr_terminal in linked_arrivals(schedules)}
+
+def collect_link_targets(data_pattern=None):
+    """모든 데이터 파일에서 실제로 만들어질 노선 페이지 주소 집합 (샤드 빌드에서도 전체 기준)"""
+    data_pattern = data_pattern or os.path.join(data_folder, "*_schedules.json")
+    targets = set()
+    for json_file_path in glob.glob(data_pattern):
+        with contextlib.redirect_stdout(io.StringIO()):  # 변환 로그는 생략
+            bus_data = read_bus_data(json_file_path)
+            schedules = normalize_schedules(bus_data) if bus_data is not None else None
+        if schedules:
+            targets |= terminal_link_targets(terminal_name_from_path(json_file_path), schedules)
+    return targets
+
+def pick_related_routes(route_map, dep_terminal, arr_terminal, max_links=7, link_targets=None):
+    """내부 링크로 보여줄 다른 도착지를 무작위로 선택 (route_map이 비어있으면 빈 리스트)
+
+    노선마다 고정된 시드를 쓰므로 빌드 순서·샤드 분할과 관계없이 항상 같은 링크가 선택됩니다.
+    link_targets(collect_link_targets)가 주어지면 페이지가 없는 도착지는 후보에서 뺍니다.
+    """
+    if not route_map or dep_terminal not in route_map:
+        return []  # 📝 노선 데이터가 없으면 내부 링크를 생성하지 않음
+
+    others = [to for to in route_map.get(dep_terminal, []) if to != arr_terminal
+              and (link_targets is None or route_slug(dep_terminal, to) in link_targets)]
+    random.Random(f"{dep_terminal}\x1f{arr_terminal}").shuffle(others)
+    return others[:min(len(others), max_links)]
+
+def render_internal_links(dep_terminal, others, minify_pages=False, sanitize_links=False,
+                          locale=locales.default_locale):
+    """선택된 도착지로 내부 링크 HTML 생성 - 도착지가 없으면 빈 문자열 반환
+
+    sanitize_links=True면 링크 주소를 실제 파일명과 같게 특수문자 처리합니다.
+    """
+    if not others:  # 다른 노선이 없으면 빈 문자열 반환
+        return ""
+
+    open_template = locales.localize(related_links_open_template, locale)
+    link_template = locales.localize(related_link_template, locale)
+    if minify_pages:
+        open_template = minify.minify_template(open_template)
+        link_template = minify.minify_template(link_template)
+
+    dep_name = locales.place_name(dep_terminal, locale)
+    links_html = open_template.format(dep_terminal=dep_terminal, dep_name=dep_name)
+    for to in others:
+        to_slug = sanitize_filename(str(to)) if sanitize_links else to
+        links_html += link_template.format(dep_terminal=dep_terminal, to=to, to_slug=to_slug, dep_name=dep_name,
+                                           to_name=locales.place_name(str(to), locale))
     links_html += "</div></div>"
     return links_html
 
+# ✅ 같은 버스가 함께 정차하는 정류장 안내 템플릿
+via_info_template = """
+                <div class="via-info">
+                    <i class="fas fa-route"></i>
+                    {via_text}
+                </div>
+                """
+
+def render_via_info(arr_terminal, via_stops, minify_pages=False, max_stops=5, locale=locales.default_locale):
+    """운행 패턴으로 찾은 경유지·이후 정차지 안내 HTML (함께 정차하는 곳이 없으면 빈 문자열)"""
+    if not via_stops:
+        return ""
+    before, after = via_stops
+    def stops(names):
+        return ', '.join(locales.place_name(name, locale) for name in names[:max_stops])
+    sentences = []
+    if before:
+        sentences.append(locales.label(locale, "via_before", stops=stops(before)))
+    if after:
+        sentences.append(locales.label(locale, "via_after", arr=locales.place_name(arr_terminal, locale),
+                                       stops=stops(after)))
+    template = minify.minify_template(via_info_template) if minify_pages else via_info_template
+    return template.format(via_text=" ".join(sentences))
+
+# ✅ 돌아오는 버스 안내 템플릿 (반대 방향 페이지가 없으면 링크 검사 모드에서 생략)
+return_section_template = """<div class="return-section">
+            <h2 class="booking-title"><i class="fas fa-undo-alt"></i> 돌아오는 시간표</h2>
+            <p class="booking-subtitle"><strong>{arr_terminal}</strong>에서 <strong>{dep_terminal}</strong>로 가는 버스 시간표를 확인하세요</p>
+            <a href="https://bus.medilocator.co.kr/{return_slug}" class="return-btn">
+                <i class="fas fa-arrow-left"></i>
+                <span>{arr_terminal} → {dep_terminal} 시간표</span>
+            </a>
+        </div>"""
+
+def render_return_section(dep_terminal, arr_terminal, minify_pages=False, link_targets=None,
+                          locale=locales.default_locale):
+    """돌아오는 버스 안내 HTML
+
+    link_targets가 주어지면 반대 방향 페이지가 있을 때만 실제 파일명으로 링크하고, 없으면 빈 문자열을 반환합니다.
+    """
+    if link_targets is None:
+        return_slug = f"{arr_terminal}-에서-{dep_terminal}-가는-시외버스-시간표"
+    else:
+        return_slug = route_slug(arr_terminal, dep_terminal)
+        if return_slug not in link_targets:
+            return ""
+    template = locales.localize(return_section_template, locale)
+    if minify_pages:
+        template = minify.minify_template(template)
+    return template.format(dep_terminal=dep_terminal, arr_terminal=arr_terminal, return_slug=return_slug,
+                           dep_name=locales.place_name(dep_terminal, locale),
+                           arr_name=locales.place_name(arr_terminal, locale))
+
+def generate_internal_links(route_map, dep_terminal, arr_terminal, max_links=7, minify_pages=False):
+    """내부 링크 생성 함수 - route_map이 비어있으면 빈 문자열 반환"""
+    others = pick_related_routes(route_map, dep_terminal, arr_terminal, max_links)
+    return render_internal_links(dep_terminal, others, minify_pages)
+
 # ✅ 새로운 현대적인 HTML 템플릿
 html_template = """<!DOCTYPE html>
 <html lang="ko">
@@ -178,8 +295,7 @@ html_template = """<!DOCTYPE html>
     <meta name="theme-color" content="#2563eb">
     
     <!-- 📱 Font & Icons -->
-    <link href="https://fonts.googleapis.com/css2?family=Pretendard:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    {asset_links}{alternate_links}
     
     <style>
         * {{
@@ -335,6 +451,42 @@ html_template = """<!DOCTYPE html>
             background: #f8fafc;
         }}
 
+        .headway-info {{
+            display: block;
+            margin-top: 4px;
+            font-size: 13px;
+            color: #2563eb;
+        }}
+
+        .headway-times {{
+            margin-top: 6px;
+            font-size: 13px;
+            color: #64748b;
+            line-height: 1.6;
+        }}
+
+        .headway-times summary {{
+            cursor: pointer;
+            color: #475569;
+        }}
+
+        .live-seats {{
+            display: block;
+            margin-top: 4px;
+            font-size: 12px;
+            color: #dc2626;
+        }}
+
+        .via-info {{
+            margin-top: 16px;
+            padding: 14px 16px;
+            background: #eff6ff;
+            border-radius: 12px;
+            color: #1e40af;
+            font-size: 14px;
+            line-height: 1.6;
+        }}
+
         .btn-book {{
             background: linear-gradient(135deg, #dc2626 0%, #b91c1c 100%);
             color: white;
@@ -750,7 +902,7 @@ html_template = """<!DOCTYPE html>
                         {bus_rows}
                     </tbody>
                 </table>
-                
+                {via_info}
                 <div class="update-info">
                     <i class="fas fa-info-circle"></i>
                     <strong>최신 업데이트:</strong> {update_date} | 
@@ -781,14 +933,7 @@ html_template = """<!DOCTYPE html>
         </div>
 
         <!-- 🔄 돌아오는 버스 -->
-        <div class="return-section">
-            <h2 class="booking-title"><i class="fas fa-undo-alt"></i> 돌아오는 시간표</h2>
-            <p class="booking-subtitle"><strong>{arr_terminal}</strong>에서 <strong>{dep_terminal}</strong>로 가는 버스 시간표를 확인하세요</p>
-            <a href="https://bus.medilocator.co.kr/{arr_terminal}-에서-{dep_terminal}-가는-시외버스-시간표" class="return-btn">
-                <i class="fas fa-arrow-left"></i>
-                <span>{arr_terminal} → {dep_terminal} 시간표</span>
-            </a>
-        </div>
+        {return_section}
 
         <!-- 🗺️ 전체 노선 -->
         <div class="hub-section">
@@ -872,26 +1017,123 @@ document.addEventListener('DOMContentLoaded', function() {{
     }});
 }});
 </script>
-
-{structured_data}
+{sw_registration}
+{live_script}
 </body>
 </html>
 """
 
-# 🚀 모든 JSON 파일 처리 시작
-print(f"\n🚀 HTML 파일 생성 시작...")
+# ✅ 시간표 한 줄 템플릿
+bus_row_template = """
+                    <tr>
+                        <td><strong>{dep_time}</strong></td>
+                        <td>{duration}</td>
+                        <td>{company}</td>
+                        <td><a href='https://www.bustago.or.kr/newweb/kr/booking/info_schedule.jsp' target='_self' class='btn-book'><i class="fas fa-ticket-alt"></i> 예매</a></td>
+                    </tr>
+                """
+
+# ✅ 배차 간격 묶음 한 줄 템플릿 (전체 출발시각은 접어서 표시)
+headway_row_template = """
+                    <tr class="headway-row">
+                        <td><strong>{start}~{end}</strong><span class="headway-info">매 {headway}분 · {count}회</span>
+                            <details class="headway-times"><summary>전체 시간 보기</summary>{times}</details></td>
+                        <td>{duration}</td>
+                        <td>{company}</td>
+                        <td><a href='https://www.bustago.or.kr/newweb/kr/booking/info_schedule.jsp' target='_self' class='btn-book'><i class="fas fa-ticket-alt"></i> 예매</a></td>
+                    </tr>
+                """
 
-for json_file_path in json_files:
-    print(f"\n📄 처리 중: {json_file_path}")
-    
-    # ✅ 출발지 자동 추출 (파일명 기반)
-    filename = os.path.basename(json_file_path)
-    dep_terminal = filename.replace("_schedules.json", "")
-    
+def format_duration(duration_min, locale=locales.default_locale):
+    """소요시간(분) → 'N시간 M분' (정보가 없으면 '정보 없음')"""
+    if duration_min > 0:
+        return locales.format_duration(duration_min, locale)
+    return locales.label(locale, "no_info")
+
+# 🪑 실시간 좌석 표시용 행 템플릿 (출발 ID로 live/{출발지}.json의 좌석·요금을 찾아 표시)
+live_bus_row_template = """
+                    <tr data-dep="{dep_id}">
+                        <td><strong>{dep_time}</strong></td>
+                        <td>{duration}</td>
+                        <td>{company}</td>
+                        <td><a href='https://www.bustago.or.kr/newweb/kr/booking/info_schedule.jsp' target='_self' class='btn-book'><i class="fas fa-ticket-alt"></i> 예매</a></td>
+                    </tr>
+                """
+
+# 🪑 실시간 좌석 갱신 주기 (초) - live.py가 파일을 바꾸는 주기와 맞춤
+live_poll_seconds = 120
+
+# 🪑 좌석·요금을 표에 덧붙이는 스크립트 (페이지를 다시 만들지 않고 live/{출발지}.json만 다시 읽음)
+live_script_template = (
+    "<script>(function(){{var u='/live/'+encodeURIComponent({dep})+'.json',a={arr};"
+    "function p(){{fetch(u,{{cache:'no-store'}}).then(function(r){{return r.ok?r.json():null}}).then(function(d){{"
+    "if(!d)return;var m=(d.departures||{{}})[a]||{{}};"
+    "document.querySelectorAll('tr[data-dep]').forEach(function(t){{"
+    "var x=m[t.getAttribute('data-dep')],s=t.querySelector('.live-seats');"
+    "if(!x){{if(s)s.remove();return}}"
+    "if(!s){{s=document.createElement('span');s.className='live-seats';t.cells[0].appendChild(s)}}"
+    "s.textContent=[x.seats!=null?'잔여 '+x.seats+(x.total!=null?'/'+x.total:'')+'석':'',"
+    "x.fare!=null?x.fare.toLocaleString()+'원':''].filter(Boolean).join(' · ')}})}}).catch(function(){{}})}}"
+    "p();setInterval(function(){{if(!document.hidden)p()}},{interval})}})();</script>"
+)
+
+def departure_fields(bus):
+    """버스 데이터 하나 → (출발시각 'HH:MM', 소요시간(분), 운행회사)"""
+    # 새로운 JSON 구조에 맞게 시간 정보 추출
+    dep_time_raw = bus.get('TIM_TIM', bus.get('출발시각', '0000'))
+    if isinstance(dep_time_raw, str):
+        if ':' in dep_time_raw:  # "07:45" 형태
+            dep_time = dep_time_raw
+        elif len(dep_time_raw) >= 4:  # "0745" 형태
+            dep_time = f"{dep_time_raw[:2]}:{dep_time_raw[2:4]}"
+        else:
+            dep_time = dep_time_raw
+    else:
+        dep_time = str(dep_time_raw)
+
+    # 소요시간 정보 추출
+    duration_min = bus.get('LIN_TIM', 0)
+
+    # 운행회사 정보 추출
+    company = bus.get("COR_NAM", bus.get("차편정보", "정보 없음"))
+    if company and company != "정보 없음":
+        # "경남여객(일반)1:10 소요" → "경남여객" 추출
+        company = company.split('(')[0].strip()
+
+    return dep_time, duration_min, company
+
+def assign_departure_ids(times, companies):
+    """출발시각·운행회사로 노선 안에서 유일한 출발 ID 목록 생성 (예: '0830-전북고속', 중복이면 '-2'를 붙임)"""
+    ids = []
+    seen = {}
+    for dep_time, company in zip(times, companies):
+        dep_id = f"{dep_time.replace(':', '')}-{company}"
+        seen[dep_id] = seen.get(dep_id, 0) + 1
+        ids.append(dep_id if seen[dep_id] == 1 else f"{dep_id}-{seen[dep_id]}")
+    return ids
+
+def has_live_fields(buses):
+    """잔여좌석·어른요금이 들어 있는 데이터인지 (리스트 형식 원본만 해당)"""
+    return any(bus.get('잔여좌석') or bus.get('어른요금') for bus in buses)
+
+def render_live_script(dep_terminal, arr_terminal, locale=locales.default_locale):
+    """실시간 좌석 스크립트 (출발지·도착지명은 JSON 문자열로 삽입)"""
+    def js_string(value):
+        return json.dumps(value, ensure_ascii=False).replace("</", "<\\/")
+    template = locales.localize(live_script_template, locale)
+    return template.format(dep=js_string(dep_terminal), arr=js_string(arr_terminal),
+                           interval=live_poll_seconds * 1000)
+
+def terminal_name_from_path(json_file_path):
+    """파일명에서 출발지 추출 (예: 가평_schedules.json → 가평)"""
+    return os.path.basename(json_file_path).replace("_schedules.json", "")
+
+def read_bus_data(json_file_path):
+    """JSON 파일 원본 읽기 (실패 시 None)"""
     # 🔍 JSON 파일 확인
     if not os.path.exists(json_file_path):
         print(f"🚫 파일을 찾을 수 없습니다: {json_file_path}")
-        continue
+        return None
 
     # 🔍 JSON 파일 읽기
     try:
@@ -899,11 +1141,13 @@ for json_file_path in json_files:
             bus_data = json.load(f)
         print(f"✅ JSON 데이터 로드 완료.")
         print(f"📊 데이터 타입: {type(bus_data)}")
+        return bus_data
     except Exception as e:
         print(f"🚫 JSON 파일 읽기 오류: {e}")
-        continue
+        return None
 
-    # ✅ JSON 데이터의 구조 확인 및 변환
+def normalize_schedules(bus_data):
+    """JSON 데이터를 {도착지: [버스 데이터]} 형태로 변환 (지원하지 않는 구조면 None)"""
     schedules = {}  # 📌 schedules 변수 초기화
 
     if isinstance(bus_data, list):
@@ -950,15 +1194,335 @@ for json_file_path in json_files:
 
     else:
         print("🚫 JSON 데이터가 올바른 형식이 아닙니다. 리스트 또는 딕셔너리 구조여야 합니다.")
-        continue
+        return None
 
-    # ✅ 도착지별 HTML 파일 생성
+    return schedules
+
+def schedule_summary(valid_buses, shared=None):
+    """언어와 관계없는 시간표 계산 → {times, durations, companies, entries, dep_ids, live_enabled, run_count}
+
+    shared(dict)가 주어지면 결과를 담아 두어 같은 노선의 다른 언어 페이지는 다시 계산하지 않습니다.
+    """
+    if shared is not None and "summary" in shared:
+        return shared["summary"]
+    times, durations, companies = [], [], []
+    for bus in valid_buses:  # 유효한 버스 데이터만 사용
+        dep_time, duration_min, company = departure_fields(bus)
+        times.append(dep_time)
+        durations.append(duration_min)
+        companies.append(company)
+
+    live_enabled = has_live_fields(valid_buses)
+    dep_ids = None
+    if live_enabled:
+        # 🪑 실시간 좌석 페이지는 출발마다 좌석 수가 달라 묶지 않고 행마다 출발 ID를 붙임
+        entries = [{"time": t, "duration": d, "company": c} for t, d, c in zip(times, durations, companies)]
+        dep_ids = assign_departure_ids(times, companies)
+    else:
+        # ✅ 같은 간격으로 이어지는 출발은 한 줄로 묶어 표시 (예: 06:00~22:00 매 20분)
+        entries = headway.compress_departures(zip(times, durations, companies))
+    summary = {
+        "times": times, "durations": durations, "companies": companies, "entries": entries, "dep_ids": dep_ids,
+        "live_enabled": live_enabled, "run_count": sum(1 for entry in entries if headway.is_run(entry)),
+    }
+    if shared is not None:
+        shared["summary"] = summary
+    return summary
+
+def render_table(valid_buses, minify_pages=False, locale=locales.default_locale, shared=None):
+    """시간표 조각 생성 → {bus_rows, first_bus, last_bus, avg_duration, bus_count, live_enabled, raw_size}
+
+    raw_size는 압축하지 않은 템플릿으로 만들었을 때의 시간표 행 크기입니다 (압축 리포트용).
+    """
+    # ✅ 버스 시간표 데이터 처리 (valid_buses 사용)
+    summary = schedule_summary(valid_buses, shared)
+    times, durations = summary["times"], summary["durations"]
+    entries, dep_ids, run_count = summary["entries"], summary["dep_ids"], summary["run_count"]
+    live_enabled = summary["live_enabled"]
+    no_info = locales.label(locale, "no_info")
+
+    bus_rows = ""
+    row_source = locales.localize(live_bus_row_template if live_enabled else bus_row_template, locale)
+    run_source = locales.localize(headway_row_template, locale)
+    row_template = minify.minify_template(row_source) if minify_pages else row_source
+    run_template = minify.minify_template(run_source) if minify_pages else run_source
+    for i, entry in enumerate(entries):
+        duration = format_duration(entry["duration"], locale)
+        if live_enabled:
+            bus_rows += row_template.format(dep_id=dep_ids[i], dep_time=entry["time"], duration=duration,
+                                            company=entry["company"])
+        elif headway.is_run(entry):
+            bus_rows += run_template.format(
+                start=entry["start"], end=entry["end"], headway=entry["headway"], count=entry["count"],
+                times=" · ".join(headway.entry_times(entry)), duration=duration, company=entry["company"]
+            )
+        else:
+            bus_rows += row_template.format(dep_time=entry["time"], duration=duration, company=entry["company"])
+
+    raw_size = len(bus_rows.encode("utf-8"))
+    if minify_pages:
+        raw_size += ((len(entries) - run_count) * minify.literal_savings(row_source)
+                     + run_count * minify.literal_savings(run_source))
+
+    # ✅ 기본 정보 계산 (이 시점에서 times는 비어있지 않음을 보장)
+    return {
+        "bus_rows": bus_rows,
+        "first_bus": min(times) if times else no_info,
+        "last_bus": max(times) if times else no_info,
+        "avg_duration": locales.format_duration(sum(durations)//len(durations), locale) if durations else no_info,
+        "bus_count": len(times),
+        "live_enabled": live_enabled,
+        "raw_size": raw_size,
+    }
+
+def render_structured_data(dep_terminal, arr_terminal_original, arr_terminal_safe, valid_buses,
+                           locale=locales.default_locale, shared=None):
+    """JSON-LD 구조화 데이터 조각 생성 (시간 정보가 없으면 빈 문자열)"""
+    summary = schedule_summary(valid_buses, shared)
+    times, durations, companies = summary["times"], summary["durations"], summary["companies"]
+    dep_name = locales.place_name(dep_terminal, locale)
+    arr_name = locales.place_name(arr_terminal_original, locale)
+    first_bus = min(times) if times else "정보 없음"
+    bus_count = len(times)
+
+    # ✅ 구조화 데이터 생성
+    structured_data = ""
+    if times and durations and first_bus != "정보 없음":
+        try:
+            first_bus_hour, first_bus_minute = map(int, first_bus.split(":"))
+            avg_minute_duration = sum(durations)//len(durations) if durations else 0
+            arrival_total_min = first_bus_hour * 60 + first_bus_minute + avg_minute_duration
+            arrival_hour_str = str(arrival_total_min // 60).zfill(2)
+            arrival_minute_str = str(arrival_total_min % 60).zfill(2)
+            first_bus_hour_str = str(first_bus_hour).zfill(2)
+            first_bus_minute_str = str(first_bus_minute).zfill(2)
+
+            # 시간표에 처음 나온 순서 유지 (set 순서는 실행마다 달라 페이지 내용이 바뀜)
+            unique_companies = list(dict.fromkeys(c for c in companies if c != "정보 없음"))
+            if len(unique_companies) == 1:
+                provider_json = f'  "provider": {{"@type": "Organization", "name": "{unique_companies[0]}"}},'
+            elif len(unique_companies) > 1:
+                provider_json = '  "provider": [' + ",".join([f'{{"@type": "Organization", "name": "{c}"}}' for c in unique_companies]) + '],'
+            else:
+                provider_json = ''
+
+            structured_data = f"""
+                <script type="application/ld+json">
+                {{
+                    "@context": "https://schema.org",
+                    "@type": "BusTrip",
+                    "name": "{locales.label(locale, "trip_name", dep=dep_name, arr=arr_name)}",
+                    "description": "{locales.label(locale, "trip_description", dep=dep_name, arr=arr_name)}",
+                    {provider_json}
+                    "departureBusStop": {{"@type": "BusStation", "name": "{locales.label(locale, "station", name=dep_name)}"}},
+                    "arrivalBusStop": {{"@type": "BusStation", "name": "{locales.label(locale, "station", name=arr_name)}"}},
+                    "departureTime": "{first_bus_hour_str}:{first_bus_minute_str}",
+                    "arrivalTime": "{arrival_hour_str}:{arrival_minute_str}",
+                    "busNumber": "{bus_count}",
+                    "url": "{locales.site_url}{locales.page_path(f"{dep_terminal}-에서-{arr_terminal_safe}-가는-시외버스-시간표", locale)}"
+                }}
+                </script>
+                """
+        except (ValueError, AttributeError):
+            structured_data = ""
+    return structured_data
+
+def render_route_page(dep_terminal, arr_terminal_original, arr_terminal_safe, valid_buses, route_map, published_date,
+                      minify_pages=False, size_stats=None, via_stops=None, cache=None, link_targets=None,
+                      breakdown=None, locale=locales.default_locale, alternates="", shared=None, dates=None):
+    """노선 하나의 HTML 내용 생성
+
+    minify_pages=True면 미리 압축해 둔 템플릿에 조각(시간표 행, 내부 링크, JSON-LD)만 압축해 채웁니다.
+    via_stops는 trips.stop_index로 미리 계산한 (경유지, 이후 정차지) 목록입니다.
+    cache가 주어지면 시간표·JSON-LD·내부 링크 조각을 각자의 입력 해시로 캐시해, 노선 파일만 바뀐 경우
+    시간표는 다시 만들지 않고 내부 링크 조각만 새로 만들어 끼워 넣습니다.
+    link_targets(collect_link_targets)가 주어지면 페이지가 없는 곳으로 가는 링크는 빼고 주소는 파일명에 맞춥니다.
+    breakdown(dict)이 주어지면 CSS·JS·JSON-LD·시간표·내부 링크별 바이트 수를 채웁니다 (size_report.page_breakdown).
+    locale은 만들 언어, alternates는 hreflang 링크(locales.alternate_links)입니다. 같은 노선의 여러 언어를
+    만들 때 shared(dict)를 넘기면 시간표 계산·내부 링크 고르기처럼 언어와 관계없는 작업은 한 번만 합니다.
+    dates가 주어지면 날짜 필드(date_fields)에 그 값을 넣습니다 (렌더링 캐시용 date_placeholders).
+    """
+    shared = {} if shared is None else shared
+    table = render_cache.fragment(
+        cache, "table",
+        (render_version, locales.localize(bus_row_template, locale), locales.localize(headway_row_template, locale),
+         locales.localize(live_bus_row_template, locale), minify_pages, valid_buses),
+        lambda: render_table(valid_buses, minify_pages, locale, shared)
+    )
+
+    def structured_data_fragment():
+        raw = render_structured_data(dep_terminal, arr_terminal_original, arr_terminal_safe, valid_buses,
+                                     locale, shared)
+        return {"raw": raw, "minified": minify.minify_json_ld_script(raw) if minify_pages else raw}
+
+    json_ld = render_cache.fragment(
+        cache, "structured_data",
+        (render_version, dep_terminal, arr_terminal_original, arr_terminal_safe, minify_pages, valid_buses,
+         locales.labels[locale]),
+        structured_data_fragment
+    )
+    structured_data = json_ld["raw"]
+
+    # ✅ 내부링크 생성 (원본 도착지명 사용)
+    if "related_routes" not in shared:
+        shared["related_routes"] = pick_related_routes(route_map, dep_terminal, arr_terminal_original,
+                                                       link_targets=link_targets)
+    related_routes = shared["related_routes"]
+    sanitize_links = link_targets is not None
+    related_links = render_cache.fragment(
+        cache, "related_links",
+        (render_version, locales.localize(related_links_open_template, locale),
+         locales.localize(related_link_template, locale), dep_terminal, related_routes, minify_pages, sanitize_links),
+        lambda: render_internal_links(dep_terminal, related_routes, minify_pages, sanitize_links, locale)
+    )
+    return_section = render_return_section(dep_terminal, arr_terminal_original, minify_pages, link_targets, locale)
+    via_info = render_via_info(arr_terminal_original, via_stops, minify_pages, locale=locale)
+    page_template = locales.localize(html_template, locale)
+
+    # ✅ HTML 내용 생성 (원본 도착지명을 화면 표시용으로 사용)
+    values = dict(
+        dep_terminal=dep_terminal,
+        arr_terminal=arr_terminal_original,  # 화면에는 원본 이름 표시
+        dep_name=locales.place_name(dep_terminal, locale),
+        arr_name=locales.place_name(arr_terminal_original, locale),
+        bus_count=table["bus_count"],
+        first_bus=table["first_bus"],
+        last_bus=table["last_bus"],
+        avg_duration=table["avg_duration"],
+        bus_rows=table["bus_rows"],
+        **(dates or page_dates(published_date, locale)),
+        structured_data=structured_data,
+        related_links=related_links,
+        return_section=return_section,
+        via_info=via_info,
+        live_script=render_live_script(dep_terminal, arr_terminal_original, locale) if table["live_enabled"] else "",
+        asset_links=assets.asset_links(),
+        alternate_links=alternates,
+        # 📲 출발지 즐겨찾기 캐시는 기본 언어 페이지만 등록
+        sw_registration=service_worker.registration_script(
+            dep_terminal if locale == locales.default_locale else None)
+    )
+    if not minify_pages:
+        page = page_template.format(**values)
+        if breakdown is not None:
+            breakdown.update(page_parts(page_template, values, page))
+        return page
+
+    # 🗜️ 템플릿·시간표 행·내부 링크는 미리 압축한 템플릿으로 만들었으므로 JSON-LD만 압축
+    template = minify.minify_template(page_template)
+    minified_values = dict(values, structured_data=json_ld["minified"])
+    if size_stats is not None:
+        # 압축 전 크기는 템플릿 구조로 계산 (압축 전 HTML을 따로 만들지 않음)
+        raw_sizes = {
+            'bus_rows': table["raw_size"],
+            'related_links': len(related_links.encode("utf-8")) + (
+                minify.literal_savings(locales.localize(related_links_open_template, locale))
+                + len(related_routes) * minify.literal_savings(locales.localize(related_link_template, locale))
+                if related_routes else 0
+            ),
+            'via_info': len(via_info.encode("utf-8")) + (minify.literal_savings(via_info_template) if via_info else 0),
+            'return_section': len(return_section.encode("utf-8")) + (
+                minify.literal_savings(locales.localize(return_section_template, locale)) if return_section else 0),
+        }
+        minify.record_savings(size_stats, "routes", minify.formatted_size(page_template, values, raw_sizes),
+                              minify.formatted_size(template, minified_values))
+    page = template.format(**minified_values)
+    if breakdown is not None:
+        breakdown.update(page_parts(template, minified_values, page))
+    return page
+
+def page_dates(published_date, locale=locales.default_locale):
+    """노선 페이지의 날짜 필드 값 (date_fields)"""
+    return {
+        "today_date": today_date,
+        "year": year,
+        "update_date": update_date if locale == locales.default_locale else locales.format_date(datetime.today(), locale),
+        "published_date": published_date,
+        "last_modified_date": today_date,
+    }
+
+def fill_dates(page, dates):
+    """자리표시자로 렌더링한 페이지에 날짜 필드 값 채우기"""
+    for name, value in dates.items():
+        page = page.replace(date_placeholders[name], str(value))
+    return page
+
+def date_adjusted_meta(meta, delta):
+    """자리표시자를 날짜로 채워 늘거나 준 바이트(delta)만큼 크기 기록(size_stats·breakdown) 고치기
+
+    날짜 필드는 모두 템플릿 본문에 있으므로 breakdown에서는 "other"에 들어갑니다.
+    """
+    if not delta:
+        return meta
+    meta = dict(meta)
+    if meta.get("size_stats"):
+        meta["size_stats"] = dict(meta["size_stats"], raw=meta["size_stats"]["raw"] + delta,
+                                  minified=meta["size_stats"]["minified"] + delta)
+    if meta.get("breakdown"):
+        meta["breakdown"] = dict(meta["breakdown"], other=meta["breakdown"]["other"] + delta,
+                                 page=meta["breakdown"]["page"] + delta)
+    return meta
+
+def page_parts(template, values, page):
+    """노선 페이지의 항목별 바이트 수 - 템플릿 블록과 이미 만든 조각 크기로 계산"""
+    return size_report.page_breakdown(template, values, len(page.encode("utf-8")), {
+        "table": ("bus_rows",),
+        "related_links": ("related_links", "return_section"),
+        "json_ld": ("structured_data",),
+        "js": ("live_script", "sw_registration"),
+    })
+
+# 🔑 렌더링 결과나 캐시 메타 정보가 바뀌도록 코드를 고치면 올려서 이전 렌더링 캐시를 무효화
+render_version = 3
+
+@lru_cache(maxsize=None)
+def template_version():
+    """페이지를 이루는 템플릿 전체의 해시 (템플릿을 고치면 캐시 키가 바뀜)"""
+    return render_cache.make_key(
+        html_template, bus_row_template, headway_row_template, live_bus_row_template, live_script_template,
+        related_links_open_template, related_link_template, via_info_template, return_section_template,
+        locales.labels, locales.translations
+    )
+
+def page_cache_key(dep_terminal, arr_terminal_original, arr_terminal_safe, valid_buses, route_map,
+                   minify_pages, via_stops, link_targets=None, locale=locales.default_locale, alternates="",
+                   shared=None):
+    """노선 페이지 렌더링 캐시 키 (시간표·내부 링크·경유지·템플릿·빌드 옵션·언어가 같으면 같은 페이지)
+
+    날짜 필드는 키에 넣지 않습니다 - 캐시에는 자리표시자로 저장하고 꺼낼 때 채웁니다 (fill_dates).
+    """
+    shared = {} if shared is None else shared
+    if "related_routes" not in shared:
+        shared["related_routes"] = pick_related_routes(route_map, dep_terminal, arr_terminal_original,
+                                                       link_targets=link_targets)
+    return render_cache.make_key(
+        render_version, template_version(), dep_terminal, arr_terminal_original, arr_terminal_safe, valid_buses,
+        shared["related_routes"], via_stops,
+        minify_pages, assets.asset_links(), service_worker.registration_script(dep_terminal),
+        None if link_targets is None else route_slug(arr_terminal_original, dep_terminal) in link_targets,
+        locale, alternates
+    )
+
+def build_terminal_pages(dep_terminal, schedules, route_map, published_dates, manifest_entries=None,
+                         minify_pages=False, size_stats=None, cache=None, link_targets=None, page_sizes=None,
+                         page_locales=(locales.default_locale,)):
+    """출발지 하나의 도착지별 HTML 파일 생성 → (생성된 파일, 건너뛴 도착지, 오류 도착지)
+
+    manifest_entries가 주어지면 생성한 파일의 해시·크기를 함께 기록합니다.
+    cache(render_cache.open_cache)가 주어지면 입력이 같은 페이지는 렌더링하지 않고 캐시에서 가져옵니다.
+    link_targets가 주어지면 없는 페이지로 가는 내부 링크를 빼거나 실제 파일명으로 고칩니다.
+    page_sizes가 주어지면 페이지별 항목 바이트 수를 기록합니다 (size_report.py 리포트용).
+    page_locales의 언어마다 페이지를 만들되, 시간표 계산·내부 링크 고르기는 노선마다 한 번만 합니다.
+    """
     skipped_destinations = []  # 현재 파일에서 건너뛴 도착지 목록
+    failed_destinations = []  # 현재 파일에서 오류가 난 도착지 목록
     created_files = []  # 현재 파일에서 생성된 HTML 파일 목록
-    last_modified_date = today_date  # 📌 기본값 설정
 
     print(f"\n📋 {dep_terminal}: 처리할 도착지 개수: {len(schedules)}")
 
+    # 🚌 여러 도착지를 지나는 같은 버스를 묶어 도착지별 경유지를 한 번에 계산
+    via_index = trips.stop_index(trips.build_trip_patterns(dep_terminal, schedules))
+
     for arr_terminal, schedule_list in schedules.items():
         arr_terminal_original = str(arr_terminal)  # 원본 도착지명 보존
         arr_terminal_safe = sanitize_filename(arr_terminal_original)  # 파일명용 안전한 이름
@@ -997,135 +1561,62 @@ for json_file_path in json_files:
 
             # ✅ HTML 파일명 생성 (안전한 이름 사용)
             html_filename = f"{dep_terminal}-에서-{arr_terminal_safe}-가는-시외버스-시간표.html"
-            html_file_path = os.path.join(output_folder, html_filename)
-
-            # ✅ 현재 파일의 발행일 가져오기
-            published_date = published_dates.get(html_filename, today_date)
 
-            # ✅ 발행일이 등록되지 않았다면 JSON 파일에 저장
+            # ✅ 발행일이 등록되지 않았다면 JSON 파일에 저장 (언어별 페이지는 기본 언어 페이지의 발행일 사용)
             if html_filename not in published_dates:
                 published_dates[html_filename] = today_date
 
-            # ✅ 마지막 수정일
-            last_modified_date = today_date
-
-            # ✅ 버스 시간표 데이터 처리 (valid_buses 사용)
-            bus_rows = ""
-            times, durations, companies = [], [], []
-
-            for bus in valid_buses:  # 유효한 버스 데이터만 사용
-                # 새로운 JSON 구조에 맞게 시간 정보 추출
-                dep_time_raw = bus.get('TIM_TIM', bus.get('출발시각', '0000'))
-                if isinstance(dep_time_raw, str):
-                    if ':' in dep_time_raw:  # "07:45" 형태
-                        dep_time = dep_time_raw
-                    elif len(dep_time_raw) >= 4:  # "0745" 형태
-                        dep_time = f"{dep_time_raw[:2]}:{dep_time_raw[2:4]}"
-                    else:
-                        dep_time = dep_time_raw
+            via_stops = via_index.get(arr_terminal_original)
+            alternates = locales.alternate_links(html_filename[:-len(".html")], page_locales,
+                                                 "" if minify_pages else "\n    ")
+            shared = {}  # 언어와 관계없는 계산 결과 (시간표 요약, 내부 링크 대상)
+            for locale in page_locales:
+                page_file = locales.page_path(html_filename, locale)
+                html_file_path = os.path.join(output_folder, page_file)
+                cache_key = page_cache_key(
+                    dep_terminal, arr_terminal_original, arr_terminal_safe, valid_buses, route_map,
+                    minify_pages, via_stops, link_targets, locale, alternates, shared
+                ) if cache is not None else None
+                with profiler.stage("write"):
+                    entry = render_cache.load(cache, cache_key) if cache is not None else None
+                cached = entry is not None
+
+                if cached:
+                    html_content, meta = entry
                 else:
-                    dep_time = str(dep_time_raw)
-                
-                # 소요시간 정보 추출
-                duration_min = bus.get('LIN_TIM', 0)
-                if duration_min > 0:
-                    duration = f"{duration_min//60}시간 {duration_min%60}분"
-                else:
-                    duration = "정보 없음"
-                
-                # 운행회사 정보 추출
-                company = bus.get("COR_NAM", bus.get("차편정보", "정보 없음"))
-                if company and company != "정보 없음":
-                    # "경남여객(일반)1:10 소요" → "경남여객" 추출
-                    company = company.split('(')[0].strip()
-
-                times.append(dep_time)
-                durations.append(duration_min)
-                companies.append(company)
-
-                bus_rows += f"""
-                    <tr>
-                        <td><strong>{dep_time}</strong></td>
-                        <td>{duration}</td>
-                        <td>{company}</td>
-                        <td><a href='https://www.bustago.or.kr/newweb/kr/booking/info_schedule.jsp' target='_self' class='btn-book'><i class="fas fa-ticket-alt"></i> 예매</a></td>
-                    </tr>
-                """
-
-            # ✅ 기본 정보 계산 (이 시점에서 times는 비어있지 않음을 보장)
-            first_bus = min(times) if times else "정보 없음"
-            last_bus = max(times) if times else "정보 없음"
-            avg_duration = f"{(sum(durations)//len(durations))//60}시간 {(sum(durations)//len(durations))%60}분" if durations else "정보 없음"
-            bus_count = len(times)
-
-            # ✅ 구조화 데이터 생성
-            structured_data = ""
-            if times and durations and first_bus != "정보 없음":
-                try:
-                    first_bus_hour, first_bus_minute = map(int, first_bus.split(":"))
-                    avg_minute_duration = sum(durations)//len(durations) if durations else 0
-                    arrival_total_min = first_bus_hour * 60 + first_bus_minute + avg_minute_duration
-                    arrival_hour_str = str(arrival_total_min // 60).zfill(2)
-                    arrival_minute_str = str(arrival_total_min % 60).zfill(2)
-                    first_bus_hour_str = str(first_bus_hour).zfill(2)
-                    first_bus_minute_str = str(first_bus_minute).zfill(2)
-
-                    unique_companies = list(set([c for c in companies if c != "정보 없음"]))
-                    if len(unique_companies) == 1:
-                        provider_json = f'  "provider": {{"@type": "Organization", "name": "{unique_companies[0]}"}},'
-                    elif len(unique_companies) > 1:
-                        provider_json = '  "provider": [' + ",".join([f'{{"@type": "Organization", "name": "{c}"}}' for c in unique_companies]) + '],'
-                    else:
-                        provider_json = ''
-
-                    structured_data = f"""
-                <script type="application/ld+json">
-                {{
-                    "@context": "https://schema.org",
-                    "@type": "BusTrip",
-                    "name": "{dep_terminal}에서 {arr_terminal_original} 가는 시외버스 시간표",
-                    "description": "{dep_terminal}에서 {arr_terminal_original} 가는 시외버스 시간표, 요금, 소요시간 정보",
-                    {provider_json}
-                    "departureBusStop": {{"@type": "BusStation", "name": "{dep_terminal} 터미널"}},
-                    "arrivalBusStop": {{"@type": "BusStation", "name": "{arr_terminal_original} 터미널"}},
-                    "departureTime": "{first_bus_hour_str}:{first_bus_minute_str}",
-                    "arrivalTime": "{arrival_hour_str}:{arrival_minute_str}",
-                    "busNumber": "{bus_count}",
-                    "url": "https://bus.medilocator.co.kr/{dep_terminal}-에서-{arr_terminal_safe}-가는-시외버스-시간표"
-                }}
-                </script>
-                """
-                except (ValueError, AttributeError):
-                    structured_data = ""
-
-            # ✅ 내부링크 생성 (원본 도착지명 사용)
-            related_links = generate_internal_links(route_map, dep_terminal, arr_terminal_original)
-
-            # ✅ HTML 내용 생성 (원본 도착지명을 화면 표시용으로 사용)
-            html_content = html_template.format(
-                dep_terminal=dep_terminal,
-                arr_terminal=arr_terminal_original,  # 화면에는 원본 이름 표시
-                today_date=today_date,
-                year=year,
-                bus_count=bus_count,
-                first_bus=first_bus,
-                last_bus=last_bus,
-                avg_duration=avg_duration,
-                bus_rows=bus_rows,
-                update_date=update_date,
-                published_date=published_dates.get(html_filename, today_date),
-                last_modified_date=today_date,
-                structured_data=structured_data,
-                related_links=related_links
-            )
-
-            # ✅ HTML 파일 저장
-            with open(html_file_path, "w", encoding="utf-8") as html_file:
-                html_file.write(html_content)
-
-            created_files.append(html_filename)
-            all_created_files.append(html_filename)
-            print(f"   ✅ 생성 완료: {html_filename}")
+                    page_stats, breakdown = {}, {}
+                    with profiler.stage("render"):
+                        # 캐시에 넣을 페이지는 날짜를 자리표시자로 렌더링 (다른 날 빌드에서도 재사용)
+                        html_content = render_route_page(
+                            dep_terminal, arr_terminal_original, arr_terminal_safe, valid_buses,
+                            route_map, published_dates[html_filename], minify_pages, page_stats, via_stops, cache,
+                            link_targets, breakdown, locale, alternates, shared,
+                            date_placeholders if cache is not None else None
+                        )
+                    meta = dict(size_stats=page_stats.get("routes"), breakdown=breakdown)
+                    if cache is not None:
+                        with profiler.stage("write"):
+                            render_cache.store(cache, cache_key, html_content, meta)
+
+                if cache is not None:
+                    # 📅 자리표시자를 그날 날짜로 채우고, 크기 기록은 늘거나 준 바이트만큼 고침
+                    placeholder_size = len(html_content.encode("utf-8"))
+                    html_content = fill_dates(html_content, page_dates(published_dates[html_filename], locale))
+                    meta = date_adjusted_meta(meta, len(html_content.encode("utf-8")) - placeholder_size)
+
+                # ✅ HTML 파일 저장 (이전 빌드에서 캐시와 하드링크된 파일을 덮어쓰지 않도록 새 파일로 교체)
+                with profiler.stage("write"):
+                    manifest.atomic_write(html_file_path, html_content)
+                    meta = dict(meta, **manifest.file_entry(html_content, "routes"))
+
+                if size_stats is not None and meta.get("size_stats"):
+                    minify.record_savings(size_stats, "routes", meta["size_stats"]["raw"], meta["size_stats"]["minified"])
+                if page_sizes is not None:
+                    page_sizes[page_file] = dict(meta["breakdown"], terminal=dep_terminal)
+                created_files.append(page_file)
+                if manifest_entries is not None:
+                    manifest_entries[page_file] = {key: meta[key] for key in ("sha256", "size", "stage")}
+                print(f"   ✅ 생성 완료: {page_file}{' (캐시)' if cached else ''}")
 
         except Exception as e:
             # ✅ 개별 노선 처리 중 오류 발생 시 해당 노선만 건너뛰고 계속 진행
@@ -1133,18 +1624,14 @@ for json_file_path in json_files:
             print(f"🚫 {arr_terminal_original}: 처리 중 오류 발생 - {str(e)}")
             print(f"   ➡️  해당 노선을 건너뛰고 다음 노선을 처리합니다.")
             skipped_destinations.append(error_msg)
-            all_skipped_destinations.extend([error_msg])
+            failed_destinations.append(error_msg)
             continue
 
     # ✅ 현재 파일 처리 결과
-    total_destinations = len(schedules)
-    generated_files = len(created_files)
-    skipped_count = len(skipped_destinations)
-
     print(f"\n📊 {dep_terminal} 처리 결과:")
-    print(f"   📁 전체 도착지: {total_destinations}개")
-    print(f"   ✅ 생성된 파일: {generated_files}개")
-    print(f"   ⚠️  건너뛴 도착지: {skipped_count}개")
+    print(f"   📁 전체 도착지: {len(schedules)}개")
+    print(f"   ✅ 생성된 파일: {len(created_files)}개")
+    print(f"   ⚠️  건너뛴 도착지: {len(skipped_destinations)}개")
 
     if created_files:
         print(f"\n📋 생성된 파일 목록:")
@@ -1156,52 +1643,497 @@ for json_file_path in json_files:
         for i, destination in enumerate(skipped_destinations, 1):
             print(f"  {i:2d}. {destination}")
 
-# ✅ JSON 파일 업데이트 후 저장
-with open(published_dates_file, "w", encoding="utf-8") as f:
-    json.dump(published_dates, f, ensure_ascii=False, indent=4)
-
-# ✅ 최종 전체 결과
-total_json_files = len(json_files)
-total_generated_files = len(all_created_files)
-total_skipped = len(all_skipped_destinations)
-
-print(f"\n🎉 모든 JSON 파일 처리 완료!")
-print(f"📅 발행일: {today_date} | 마지막 수정일: {last_modified_date}")
-print(f"📊 전체 처리 결과:")
-print(f"   📄 처리된 JSON 파일: {total_json_files}개")
-print(f"   ✅ 생성된 HTML 파일: {total_generated_files}개")
-print(f"   ⚠️  건너뛴 도착지: {total_skipped}개")
-
-if all_created_files:
-    print(f"\n📋 전체 생성된 파일 목록 (처음 20개):")
-    for i, file in enumerate(all_created_files[:20], 1):
-        print(f"  {i:2d}. {file}")
-    if len(all_created_files) > 20:
-        print(f"  ... 외 {len(all_created_files) - 20}개 파일")
-
-if all_skipped_destinations:
-    print(f"\n⚠️  전체 건너뛴 도착지 목록 (처음 10개):")
-    for i, destination in enumerate(all_skipped_destinations[:10], 1):
-        print(f"  {i:2d}. {destination}")
-    if len(all_skipped_destinations) > 10:
-        print(f"  ... 외 {len(all_skipped_destinations) - 10}개 도착지")
-
-if not all_created_files:
-    print("\n🚫 생성된 HTML 파일이 없습니다. JSON 데이터를 확인하세요.")
-
-print(f"\n✨ 새로운 특징:")
-print("  🎨 현대적인 그라데이션 디자인")
-print("  📱 완전 반응형 레이아웃") 
-print("  🎯 향상된 SEO 최적화")
-print("  ⚡ 부드러운 애니메이션 효과")
-print("  🔍 구조화된 데이터 포함")
-print("  📋 meta property와 name 혼용 적용")
-print("  🚌 새로운 제목 형식: '출발지에서-도착지-가는-시외버스-시간표'")
-print("  🛡️ 강화된 오류 처리 및 다양한 JSON 구조 지원")
-print("  🚫 시간표 데이터가 없는 도착지 자동 건너뛰기")
-print("  🔧 특수문자 포함 도착지명 안전 처리")
-print("  🔄 개별 노선 오류 시 자동 복구 (다음 노선 계속 처리)")
-
-print("  📁 data 폴더의 모든 JSON 파일 자동 처리")
+    return created_files, skipped_destinations, failed_destinations
+
+def load_model(options=None):
+    """빌드에 필요한 데이터를 모두 읽어 메모리 모델로 반환"""
+    # 🔍 data 폴더의 모든 JSON 파일 찾기
+    json_files = glob.glob(os.path.join(data_folder, "*_schedules.json"))
+    if (options or {}).get('shard'):
+        # 🧩 이 샤드가 담당하는 출발지만 빌드
+        json_files = [path for path in json_files
+                      if shard.in_shard(terminal_name_from_path(path), options['shard'])]
+
+    print(f"✅ 발견된 JSON 파일: {len(json_files)}개")
+    for file in json_files:
+        print(f"  📄 {file}")
+
+    model = {
+        'options': options or {},  # 빌드 옵션 (minify, shard 등)
+        'json_files': json_files,
+        'published_dates': load_published_dates(),
+        'route_map': load_route_map(),
+        'sources': {},    # 출발지 → JSON 파일 경로
+        'raw': {},        # 출발지 → JSON 원본 (허브 페이지용)
+        'terminals': {},  # 출발지 → {도착지: [버스 데이터]}
+        'pages': {},      # 출발지 → 생성된 HTML 파일 목록
+        'cache': None,    # 렌더링 캐시 (render_cache.open_cache, 사용하지 않으면 None)
+        'checkpoint': None,  # 진행 상황 기록 (checkpoint.new_checkpoint, 사용하지 않으면 None)
+        'link_targets': None,  # 링크를 고칠 때 만들어질 노선 페이지 주소 집합 (collect_link_targets)
+    }
+
+    for json_file_path in json_files:
+        print(f"\n📄 처리 중: {json_file_path}")
+        load_terminal(model, json_file_path)
+
+    return model
+
+def load_terminal(model, json_file_path):
+    """JSON 파일 하나를 읽어 모델에 반영 (성공하면 출발지 이름, 실패하면 None)"""
+    dep_terminal = terminal_name_from_path(json_file_path)
+
+    with profiler.stage("load"):
+        bus_data = read_bus_data(json_file_path)
+    if bus_data is None:
+        return None
+
+    with profiler.stage("normalize"):
+        schedules = normalize_schedules(bus_data)
+    if schedules is None:
+        return None
+
+    model['sources'][dep_terminal] = json_file_path
+    model['raw'][dep_terminal] = bus_data
+    model['terminals'][dep_terminal] = schedules
+    return dep_terminal
+
+def build_key(model):
+    """모든 페이지에 영향을 주는 값(날짜·템플릿·빌드 옵션·자산)의 해시 - 체크포인트 재사용 조건"""
+    return render_cache.make_key(
+        render_version, template_version(), today_date, model['options'].get('minify', False),
+        model['options'].get('shard'), model['options'].get('fix_links', False), assets.asset_links(),
+        model['options'].get('locales', (locales.default_locale,))
+    )
+
+def terminal_key(model, dep_terminal):
+    """출발지 하나의 페이지에 영향을 주는 입력(시간표, 노선 목록, 링크 대상 페이지)의 해시"""
+    link_targets = model.get('link_targets')
+    return render_cache.make_key(model['terminals'][dep_terminal], model['route_map'].get(dep_terminal),
+                                 sorted(link_targets) if link_targets is not None else None)
+
+def build_site(model):
+    """메모리 모델의 모든 출발지에 대해 노선 페이지 생성
+
+    model['checkpoint']가 있으면 출발지마다 결과를 기록해 두고, 이어서 빌드할 때
+    입력과 출력 파일 해시가 그대로인 출발지는 다시 만들지 않습니다.
+    """
+    all_created_files = []
+    all_skipped_destinations = []
+    manifest_entries = {}
+    size_stats = {}
+    page_sizes = {}  # 파일명 → 항목별 바이트 수 (size_report.py)
+    progress = model.get('checkpoint')
+    resumed = 0
+
+    # 🚀 모든 JSON 파일 처리 시작
+    print(f"\n🚀 HTML 파일 생성 시작...")
+
+    try:
+        # 출발지 이름 순서로 처리 (샤드 병합 결과와 발행일 기록 순서가 같도록)
+        terminals = sorted(model['terminals'].items())
+        for index, (dep_terminal, schedules) in enumerate(terminals, 1):
+            key = terminal_key(model, dep_terminal) if progress is not None else None
+            done = checkpoint.finished_terminal(progress, dep_terminal, key)
+            if done:
+                # ⏭️ 이전 실행에서 끝낸 출발지는 기록된 결과만 반영
+                created_files, failed_destinations = done['files'], done['failed']
+                manifest_entries.update(done['entries'])
+                for filename, published_date in done['published_dates'].items():
+                    model['published_dates'].setdefault(filename, published_date)
+                minify.merge_savings(size_stats, done['size_stats'])
+                page_sizes.update(done['page_sizes'])
+                resumed += 1
+                print(f"\n⏭️  {dep_terminal}: 이전 빌드에서 완료 ({len(created_files)}개 파일, 해시 확인됨)")
+            else:
+                terminal_entries, terminal_stats, terminal_sizes = {}, {}, {}
+                created_files, _, failed_destinations = build_terminal_pages(
+                    dep_terminal, schedules, model['route_map'], model['published_dates'], terminal_entries,
+                    model['options'].get('minify', False), terminal_stats, model.get('cache'),
+                    model.get('link_targets'), terminal_sizes,
+                    model['options'].get('locales', (locales.default_locale,))
+                )
+                manifest_entries.update(terminal_entries)
+                minify.merge_savings(size_stats, terminal_stats)
+                page_sizes.update(terminal_sizes)
+                checkpoint.record_terminal(
+                    progress, dep_terminal, key, created_files, terminal_entries,
+                    {filename: model['published_dates'][filename] for filename in created_files
+                     if filename in model['published_dates']},
+                    failed_destinations, terminal_stats, terminal_sizes
+                )
+            model['pages'][dep_terminal] = created_files
+            all_created_files.extend(created_files)
+            all_skipped_destinations.extend(failed_destinations)
+            profiler.snapshot(f"render:{dep_terminal}",
+                              detailed=index % profiler.memory_detail_every == 0 or index == len(terminals))
+    except BaseException:
+        # 💾 중단되면 여기까지의 진행 상황을 남겨 --resume으로 이어서 빌드
+        if progress is not None:
+            checkpoint.save_checkpoint(progress)
+            print(f"\n💾 진행 상황 저장: {progress['path']} (python app.py --resume으로 이어서 빌드)")
+        raise
+
+    # ✅ JSON 파일 업데이트 후 저장 (샤드 빌드는 결과 조각만 남기고 병합 단계에서 저장)
+    if model['options'].get('shard'):
+        shard.save_fragment(
+            "routes", model['options']['shard'], manifest_entries,
+            terminals=sorted(model['pages'].items()),
+            published_dates={filename: model['published_dates'][filename] for filename in all_created_files
+                             if filename in model['published_dates']},
+            failed=all_skipped_destinations, size_stats=size_stats,
+            cache_stats=model['cache'] and {key: model['cache'][key] for key in ("hits", "misses", "stored")},
+        )
+    else:
+        save_published_dates(model['published_dates'])
+        manifest.record_stage("routes", manifest_entries)
+    size_report.save_records("routes", model['options'].get('shard'), page_sizes)
+    checkpoint.clear_checkpoint(progress)
+
+    # ✅ 최종 전체 결과
+    total_json_files = len(model['json_files'])
+    total_generated_files = len(all_created_files)
+    total_skipped = len(all_skipped_destinations)
+
+    print(f"\n🎉 모든 JSON 파일 처리 완료!")
+    print(f"📅 발행일: {today_date} | 마지막 수정일: {today_date}")
+    print(f"📊 전체 처리 결과:")
+    print(f"   📄 처리된 JSON 파일: {total_json_files}개")
+    print(f"   ✅ 생성된 HTML 파일: {total_generated_files}개")
+    print(f"   ⚠️  건너뛴 도착지: {total_skipped}개")
+    if resumed:
+        print(f"   ⏭️  이전 빌드에서 이어받은 출발지: {resumed}개")
+
+    if all_created_files:
+        print(f"\n📋 전체 생성된 파일 목록 (처음 20개):")
+        for i, file in enumerate(all_created_files[:20], 1):
+            print(f"  {i:2d}. {file}")
+        if len(all_created_files) > 20:
+            print(f"  ... 외 {len(all_created_files) - 20}개 파일")
+
+    if all_skipped_destinations:
+        print(f"\n⚠️  전체 건너뛴 도착지 목록 (처음 10개):")
+        for i, destination in enumerate(all_skipped_destinations[:10], 1):
+            print(f"  {i:2d}. {destination}")
+        if len(all_skipped_destinations) > 10:
+            print(f"  ... 외 {len(all_skipped_destinations) - 10}개 도착지")
+
+    if not all_created_files:
+        print("\n🚫 생성된 HTML 파일이 없습니다. JSON 데이터를 확인하세요.")
+
+    if size_stats:
+        minify.print_savings(size_stats)
+
+    if model.get('cache'):
+        render_cache.prune(model['cache'])
+        render_cache.print_stats(model['cache'])
+
+    return all_created_files
+
+def scan_sources():
+    """감시 대상 파일(data/*_schedules.json, 노선 파일)의 수정 시각 스냅샷"""
+    mtimes = {}
+    for path in glob.glob(os.path.join(data_folder, "*_schedules.json")) + [route_file_path]:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return mtimes
+
+def hub_departures(dep_terminal, bus_data):
+    """JSON 원본이 허브 페이지에 기여하는 출발지 이름들"""
+    if isinstance(bus_data, list):
+        # 리스트 형태는 항목마다 출발지가 따로 있을 수 있음
+        return {dep_terminal} | {item.get('출발지') or dep_terminal for item in bus_data if isinstance(item, dict)}
+    return {dep_terminal}
+
+def hub_routes(model):
+    """메모리 모델의 JSON 원본 → 허브용 노선 목록 (링크를 고칠 때는 만들어지는 노선만)"""
+    import hub
+
+    routes = []
+    for dep_terminal, bus_data in model['raw'].items():
+        routes.extend(hub.extract_routes(dep_terminal, bus_data, verbose=False))
+    if model.get('link_targets') is not None:
+        routes = hub.fix_route_links(routes, model['link_targets'])
+    return routes
+
+def rebuild_hub_pages(model, terminals):
+    """지정한 터미널의 허브 페이지와 노선이 바뀐 도착지·운행회사 허브만 메모리 모델로 다시 생성
+
+    도착지·운행회사 허브는 model['hub_indexes'](직전 색인)와 새 색인을 비교해 노선 목록이 달라진 키만
+    다시 쓰고, 없어진 키의 페이지는 지웁니다. 허브 파일이 생기거나 없어졌으면 True를 반환합니다.
+    """
+    import hub
+
+    routes = hub_routes(model)
+    grouped_routes = hub.group_routes_by_departure(routes)
+
+    page_locales = model['options'].get('locales', (locales.default_locale,))
+    manifest_entries = {}
+    removed = []
+    created = False
+    for terminal_name in terminals:
+        destinations = grouped_routes.get(terminal_name)
+        deleted = False
+        for locale in page_locales:
+            hub_filename = locales.page_path(f"{terminal_name}-터미널-시외버스-시간표.html", locale)
+            hub_file = os.path.join(output_folder, hub_filename)
+            if destinations:
+                created = created or not os.path.exists(hub_file)
+                hub.write_terminal_page(terminal_name, destinations, manifest_entries,
+                                        model['options'].get('minify', False), locale=locale,
+                                        page_locales=page_locales)
+            elif os.path.exists(hub_file):
+                os.remove(hub_file)
+                removed.append(hub_filename)
+                deleted = True
+        if destinations:
+            print(f"   🏢 허브 갱신: {terminal_name}")
+        elif deleted:
+            print(f"   🗑️  허브 삭제: {terminal_name}")
+
+    # 🔎 도착지 허브·운행회사 페이지 (기본 언어만)
+    indexes = route_index.build_indexes(routes)
+    old_indexes = model.get('hub_indexes') or {"arrivals": {}, "operators": {}}
+    index_pages = {"arrivals": hub.arrival_hub, "operators": hub.operator_hub}
+    for kind, build_page in index_pages.items():
+        updated = 0
+        for key in sorted(set(old_indexes[kind]) | set(indexes[kind])):
+            if old_indexes[kind].get(key) == indexes[kind].get(key):
+                continue
+            if key in indexes[kind]:
+                page, cards = build_page(key, indexes[kind][key])
+                created = created or key not in old_indexes[kind]
+                hub.write_hub_page(key, page, cards, manifest_entries, model['options'].get('minify', False))
+                updated += 1
+            else:
+                page, _ = build_page(key, old_indexes[kind][key])
+                hub_file = os.path.join(output_folder, f"{page['slug']}.html")
+                if os.path.exists(hub_file):
+                    os.remove(hub_file)
+                    removed.append(f"{page['slug']}.html")
+                    print(f"   🗑️  {size_report.stage_labels[kind]} 삭제: {key}")
+        if updated:
+            print(f"   🔎 {size_report.stage_labels[kind]} 갱신: {updated}개")
+    model['hub_indexes'] = indexes
+
+    manifest.record_stage("hubs", manifest_entries, removed=removed, replace=False)
+    return created or bool(removed)
+
+def remove_pages(filenames):
+    """더 이상 생성되지 않는 노선 페이지 삭제"""
+    for filename in filenames:
+        html_file_path = os.path.join(output_folder, filename)
+        if os.path.exists(html_file_path):
+            os.remove(html_file_path)
+            print(f"   🗑️  삭제: {filename}")
+
+def apply_changes(model, changed, removed):
+    """변경된 원본 파일만 다시 읽어 영향받는 노선·허브·사이트맵 갱신"""
+    import sitemap
+
+    dirty = set()         # 노선 페이지를 다시 만들 출발지
+    hub_terminals = set()  # 허브 페이지를 다시 만들 터미널
+    link_changes = {}     # 출발지 → 링크 고치기 전 도착지 집합 (--fix-links일 때만)
+
+    for path in sorted(changed | removed):
+        if path == route_file_path:
+            continue
+        dep_terminal = terminal_name_from_path(path)
+        hub_terminals |= hub_departures(dep_terminal, model['raw'].get(dep_terminal))
+        if model.get('link_targets') is not None and dep_terminal not in link_changes:
+            link_changes[dep_terminal] = linked_arrivals(model['terminals'].get(dep_terminal, {}))
+
+        if path in removed:
+            print(f"🗑️  데이터 삭제 감지: {path}")
+            remove_pages(model['pages'].get(dep_terminal, []))
+            for key in ('sources', 'raw', 'terminals'):
+                model[key].pop(dep_terminal, None)
+            continue
+
+        print(f"🔄 데이터 변경 감지: {path}")
+        if load_terminal(model, path) is None:
+            # 저장 도중의 파일일 수 있으므로 이전 결과를 유지
+            print(f"⚠️  {path}: 읽기 실패로 이전 페이지를 유지합니다.")
+            continue
+        hub_terminals |= hub_departures(dep_terminal, model['raw'][dep_terminal])
+        dirty.add(dep_terminal)
+
+    if route_file_path in changed or route_file_path in removed:
+        print(f"🔄 노선 파일 변경 감지: {route_file_path}")
+        old_route_map = model['route_map']
+        model['route_map'] = load_route_map()
+        for dep_terminal in set(old_route_map) | set(model['route_map']):
+            if old_route_map.get(dep_terminal) != model['route_map'].get(dep_terminal):
+                if dep_terminal in model['terminals']:
+                    dirty.add(dep_terminal)
+
+    for dep_terminal, old_arrivals in link_changes.items():
+        # 🔗 바뀐 출발지의 노선 페이지 주소를 다시 계산하고, 그 노선으로 돌아오는 링크가 있는 출발지도 다시 빌드
+        new_arrivals = linked_arrivals(model['terminals'].get(dep_terminal, {}))
+        if new_arrivals == old_arrivals:
+            continue
+        model['link_targets'] -= {route_slug(dep_terminal, arr_terminal) for arr_terminal in old_arrivals}
+        model['link_targets'] |= {route_slug(dep_terminal, arr_terminal) for arr_terminal in new_arrivals}
+        dirty |= {arr_terminal for arr_terminal in old_arrivals ^ new_arrivals if arr_terminal in model['terminals']}
+
+    pages_before = {dep: set(files) for dep, files in model['pages'].items()}
+    page_set_changed = bool(removed)
+    manifest_entries = {}
+    removed_pages = [filename for dep_terminal, files in pages_before.items()
+                     if dep_terminal not in model['terminals'] for filename in files]
+
+    for dep_terminal in sorted(dirty):
+        created_files, _, _ = build_terminal_pages(
+            dep_terminal, model['terminals'][dep_terminal], model['route_map'], model['published_dates'],
+            manifest_entries, model['options'].get('minify', False), cache=model.get('cache'),
+            link_targets=model.get('link_targets'),
+            page_locales=model['options'].get('locales', (locales.default_locale,))
+        )
+        stale = pages_before.get(dep_terminal, set()) - set(created_files)
+        remove_pages(sorted(stale))
+        removed_pages.extend(stale)
+        if stale or set(created_files) != pages_before.get(dep_terminal, set()):
+            page_set_changed = True
+        model['pages'][dep_terminal] = created_files
+
+    for dep_terminal in list(model['pages']):
+        if dep_terminal not in model['terminals']:
+            del model['pages'][dep_terminal]
+
+    if dirty:
+        save_published_dates(model['published_dates'])
+    if dirty or removed_pages:
+        manifest.record_stage("routes", manifest_entries, removed=removed_pages, replace=False)
+
+    if hub_terminals:
+        page_set_changed = rebuild_hub_pages(model, sorted(hub_terminals)) or page_set_changed
+
+    if page_set_changed:
+        sitemap.generate_sitemap()
+
+def watch(model, interval=0.5):
+    """원본 데이터를 주기적으로 확인하며 바뀐 부분만 다시 빌드"""
+    mtimes = scan_sources()
+    model['hub_indexes'] = route_index.build_indexes(hub_routes(model))  # 바뀐 도착지·운행회사 허브를 찾을 기준
+    print(f"\n👀 변경 감시 시작: {data_folder}/, {route_file_path} ({interval}초 간격, 종료: Ctrl+C)")
 
+    try:
+        while True:
+            time.sleep(interval)
+            current = scan_sources()
+            if current == mtimes:
+                continue
 
+            started = time.perf_counter()
+            changed = {path for path, mtime in current.items() if mtimes.get(path) != mtime}
+            removed = set(mtimes) - set(current)
+            mtimes = current
+
+            apply_changes(model, changed, removed)
+            print(f"⚡ 변경 반영 완료 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+    except KeyboardInterrupt:
+        print("\n👋 변경 감시를 종료합니다.")
+
+def main():
+    parser = argparse.ArgumentParser(description="시외버스 노선별 시간표 HTML 생성")
+    parser.add_argument("--watch", action="store_true", help="데이터 변경을 감시하며 바뀐 페이지만 다시 생성")
+    parser.add_argument("--interval", type=float, default=0.5, help="감시 주기(초), 기본값 0.5")
+    parser.add_argument("--minify", action="store_true", help="공백·주석 제거 및 JSON-LD 압축으로 HTML 크기 줄이기")
+    parser.add_argument("--gtfs", action="append", default=[], metavar="ZIP",
+                        help="GTFS 정적 피드(zip)의 시간표를 data 파일에 합쳐서 빌드 (여러 번 지정 가능, 파일은 쓰지 않음)")
+    parser.add_argument("--render-cache", metavar="DIR",
+                        help=f"입력이 같은 페이지는 렌더링 캐시에서 가져오기 (예: {render_cache.default_cache_folder})")
+    parser.add_argument("--cache-max-mb", type=float, default=render_cache.default_max_mb,
+                        help=f"렌더링 캐시 용량 한도 MB, 넘으면 오래 안 쓴 것부터 삭제 (기본값: {render_cache.default_max_mb})")
+    parser.add_argument("--fix-links", action="store_true",
+                        help="만들어지지 않는 페이지로 가는 내부 링크(다른 노선·돌아오는 버스)는 빼고 주소는 파일명에 맞추기")
+    parser.add_argument("--resume", action="store_true",
+                        help="중단된 빌드의 체크포인트에서 이어서 빌드 (출력 해시가 같은 출발지는 건너뜀)")
+    parser.add_argument("--checkpoint-interval", type=float, default=checkpoint.default_interval,
+                        help=f"진행 상황 저장 간격(초), 기본값 {checkpoint.default_interval}")
+    parser.add_argument("--shard", type=shard.parse_shard, metavar="i/N",
+                        help="출발지를 N개로 나눠 i번째만 빌드 (결과는 python shard.py merge로 병합)")
+    parser.add_argument("--profile", nargs="?", const=profiler.default_folder, metavar="DIR",
+                        help=f"단계별(load·normalize·render·write) cProfile 결과 저장 (기본 폴더: {profiler.default_folder})")
+    parser.add_argument("--memprofile", nargs="?", const=profiler.default_folder, metavar="DIR",
+                        help=f"tracemalloc으로 단계별 메모리와 출발지마다 스냅샷 기록 (기본 폴더: {profiler.default_folder})")
+    parser.add_argument("--locales", type=locales.parse_locales, default=(locales.default_locale,), metavar="ko,en",
+                        help=f"만들 언어 (쉼표로 구분, 기본 언어 {locales.default_locale}는 항상 포함, "
+                             f"가능: {', '.join(locales.locales)})")
+    args = parser.parse_args()
+    if args.shard and args.watch:
+        parser.error("--shard와 --watch는 함께 쓸 수 없습니다")
+    if args.profile:
+        profiler.start(args.profile, profiler.process_label("app", args.shard))
+    if args.memprofile:
+        profiler.start_memory(args.memprofile, profiler.process_label("app", args.shard))
+    try:
+        build(args)
+    finally:
+        profiler.save()
+        profiler.save_memory()
+
+def build(args):
+    """명령행 옵션대로 전체 빌드 (--watch면 이어서 변경 감시)"""
+
+    # 📂 출력 폴더 생성
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    for locale in args.locales:
+        # 🌐 기본 언어가 아닌 페이지는 언어 폴더에 (outputs/en/)
+        os.makedirs(os.path.join(output_folder, locales.locales[locale]["path"]), exist_ok=True)
+
+    if not glob.glob(os.path.join(data_folder, "*_schedules.json")) and not args.gtfs:
+        print(f"🚫 {data_folder} 폴더에 '*_schedules.json' 파일을 찾을 수 없습니다.")
+        exit(1)
+
+    model = load_model({'minify': args.minify, 'shard': args.shard, 'fix_links': args.fix_links,
+                        'locales': args.locales})
+    model['cache'] = render_cache.open_cache(args.render_cache, args.cache_max_mb) if args.render_cache else None
+    for gtfs_path in args.gtfs:
+        with profiler.stage("load"):
+            imported, counts = gtfs_import.import_gtfs(gtfs_path)
+        imported = {origin: destinations for origin, destinations in imported.items()
+                    if shard.in_shard(origin, args.shard)}
+        gtfs_import.merge_into_model(model, imported)
+        print(f"🚏 GTFS 시간표 합침: {gtfs_path} (출발 {counts['departures']:,}건, 출발 터미널 {len(imported)}개)")
+    profiler.snapshot("load")  # 데이터 파일을 모두 읽고 변환한 뒤
+
+    if args.fix_links:
+        # 🔗 다른 출발지(다른 샤드)의 페이지로 가는 링크도 확인하도록 전체 데이터 기준으로 계산
+        model['link_targets'] = collect_link_targets()
+        for dep_terminal, schedules in model['terminals'].items():  # GTFS로 합친 노선 포함
+            model['link_targets'] |= terminal_link_targets(dep_terminal, schedules)
+
+    # 💾 진행 상황 기록 (--resume이면 이전 체크포인트에서 이어서)
+    progress_path = checkpoint.checkpoint_path(args.shard)
+    if args.resume:
+        model['checkpoint'], finished = checkpoint.load_checkpoint(
+            progress_path, build_key(model), args.checkpoint_interval)
+        if finished:
+            print(f"⏭️  체크포인트에서 이어서 빌드: 완료된 출발지 {finished}개 ({progress_path})")
+    else:
+        model['checkpoint'] = checkpoint.new_checkpoint(progress_path, build_key(model), args.checkpoint_interval)
+    build_site(model)
+
+    print(f"\n✨ 새로운 특징:")
+    print("  🎨 현대적인 그라데이션 디자인")
+    print("  📱 완전 반응형 레이아웃") 
+    print("  🎯 향상된 SEO 최적화")
+    print("  ⚡ 부드러운 애니메이션 효과")
+    print("  🔍 구조화된 데이터 포함")
+    print("  📋 meta property와 name 혼용 적용")
+    print("  🚌 새로운 제목 형식: '출발지에서-도착지-가는-시외버스-시간표'")
+    print("  🛡️ 강화된 오류 처리 및 다양한 JSON 구조 지원")
+    print("  🚫 시간표 데이터가 없는 도착지 자동 건너뛰기")
+    print("  🔧 특수문자 포함 도착지명 안전 처리")
+    print("  🔄 개별 노선 오류 시 자동 복구 (다음 노선 계속 처리)")
+
+    print("  📁 data 폴더의 모든 JSON 파일 자동 처리")
+
+    if args.watch:
+        watch(model, args.interval)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+import io
+import os
+import re
+import json
+import glob
+import argparse
+from functools import lru_cache
+from urllib.parse import quote
+
+import manifest
+
+# 📂 공용 자산 경로 (outputs/assets/ 에 지문(해시)이 붙은 파일로 생성)
+output_folder = "outputs"
+assets_folder = os.path.join(output_folder, "assets")
+asset_manifest_file = os.path.join(output_folder, "assets.json")
+font_folder = "fonts"
+
+# 🔍 아이콘 클래스를 찾을 템플릿 소스
+icon_sources = ["app.py", "hub.py", "network_stats.py"]
+icon_class_pattern = re.compile(r"\bfa-[a-z0-9-]+")
+
+# 🔤 폰트 서브셋에 넣을 글자를 모을 소스 (템플릿 + 언어별 번역 문구)
+font_text_sources = icon_sources + ["locales.py"]
+
+# 🎨 자체 제작 아이콘 (24x24, 선 아이콘) - 템플릿에서 실제로 쓰는 것만 CSS로 내보냄
+icon_paths = {
+    "fa-arrow-left": '<path d="M19 12H5M11 6l-6 6 6 6"/>',
+    "fa-building": '<rect x="5" y="3" width="14" height="18" rx="1"/><path d="M9 7h2M13 7h2M9 11h2M13 11h2M9 15h2M13 15h2M11 21v-3h2v3"/>',
+    "fa-bus": '<rect x="4" y="3" width="16" height="15" rx="2"/><path d="M4 11h16M8 18v3M16 18v3M8 14.5h.01M16 14.5h.01"/>',
+    "fa-calendar-day": '<rect x="3" y="5" width="18" height="16" rx="2"/><path d="M3 10h18M8 3v4M16 3v4"/><rect x="7" y="13" width="4" height="4"/>',
+    "fa-chart-bar": '<path d="M4 20h16M7 16v-5M12 16V6M17 16V9"/>',
+    "fa-chevron-down": '<path d="M5 9l7 7 7-7"/>',
+    "fa-chevron-right": '<path d="M9 5l7 7-7 7"/>',
+    "fa-clock": '<circle cx="12" cy="12" r="9"/><path d="M12 7v5l3 3"/>',
+    "fa-credit-card": '<rect x="2" y="5" width="20" height="14" rx="2"/><path d="M2 10h20M6 15h4"/>',
+    "fa-globe": '<circle cx="12" cy="12" r="9"/><path d="M3 12h18M12 3a14 14 0 0 1 0 18M12 3a14 14 0 0 0 0 18"/>',
+    "fa-home": '<path d="M3 11l9-8 9 8"/><path d="M5 10v10h5v-6h4v6h5V10"/>',
+    "fa-hourglass-half": '<path d="M6 3h12M6 21h12M7 3c0 5 5 6 5 9s-5 4-5 9M17 3c0 5-5 6-5 9s5 4 5 9M9 18h6"/>',
+    "fa-info-circle": '<circle cx="12" cy="12" r="9"/><path d="M12 11v6M12 7.5v.5"/>',
+    "fa-list": '<path d="M9 6h12M9 12h12M9 18h12M4 6h.01M4 12h.01M4 18h.01"/>',
+    "fa-map": '<path d="M9 4L3 6v14l6-2 6 2 6-2V4l-6 2-6-2zM9 4v14M15 6v14"/>',
+    "fa-map-marker-alt": '<path d="M12 22s7-6.2 7-12a7 7 0 0 0-14 0c0 5.8 7 12 7 12z"/><circle cx="12" cy="10" r="2.5"/>',
+    "fa-moon": '<path d="M20 14.5A8 8 0 1 1 9.5 4a6.5 6.5 0 0 0 10.5 10.5z"/>',
+    "fa-question-circle": '<circle cx="12" cy="12" r="9"/><path d="M9.5 9.5a2.5 2.5 0 1 1 3.5 2.3c-.7.3-1 .9-1 1.7M12 17v.5"/>',
+    "fa-route": '<circle cx="6" cy="19" r="2"/><circle cx="18" cy="5" r="2"/><path d="M8 19h8.5a3.5 3.5 0 0 0 0-7h-9a3.5 3.5 0 0 1 0-7H16"/>',
+    "fa-search": '<circle cx="11" cy="11" r="7"/><path d="M21 21l-5-5"/>',
+    "fa-table": '<rect x="3" y="4" width="18" height="16" rx="2"/><path d="M3 10h18M3 15h18M9 10v10M15 10v10"/>',
+    "fa-ticket-alt": '<path d="M3 7h18v3a2 2 0 0 0 0 4v3H3v-3a2 2 0 0 0 0-4zM14 7v2M14 11v2M14 15v2"/>',
+    "fa-train": '<rect x="5" y="3" width="14" height="14" rx="3"/><path d="M5 11h14M8 21l2-4M16 21l-2-4M9 14h.01M15 14h.01"/>',
+    "fa-undo-alt": '<path d="M4 4v6h6"/><path d="M4.5 15a8 8 0 1 0 1.9-8.3L4 10"/>',
+}
+
+# 📌 아이콘 공통 스타일: 글자색(currentColor)과 글자 크기(1em)를 그대로 따름
+icon_base_css = (
+    ".fas,.far,.fab{display:inline-block;width:1em;height:1em;vertical-align:-.125em;"
+    "background-color:currentColor;-webkit-mask:var(--fa) center/contain no-repeat;"
+    "mask:var(--fa) center/contain no-repeat}"
+)
+
+# 🔤 Pretendard 원본 파일명 → 굵기 (가변 폰트는 400~700 범위로 사용)
+font_weights = {
+    "Regular": "400",
+    "Medium": "500",
+    "SemiBold": "600",
+    "Bold": "700",
+    "Variable": "400 700",
+}
+
+# 📌 자산을 아직 만들지 않았을 때의 기본 링크 (기존 외부 CSS)
+fallback_links = '''<link href="https://fonts.googleapis.com/css2?family=Pretendard:wght@400;500;600;700&display=swap" rel="stylesheet">
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">'''
+
+def collect_icon_classes(sources=icon_sources):
+    """템플릿 소스에서 실제로 사용하는 아이콘 클래스 수집"""
+    used = set()
+    for path in sources:
+        with open(path, encoding="utf-8") as f:
+            used.update(icon_class_pattern.findall(f.read()))
+    return sorted(used)
+
+def icon_data_uri(name):
+    """아이콘 하나를 CSS mask용 data URI로 변환"""
+    svg = (
+        "<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24' fill='none' stroke='#000' "
+        "stroke-width='2' stroke-linecap='round' stroke-linejoin='round'>"
+        + icon_paths[name].replace('"', "'")
+        + "</svg>"
+    )
+    return "data:image/svg+xml," + quote(svg, safe=" /=:',.-")
+
+def build_icon_css(icon_classes):
+    """사용하는 아이콘만 담은 CSS 생성"""
+    rules = [icon_base_css]
+    for name in icon_classes:
+        if name not in icon_paths:
+            print(f"⚠️  아이콘이 정의되지 않았습니다: {name} (assets.py의 icon_paths에 추가해주세요)")
+            continue
+        rules.append(f'.{name}{{--fa:url("{icon_data_uri(name)}")}}')
+    return "\n".join(rules) + "\n"
+
+def collect_font_text(sources=font_text_sources, data_pattern="data/*.json", route_file="route/total_route.json"):
+    """페이지에 나올 수 있는 모든 글자 (템플릿 소스 + 노선 데이터)"""
+    text = set()
+    for path in list(sources) + glob.glob(data_pattern) + [route_file]:
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            text.update(f.read())
+    return "".join(sorted(ch for ch in text if ch.isprintable()))
+
+def find_font_sources():
+    """fonts/ 폴더의 Pretendard 원본 파일 찾기 → [(굵기, 경로)]"""
+    sources = []
+    for path in sorted(glob.glob(os.path.join(font_folder, "Pretendard*"))):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        for suffix, weight in font_weights.items():
+            if stem.endswith(suffix):
+                sources.append((weight, path))
+                break
+    return sources
+
+def subset_font(source_path, text):
+    """fontTools로 필요한 글자만 남긴 웹폰트 생성 → (확장자, 내용)"""
+    from fontTools import subset
+
+    options = subset.Options()
+    try:
+        import brotli  # noqa: F401  (woff2 압축에 필요)
+        options.flavor = "woff2"
+    except ImportError:
+        options.flavor = "woff"
+    font = subset.load_font(source_path, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    subset.save_font(font, buffer, options)
+    return options.flavor, buffer.getvalue()
+
+def fingerprinted(name, content):
+    """파일명에 내용 해시를 붙임 (예: site.css → site-1a2b3c4d.css)"""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}-{manifest.content_hash(content)[:8]}{ext}"
+
+def build_assets():
+    """아이콘 CSS와 서브셋 폰트를 만들고 자산 목록(assets.json)을 저장"""
+    os.makedirs(assets_folder, exist_ok=True)
+    entries = {}
+    files = {}
+    css_parts = []
+    preloads = []
+
+    # 🔤 서브셋 폰트 (원본 폰트와 fontTools가 있을 때만)
+    font_sources = find_font_sources()
+    if not font_sources:
+        print(f"📝 {font_folder}/ 폴더에 Pretendard 원본이 없어 시스템 글꼴을 사용합니다.")
+    else:
+        try:
+            text = collect_font_text()
+            print(f"🔤 서브셋 대상 글자: {len(text)}자")
+            for weight, source_path in font_sources:
+                flavor, content = subset_font(source_path, text)
+                filename = fingerprinted(f"pretendard-{weight.replace(' ', '-')}.{flavor}", content)
+                manifest.atomic_write(os.path.join(assets_folder, filename), content)
+                entries[f"assets/{filename}"] = manifest.file_entry(content, "assets")
+                files[f"font-{weight}"] = f"/assets/{filename}"
+                css_parts.append(
+                    "@font-face{font-family:'Pretendard';font-style:normal;"
+                    f"font-weight:{weight};font-display:swap;"
+                    f"src:url(/assets/{filename}) format('{flavor}')}}"
+                )
+                if weight.startswith("400"):
+                    preloads.append((f"/assets/{filename}", flavor))
+                print(f"   ✅ {os.path.basename(source_path)} → {filename} ({len(content):,} bytes)")
+        except ImportError:
+            print("⚠️  fontTools가 설치되어 있지 않아 폰트 서브셋을 건너뜁니다. (pip install fonttools brotli)")
+            css_parts = []
+            preloads = []
+
+    # 🎨 아이콘 CSS
+    icon_classes = collect_icon_classes()
+    css_parts.append(build_icon_css(icon_classes))
+    css = "\n".join(css_parts)
+    css_filename = fingerprinted("site.css", css)
+    manifest.atomic_write(os.path.join(assets_folder, css_filename), css)
+    entries[f"assets/{css_filename}"] = manifest.file_entry(css, "assets")
+    files["css"] = f"/assets/{css_filename}"
+    print(f"🎨 아이콘 {len(icon_classes)}개 → {css_filename} ({len(css.encode('utf-8')):,} bytes)")
+
+    # 📋 페이지 템플릿이 참조할 자산 목록
+    links = [f'<link rel="preload" href="{url}" as="font" type="font/{flavor}" crossorigin>' for url, flavor in preloads]
+    links.append(f'<link rel="stylesheet" href="{files["css"]}">')
+    asset_manifest = {"files": files, "links": "\n    ".join(links)}
+    manifest.atomic_write(asset_manifest_file, json.dumps(asset_manifest, ensure_ascii=False, indent=2))
+
+    manifest.record_stage("assets", entries)
+    return asset_manifest
+
+@lru_cache(maxsize=None)
+def load_asset_manifest():
+    """assets.json 불러오기 (없으면 None)"""
+    try:
+        with open(asset_manifest_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def asset_links():
+    """<head>에 넣을 폰트·아이콘 링크 (자산이 없으면 기존 외부 CSS 링크)"""
+    asset_manifest = load_asset_manifest()
+    if asset_manifest is None:
+        return fallback_links
+    return asset_manifest["links"]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="아이콘 CSS와 서브셋 폰트를 자체 호스팅 자산으로 생성")
+    parser.parse_args()
+
+    print("🚀 공용 자산 생성 시작...")
+    build_assets()
+    print("🎉 공용 자산 생성 완료!")
@@ -0,0 +1,224 @@
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+import unicodedata
+import subprocess
+
+import manifest
+
+# 📂 고정 기준 데이터 (data/ 일부를 얼려 둔 사본) 와 저장소에 함께 두는 기준 결과
+script_folder = os.path.dirname(os.path.abspath(__file__))
+dataset_folder = os.path.join(script_folder, "benchmark")
+baseline_file = os.path.join(dataset_folder, "baseline.json")
+
+# 🏗️ 측정하는 빌드 단계 (manifest 단계 이름, 실행할 명령)
+stages = [
+    ("routes", ["app.py", "--minify"]),
+    ("hubs", ["hub.py", "--minify"]),
+    ("stats", ["network_stats.py", "--minify"]),
+    ("seo", ["sitemap.py"]),
+]
+
+# 📏 지표 종류별 허용 변화율 (기준보다 이만큼 나빠지면 회귀) - baseline.json의 tolerances로 바꿀 수 있음
+default_tolerances = {"seconds": 0.25, "pages_per_sec": 0.25, "peak_rss_mb": 0.15, "bytes": 0.02}
+min_seconds = 0.1  # 이보다 작은 시간 차이는 측정 잡음으로 보고 회귀로 치지 않음 (1초 안쪽 단계는 실행마다 ±30%씩 흔들림)
+noise_factor = 2  # 반복 실행 사분위 범위(IQR)의 이 배수까지의 시간 차이도 잡음으로 봄
+noisy_kinds = {"seconds", "pages_per_sec"}  # 실행마다 흔들리는 시간 지표 (처리량은 시간에서 계산)
+higher_is_better = {"pages_per_sec"}
+
+def prepare_workdir():
+    """기준 데이터를 임시 폴더에 복사 (빌드는 이 폴더를 작업 폴더로 실행되므로 저장소 outputs를 건드리지 않음)"""
+    workdir = tempfile.mkdtemp(prefix="bus-benchmark-")
+    shutil.copytree(os.path.join(dataset_folder, "data"), os.path.join(workdir, "data"))
+    shutil.copytree(os.path.join(dataset_folder, "route"), os.path.join(workdir, "route"))
+    os.makedirs(os.path.join(workdir, "outputs"))
+    return workdir
+
+def run_stage(command, workdir):
+    """단계 하나를 새 프로세스로 실행 → (걸린 초, 최대 RSS MB)"""
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(script_folder, command[0])] + command[1:],
+                               cwd=workdir, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(process.pid, 0)
+    seconds = time.perf_counter() - started
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)} 실패 (종료 코드 {process.returncode})")
+    return seconds, usage.ru_maxrss / 1024  # Linux의 ru_maxrss는 KB 단위
+
+def run_once():
+    """기준 데이터로 전체 빌드 한 번 → {지표: 값}"""
+    workdir = prepare_workdir()
+    try:
+        measured = {stage: run_stage(command, workdir) for stage, command in stages}
+        files = manifest.load_manifest(os.path.join(workdir, manifest.manifest_file))["files"]
+
+        metrics = {}
+        for stage, (seconds, peak_rss) in measured.items():
+            entries = [entry for entry in files.values() if entry["stage"] == stage]
+            metrics[f"{stage}.seconds"] = seconds
+            if stage not in ("seo", "stats"):  # 페이지 생성 단계만 처리량 측정
+                metrics[f"{stage}.pages_per_sec"] = len(entries) / seconds
+            metrics[f"{stage}.peak_rss_mb"] = peak_rss
+            metrics[f"{stage}.bytes"] = sum(entry["size"] for entry in entries)
+        metrics["total.seconds"] = sum(seconds for seconds, _ in measured.values())
+        metrics["total.bytes"] = sum(entry["size"] for entry in files.values())
+        return metrics
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+def spread(values):
+    """반복 측정값의 사분위 범위 (IQR, 실행이 하나면 0)"""
+    values = list(values)
+    if len(values) < 2:
+        return 0.0
+    q1, _, q3 = statistics.quantiles(values, n=4, method="inclusive")
+    return q3 - q1
+
+def measure(repeat=3, warmup=1):
+    """warmup번 버린 뒤 repeat번 실행 → (지표별 중앙값, 시간 지표별 IQR) (디스크 캐시·잡음 영향 줄이기)"""
+    for i in range(warmup):
+        print(f"🔥 예열 실행 {i + 1}/{warmup}...")
+        run_once()
+    runs = []
+    for i in range(repeat):
+        print(f"⏱️  측정 실행 {i + 1}/{repeat}...")
+        runs.append(run_once())
+    medians = {name: round(statistics.median(run[name] for run in runs), 3) for name in runs[0]}
+    spreads = {name: round(spread(run[name] for run in runs), 3) for name in runs[0]
+               if metric_kind(name) in noisy_kinds}
+    return medians, spreads
+
+def environment():
+    """기준 결과를 만든 환경 (시간·메모리 지표는 다른 머신끼리 비교하면 의미가 적음)"""
+    return {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()}
+
+def metric_kind(name):
+    """'routes.seconds' → 'seconds'"""
+    return name.split(".", 1)[1]
+
+def noise_seconds(name, spreads):
+    """시간 지표의 잡음 허용폭(초) - 반복 실행 IQR에 비례하되 min_seconds 이상"""
+    return max(min_seconds, noise_factor * spreads.get(name, 0.0))
+
+def compare(baseline, current, tolerances, spreads=None):
+    """기준과 현재 지표 비교 → [(지표, 기준값, 현재값, 변화율, 허용률, 상태)]
+
+    상태는 regression(허용 범위보다 나빠짐), improved(허용 범위보다 좋아짐), ok, new(기준 없음).
+    spreads는 시간 지표별 IQR(기준·현재 중 큰 값)로, 같은 단계의 시간 차이가 잡음 허용폭
+    (noise_seconds) 안이면 시간·처리량 모두 ok로 봅니다.
+    """
+    spreads = spreads or {}
+    rows = []
+    for name, value in current.items():
+        kind = metric_kind(name)
+        tolerance = tolerances.get(kind, 0)
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, None, value, None, tolerance, "new"))
+            continue
+        change = (value - base) / base if base else 0.0
+        worse = -change if kind in higher_is_better else change
+        seconds_name = f"{name.split('.', 1)[0]}.seconds"
+        if (kind in noisy_kinds and seconds_name in baseline and seconds_name in current
+                and abs(current[seconds_name] - baseline[seconds_name]) <= noise_seconds(seconds_name, spreads)):
+            status = "ok"
+        elif worse > tolerance:
+            status = "regression"
+        elif worse < -tolerance:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append((name, base, value, change, tolerance, status))
+    return rows
+
+def pad(text, width, right=False):
+    """한글처럼 두 칸을 차지하는 글자를 고려해 폭 맞추기"""
+    extra = sum(1 for char in text if unicodedata.east_asian_width(char) in "WF")
+    return text.rjust(width - extra) if right else text.ljust(width - extra)
+
+def format_value(name, value):
+    """지표 값 표시 (바이트는 정수, 나머지는 소수 셋째 자리까지)"""
+    if value is None:
+        return "-"
+    return f"{value:,.0f}" if metric_kind(name) == "bytes" else f"{value:,.3f}"
+
+def print_table(rows):
+    """비교 결과 표 출력"""
+    icons = {"ok": "✅", "regression": "🚫", "improved": "🎉", "new": "🆕"}
+    print(f"\n{pad('지표', 22)} {pad('기준', 12, True)} {pad('현재', 12, True)} {pad('변화', 9, True)} "
+          f"{pad('허용', 7, True)}  상태")
+    for name, base, value, change, tolerance, status in rows:
+        change_text = f"{change * 100:+.1f}%" if change is not None else "-"
+        print(f"{name:<22} {format_value(name, base):>12} {format_value(name, value):>12} {change_text:>9} "
+              f"{tolerance * 100:>6.0f}%  {icons[status]} {status}")
+
+def load_baseline(path=baseline_file):
+    """기준 결과 불러오기 (없으면 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def save_baseline(metrics, spreads, repeat, tolerances, path=baseline_file):
+    """현재 측정값(중앙값·IQR)을 새 기준으로 저장 (허용률 설정은 유지)"""
+    baseline = {"environment": environment(), "repeat": repeat, "tolerances": tolerances, "metrics": metrics,
+                "spread": spreads}
+    manifest.atomic_write(path, json.dumps(baseline, ensure_ascii=False, indent=2) + "\n")
+
+def parse_tolerance(text):
+    """'seconds=0.3' → ('seconds', 0.3) (argparse type)"""
+    try:
+        kind, value = text.split("=")
+        return kind, float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}': 종류=비율 형식이어야 합니다 (예: seconds=0.3)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="고정 기준 데이터로 빌드해 성능 회귀 검사 (시간·처리량·메모리·출력 크기)")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 실행 횟수, 중앙값 사용 (기본값: 3)")
+    parser.add_argument("--warmup", type=int, default=1, help="버리는 예열 실행 횟수 (기본값: 1)")
+    parser.add_argument("--baseline", default=baseline_file, help=f"기준 결과 JSON (기본값: {os.path.relpath(baseline_file)})")
+    parser.add_argument("--tolerance", type=parse_tolerance, action="append", default=[], metavar="KIND=RATIO",
+                        help="지표 종류별 허용 변화율 덮어쓰기 (예: seconds=0.5, 종류: " + ", ".join(default_tolerances) + ")")
+    parser.add_argument("--update", action="store_true", help="비교하지 않고 현재 측정값을 새 기준으로 저장")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None and not args.update:
+        print(f"🚫 기준 결과가 없습니다: {args.baseline} (python benchmark.py --update로 먼저 만드세요)")
+        exit(1)
+    tolerances = dict(default_tolerances, **(baseline or {}).get("tolerances", {}))
+    tolerances.update(args.tolerance)
+
+    print(f"🚀 성능 측정 시작: {os.path.relpath(dataset_folder)}/data "
+          f"({len(os.listdir(os.path.join(dataset_folder, 'data')))}개 출발지)")
+    current, current_spreads = measure(args.repeat, args.warmup)
+
+    if args.update:
+        save_baseline(current, current_spreads, args.repeat, dict(default_tolerances, **(baseline or {}).get("tolerances", {})),
+                      args.baseline)
+        print_table(compare({}, current, tolerances))
+        print(f"\n💾 새 기준 저장: {args.baseline}")
+        exit(0)
+
+    if baseline["environment"] != environment():
+        print(f"⚠️  기준 결과와 실행 환경이 다릅니다 - 시간·메모리 비교는 참고용입니다")
+        print(f"   기준: {baseline['environment']}")
+        print(f"   현재: {environment()}")
+    baseline_spreads = baseline.get("spread", {})
+    spreads = {name: max(value, baseline_spreads.get(name, 0.0)) for name, value in current_spreads.items()}
+    rows = compare(baseline["metrics"], current, tolerances, spreads)
+    print_table(rows)
+    regressions = [row[0] for row in rows if row[5] == "regression"]
+    if regressions:
+        print(f"\n🚫 성능 회귀 {len(regressions)}개: {', '.join(regressions)}")
+        exit(1)
+    print("\n✅ 성능 회귀 없음")
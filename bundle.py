@@ -0,0 +1,219 @@
+import os
+import json
+import gzip
+import mmap
+import struct
+import shutil
+import argparse
+import tempfile
+
+import manifest
+
+# 📦 번들 파일 구조
+#   [매직 8바이트][인덱스 길이 u32][인덱스 JSON][페이지 본문들...]
+#   인덱스: {"version": 1, "encoding": "identity" | "gzip",
+#            "pages": {슬러그: [오프셋, 길이, sha256, 원본 크기]}}
+#   오프셋은 본문 영역 시작 기준이며, sha256은 압축 전 원본 내용의 해시(매니페스트와 동일)
+bundle_magic = b"BUSBNDL1"
+bundle_version = 1
+header_struct = struct.Struct("<8sI")
+default_bundle_path = os.path.join("outputs", "site.bundle")
+
+# 📌 HTML이 아닌 파일의 확장자 (슬러그에 확장자가 그대로 남음)
+asset_extensions = (".xml", ".txt", ".json", ".js", ".css", ".svg", ".woff2", ".woff", ".zip")
+
+def slug_for(filename):
+    """파일명 → URL 슬러그 (HTML은 확장자 없이 서비스되므로 .html 제거)"""
+    if filename.endswith(".html"):
+        return filename[:-len(".html")]
+    return filename
+
+def filename_for(slug):
+    """URL 슬러그 → 파일명 (slug_for의 역변환, 터미널명에 '.'이 들어갈 수 있어 확장자 목록으로 판단)"""
+    if slug.endswith(asset_extensions):
+        return slug
+    return slug + ".html"
+
+def is_safe_slug(slug):
+    """풀어낼 폴더 밖을 가리키지 않는 슬러그인지 (절대 경로·'..' 거부 - 색인은 읽는 파일에서 오므로 믿지 않음)"""
+    parts = slug.replace("\\", "/").split("/")
+    return bool(slug) and not os.path.isabs(slug) and not os.path.splitdrive(slug)[0] and ".." not in parts
+
+def write_bundle(bundle_path, pages, compress=False):
+    """(슬러그, 내용) 목록으로 번들 파일을 만듭니다. 슬러그 순으로 정렬해 항상 같은 결과를 냅니다."""
+    index = {}
+    folder = os.path.dirname(bundle_path) or "."
+    os.makedirs(folder, exist_ok=True)
+
+    # 본문은 임시 파일에 먼저 모은 뒤 인덱스 뒤에 이어 붙임 (메모리 사용량 일정)
+    with tempfile.TemporaryFile(dir=folder) as body:
+        offset = 0
+        for slug, content in sorted(pages, key=lambda page: page[0]):
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            blob = gzip.compress(content, compresslevel=9, mtime=0) if compress else content
+            body.write(blob)
+            index[slug] = [offset, len(blob), manifest.content_hash(content), len(content)]
+            offset += len(blob)
+
+        index_bytes = json.dumps({
+            "version": bundle_version,
+            "encoding": "gzip" if compress else "identity",
+            "pages": index,
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-", suffix=".bundle")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header_struct.pack(bundle_magic, len(index_bytes)))
+                f.write(index_bytes)
+                body.seek(0)
+                shutil.copyfileobj(body, f)
+            os.chmod(tmp_path, manifest.file_mode)
+            os.replace(tmp_path, bundle_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    return index
+
+def build_bundle(output_folder="outputs", bundle_path=default_bundle_path, compress=False):
+    """빌드 매니페스트에 있는 모든 파일을 번들 하나로 묶습니다."""
+    build_manifest = manifest.load_manifest(os.path.join(output_folder, os.path.basename(manifest.manifest_file)))
+    if not build_manifest["files"]:
+        print(f"🚫 빌드 매니페스트가 비어 있습니다. app.py, hub.py, sitemap.py를 먼저 실행해주세요.")
+        return None
+
+    def read_pages():
+        for filename in build_manifest["files"]:
+            path = os.path.join(output_folder, filename)
+            if not os.path.exists(path):
+                print(f"⚠️  파일이 없어 번들에서 제외합니다: {filename}")
+                continue
+            with open(path, "rb") as f:
+                yield slug_for(filename), f.read()
+
+    index = write_bundle(bundle_path, read_pages(), compress)
+    raw_size = sum(entry[3] for entry in index.values())
+    bundle_size = os.path.getsize(bundle_path)
+    print(f"📦 번들 생성 완료: {bundle_path}")
+    print(f"   📄 페이지: {len(index)}개 | 원본 {raw_size:,} bytes → 번들 {bundle_size:,} bytes"
+          f" ({'gzip' if compress else '무압축'})")
+    return index
+
+class BundleReader:
+    """mmap으로 번들을 열어 슬러그 하나를 해시 조회 한 번으로 읽는 리더"""
+
+    def __init__(self, bundle_path):
+        self._file = open(bundle_path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"빈 번들 파일입니다: {bundle_path}")
+
+        magic, index_length = header_struct.unpack_from(self._map, 0)
+        if magic != bundle_magic:
+            self.close()
+            raise ValueError(f"번들 파일 형식이 아닙니다: {bundle_path}")
+
+        index_start = header_struct.size
+        index = json.loads(self._map[index_start:index_start + index_length].decode("utf-8"))
+        if index.get("version") != bundle_version:
+            self.close()
+            raise ValueError(f"지원하지 않는 번들 버전입니다: {index.get('version')}")
+
+        self.encoding = index["encoding"]
+        self.pages = index["pages"]
+        self._body_start = index_start + index_length
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __contains__(self, slug):
+        return slug in self.pages
+
+    def __len__(self):
+        return len(self.pages)
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def get_raw(self, slug):
+        """저장된 그대로의 본문 (gzip 번들이면 Content-Encoding: gzip으로 바로 응답 가능)"""
+        offset, length = self.pages[slug][:2]
+        start = self._body_start + offset
+        return self._map[start:start + length]
+
+    def get(self, slug):
+        """압축을 푼 원본 내용"""
+        blob = self.get_raw(slug)
+        return gzip.decompress(blob) if self.encoding == "gzip" else blob
+
+    def sha256(self, slug):
+        """원본 내용의 sha256 (ETag 등으로 사용)"""
+        return self.pages[slug][2]
+
+def extract_bundle(bundle_path, target_folder, verify=True):
+    """번들의 모든 페이지를 파일로 풀어냅니다. verify=True면 해시를 검증합니다."""
+    os.makedirs(target_folder, exist_ok=True)
+    broken = []
+    unsafe = []
+    with BundleReader(bundle_path) as reader:
+        for slug in reader.pages:
+            if not is_safe_slug(slug):
+                unsafe.append(slug)
+                continue
+            content = reader.get(slug)
+            if verify and manifest.content_hash(content) != reader.sha256(slug):
+                broken.append(slug)
+                continue
+            # assets/·en/ 처럼 하위 폴더에 있는 페이지도 있으므로 폴더를 먼저 만듦
+            dest = os.path.join(target_folder, filename_for(slug))
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            manifest.atomic_write(dest, content)
+        count = len(reader)
+
+    print(f"📂 번들 풀기 완료: {bundle_path} → {target_folder}/ ({count - len(broken) - len(unsafe)}개)")
+    for slug in broken:
+        print(f"   🚫 해시 불일치로 건너뜀: {slug}")
+    for slug in unsafe:
+        print(f"   🚫 폴더 밖을 가리키는 경로라 건너뜀: {slug}")
+    return not broken and not unsafe
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사이트 전체를 단일 번들 파일로 묶기/풀기")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="outputs 폴더로 번들 생성")
+    build_parser.add_argument("--source", default="outputs", help="빌드 결과 폴더 (기본값: outputs)")
+    build_parser.add_argument("--output", default=default_bundle_path, help=f"번들 경로 (기본값: {default_bundle_path})")
+    build_parser.add_argument("--compress", action="store_true", help="페이지를 gzip으로 압축해 저장")
+
+    extract_parser = subparsers.add_parser("extract", help="번들을 파일로 풀기")
+    extract_parser.add_argument("bundle", help="번들 경로")
+    extract_parser.add_argument("target", help="풀어낼 폴더")
+
+    list_parser = subparsers.add_parser("list", help="번들에 들어있는 페이지 목록")
+    list_parser.add_argument("bundle", help="번들 경로")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if build_bundle(args.source, args.output, args.compress) is None:
+            exit(1)
+    elif args.command == "extract":
+        if not extract_bundle(args.bundle, args.target):
+            exit(1)
+    elif args.command == "list":
+        with BundleReader(args.bundle) as reader:
+            print(f"📦 {args.bundle}: {len(reader)}개 페이지 ({reader.encoding})")
+            for slug, (offset, length, sha256, size) in reader.pages.items():
+                print(f"   {slug}  offset={offset} length={length} size={size} sha256={sha256[:12]}")
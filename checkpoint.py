@@ -0,0 +1,103 @@
+import os
+import glob
+import json
+import time
+
+import manifest
+
+# 📂 빌드 진행 상황 파일 (빌드가 끝까지 성공하면 삭제)
+output_folder = "outputs"
+default_interval = 10  # 초, 이 간격마다 진행 상황 저장
+
+def checkpoint_path(shard=None, folder=output_folder):
+    """체크포인트 파일 경로 (샤드 빌드는 샤드마다 따로)"""
+    suffix = f"-{shard[0]}-of-{shard[1]}" if shard else ""
+    return os.path.join(folder, f".build-checkpoint{suffix}.json")
+
+def new_checkpoint(path, build_key, interval=default_interval):
+    """빈 체크포인트 dict 생성
+
+    build_key는 날짜·템플릿·빌드 옵션처럼 모든 페이지에 영향을 주는 값의 해시이며,
+    이어서 빌드할 때 이 값이 다르면 체크포인트를 쓰지 않습니다.
+    """
+    return {"path": path, "interval": interval, "saved_at": time.monotonic(),
+            "data": {"build_key": build_key, "terminals": {}}}
+
+def load_checkpoint(path, build_key, interval=default_interval):
+    """이어서 빌드할 체크포인트 불러오기 → (체크포인트, 완료된 출발지 수)
+
+    파일이 없거나 손상되었거나 빌드 조건이 달라졌으면 빈 체크포인트를 돌려줍니다.
+    """
+    checkpoint = new_checkpoint(path, build_key, interval)
+    removed = remove_stale_temp_files(os.path.dirname(path) or ".")
+    if removed:
+        print(f"🧹 중단된 빌드의 임시 파일 {removed}개 삭제")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        print(f"ℹ️  체크포인트가 없어 처음부터 빌드합니다: {path}")
+        return checkpoint, 0
+    except json.JSONDecodeError:
+        print(f"⚠️  체크포인트가 손상되어 처음부터 빌드합니다: {path}")
+        return checkpoint, 0
+    if data.get("build_key") != build_key:
+        print(f"⚠️  날짜·템플릿·빌드 옵션이 달라져 체크포인트를 쓰지 않습니다: {path}")
+        return checkpoint, 0
+    checkpoint["data"] = data
+    return checkpoint, len(data["terminals"])
+
+def remove_stale_temp_files(folder=output_folder):
+    """중단된 빌드가 남긴 임시 파일(manifest.atomic_write의 .tmp-*) 삭제 → 삭제 수"""
+    stale = glob.glob(os.path.join(folder, ".tmp-*"))
+    for path in stale:
+        os.remove(path)
+    return len(stale)
+
+def outputs_match(entries, folder=output_folder):
+    """기록된 출력 파일이 모두 있고 해시가 같은지 확인"""
+    for filename, entry in entries.items():
+        try:
+            with open(os.path.join(folder, filename), "rb") as f:
+                if manifest.content_hash(f.read()) != entry["sha256"]:
+                    return False
+        except FileNotFoundError:
+            return False
+    return True
+
+def finished_terminal(checkpoint, terminal, terminal_key):
+    """이미 끝난 출발지면 기록된 결과 반환 (입력이 바뀌었거나 출력이 달라졌으면 None)"""
+    if checkpoint is None:
+        return None
+    done = checkpoint["data"]["terminals"].get(terminal)
+    if not done or done["key"] != terminal_key or not outputs_match(done["entries"]):
+        return None
+    return done
+
+def record_terminal(checkpoint, terminal, terminal_key, files, entries, published_dates, failed, size_stats,
+                    page_sizes=None):
+    """출발지 하나의 결과를 기록하고, 저장 간격이 지났으면 파일로 저장"""
+    if checkpoint is None:
+        return
+    checkpoint["data"]["terminals"][terminal] = {
+        "key": terminal_key,
+        "files": files,
+        "entries": entries,
+        "published_dates": published_dates,
+        "failed": failed,
+        "size_stats": size_stats,
+        "page_sizes": page_sizes or {},
+    }
+    if time.monotonic() - checkpoint["saved_at"] >= checkpoint["interval"]:
+        save_checkpoint(checkpoint)
+
+def save_checkpoint(checkpoint):
+    """체크포인트를 파일로 저장 (임시 파일에 쓴 뒤 교체하므로 저장 중 중단되어도 이전 내용 유지)"""
+    os.makedirs(os.path.dirname(checkpoint["path"]) or ".", exist_ok=True)
+    manifest.atomic_write(checkpoint["path"], json.dumps(checkpoint["data"], ensure_ascii=False, separators=(",", ":")))
+    checkpoint["saved_at"] = time.monotonic()
+
+def clear_checkpoint(checkpoint):
+    """빌드가 끝까지 성공하면 체크포인트 삭제"""
+    if checkpoint is not None and os.path.exists(checkpoint["path"]):
+        os.remove(checkpoint["path"])
@@ -0,0 +1,393 @@
+import os
+import json
+import time
+import random
+import argparse
+import threading
+import http.client
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, quote, unquote
+
+import manifest
+import terminal_names
+
+# 📂 경로 설정
+data_folder = "data"
+route_file_path = "route/total_route.json"
+state_file_name = ".fetch_state.json"  # 터미널별 ETag/Last-Modified 기록 (glob *.json에 걸리지 않도록 숨김 파일)
+
+# 🌐 수집 설정
+url_env_name = "BUS_SCHEDULE_URL"  # 예: https://api.example.com/schedules/{terminal}
+default_workers = 8      # 동시 요청 수 (전체)
+default_rate = 5.0       # 호스트당 초당 요청 수
+request_timeout = 10     # 초
+max_attempts = 4         # 첫 요청 포함 최대 시도 횟수
+backoff_base = 0.5       # 재시도 대기 기본값 (초) - 0.5, 1, 2 ... + 무작위 지연
+retry_statuses = (429, 500, 502, 503, 504)
+user_agent = "bus-timetable-fetcher/1.0"
+
+# 🧪 스텁 서버 기본값
+stub_host = "127.0.0.1"
+stub_port = 8765
+stub_path = "/schedules/"
+
+class RateLimiter:
+    """호스트 하나의 요청 간격을 일정하게 유지 (초당 rate회)"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_time)
+            self.next_time = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+class ConnectionPool:
+    """호스트별 keep-alive 연결을 재사용하는 풀 (요청 전 호스트별 속도 제한 적용)"""
+
+    def __init__(self, rate=default_rate, timeout=request_timeout):
+        self.rate = rate
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.idle = {}      # (scheme, netloc) → [연결]
+        self.limiters = {}  # (scheme, netloc) → RateLimiter
+        self.opened = 0
+
+    def _limiter(self, key):
+        with self.lock:
+            if key not in self.limiters:
+                self.limiters[key] = RateLimiter(self.rate)
+            return self.limiters[key]
+
+    def _acquire(self, key):
+        with self.lock:
+            connections = self.idle.get(key)
+            if connections:
+                return connections.pop()
+            self.opened += 1
+        scheme, netloc = key
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(netloc, timeout=self.timeout)
+
+    def _release(self, key, connection):
+        with self.lock:
+            self.idle.setdefault(key, []).append(connection)
+
+    def request(self, url, headers):
+        """GET 요청 하나 → (상태 코드, 응답 헤더(소문자 키), 본문 bytes)"""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path + ("?" + parts.query if parts.query else "")
+
+        self._limiter(key).wait()
+        connection = self._acquire(key)
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+        return response.status, {name.lower(): value for name, value in response.getheaders()}, body
+
+    def close(self):
+        with self.lock:
+            for connections in self.idle.values():
+                for connection in connections:
+                    connection.close()
+            self.idle.clear()
+
+def backoff_delay(attempt, retry_after=None):
+    """재시도 대기 시간 (Retry-After가 있으면 우선, 없으면 지수 증가 + 무작위 지연)"""
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return backoff_base * (2 ** attempt) + random.uniform(0, backoff_base)
+
+def data_file_path(output_folder, terminal):
+    """터미널 → 데이터 파일 경로 (app.py가 읽는 이름 규칙)"""
+    return os.path.join(output_folder, f"{terminal}_schedules.json")
+
+def serialize_schedules(data, newline="\n"):
+    """저장소의 기존 데이터 파일과 같은 형식(들여쓰기 2칸, 한글 그대로)으로 직렬화"""
+    return json.dumps(data, ensure_ascii=False, indent=2).replace("\n", newline)
+
+def read_existing(path):
+    """기존 데이터 파일 → (파싱된 내용, 줄바꿈 문자) (없거나 손상되었으면 (None, '\\n'))"""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return json.loads(raw.decode("utf-8")), ("\r\n" if b"\r\n" in raw else "\n")
+    except (FileNotFoundError, UnicodeDecodeError, ValueError):
+        return None, "\n"
+
+def fetch_terminal(pool, url, terminal, validators, output_folder=data_folder):
+    """터미널 하나 수집 → 결과 dict (status: updated / unchanged / missing / failed)"""
+    headers = {"Accept": "application/json", "User-Agent": user_agent, "Connection": "keep-alive"}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    error = None
+    attempts = 0
+    for attempt in range(max_attempts):
+        attempts = attempt + 1
+        retry_after = None
+        try:
+            status, response_headers, body = pool.request(url, headers)
+        except (OSError, http.client.HTTPException) as e:
+            error = f"{type(e).__name__}: {e}"
+        else:
+            if status not in retry_statuses:
+                break
+            error = f"HTTP {status}"
+            retry_after = response_headers.get("retry-after")
+        if attempt + 1 < max_attempts:
+            time.sleep(backoff_delay(attempt, retry_after))
+    else:
+        return {"terminal": terminal, "status": "failed", "error": error, "attempts": attempts}
+
+    result = {"terminal": terminal, "attempts": attempts, "validators": {
+        "etag": response_headers.get("etag", validators.get("etag")),
+        "last_modified": response_headers.get("last-modified", validators.get("last_modified")),
+    }}
+
+    if status == 304:
+        result["status"] = "unchanged"
+        return result
+    if status == 404:
+        result["status"] = "missing"
+        return result
+    if status != 200:
+        return {"terminal": terminal, "status": "failed", "error": f"HTTP {status}", "attempts": attempts}
+
+    # 📋 JSON 형식 검증 후 저장 (내용이 같으면 파일을 건드리지 않음)
+    try:
+        data = json.loads(body.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError) as e:
+        return {"terminal": terminal, "status": "failed", "error": f"JSON 파싱 실패: {e}", "attempts": attempts}
+    if not isinstance(data, (dict, list)):
+        return {"terminal": terminal, "status": "failed", "error": "JSON 최상위가 객체/배열이 아닙니다", "attempts": attempts}
+
+    path = data_file_path(output_folder, terminal)
+    existing, newline = read_existing(path)
+    if existing == data:
+        result["status"] = "unchanged"
+        return result
+
+    # 기존 파일의 줄바꿈 형식을 유지해 변경된 부분만 diff에 나오도록 함
+    manifest.atomic_write(path, serialize_schedules(data, newline))
+    result["status"] = "updated"
+    return result
+
+def load_fetch_state(output_folder=data_folder):
+    """터미널별 조건부 요청 기록 불러오기"""
+    try:
+        with open(os.path.join(output_folder, state_file_name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_fetch_state(state, output_folder=data_folder):
+    """터미널별 조건부 요청 기록 저장"""
+    manifest.atomic_write(os.path.join(output_folder, state_file_name),
+                          json.dumps(dict(sorted(state.items())), ensure_ascii=False, indent=2))
+
+def load_terminal_names(route_file=route_file_path):
+    """노선 파일의 출발 터미널 목록"""
+    with open(route_file, "r", encoding="utf-8") as f:
+        return list(json.load(f))
+
+def fetch_all(url_template, terminals, output_folder=data_folder, workers=default_workers,
+              rate=default_rate, force=False):
+    """여러 터미널을 동시에 수집 → {status: [터미널]}"""
+    os.makedirs(output_folder, exist_ok=True)
+    saved_state = load_fetch_state(output_folder)
+    state = dict(saved_state)
+    pool = ConnectionPool(rate)
+    results = {"updated": [], "unchanged": [], "missing": [], "failed": []}
+    started = time.time()
+
+    print(f"🌐 {len(terminals)}개 터미널 수집 시작 (동시 {workers}개, 호스트당 초당 {rate}회)")
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(fetch_terminal, pool, url_template.format(terminal=quote(terminal)),
+                                terminal, {} if force else state.get(terminal, {}), output_folder): terminal
+                for terminal in terminals
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                terminal = result["terminal"]
+                results[result["status"]].append(terminal)
+                # 상태 기록은 메인 스레드에서만, ETag·Last-Modified가 바뀐 터미널만 갱신
+                # (변경 없는 날에도 fetched_at이 바뀌면 매일 빌드에서 상태 파일이 커밋됨)
+                if "validators" in result:
+                    validators = {k: v for k, v in result["validators"].items() if v}
+                    previous = {k: v for k, v in state.get(terminal, {}).items() if k != "fetched_at"}
+                    if validators != previous:
+                        validators["fetched_at"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+                        state[terminal] = validators
+                if result["status"] == "updated":
+                    print(f"   ✅ {terminal}: 갱신 ({result['attempts']}회 시도)")
+                elif result["status"] == "failed":
+                    print(f"   🚫 {terminal}: 실패 - {result['error']} ({result['attempts']}회 시도)")
+    finally:
+        pool.close()
+        if state != saved_state:
+            save_fetch_state(state, output_folder)
+
+    elapsed = time.time() - started
+    print(f"🎉 수집 완료 ({elapsed:.1f}초, 연결 {pool.opened}개 사용)")
+    print(f"   ✅ 갱신: {len(results['updated'])}개")
+    print(f"   ⏸️  변경 없음: {len(results['unchanged'])}개")
+    print(f"   ❔ 데이터 없음: {len(results['missing'])}개")
+    print(f"   🚫 실패: {len(results['failed'])}개")
+    return results
+
+class StubHandler(BaseHTTPRequestHandler):
+    """기록해 둔 응답(터미널별 JSON 파일)을 재생하는 로컬 스텁 서버 핸들러"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        if not self.path.startswith(stub_path):
+            return self.reply(404, b"")
+        if server.fail_rate and random.random() < server.fail_rate:
+            return self.reply(503, b"", {"Retry-After": "0"})
+
+        terminal = unquote(self.path[len(stub_path):].split("?", 1)[0])
+        path = data_file_path(server.recordings, terminal)
+        if not os.path.isfile(path):
+            return self.reply(404, b"")
+
+        with open(path, "rb") as f:
+            body = f.read()
+        etag = f'"{manifest.content_hash(body)[:16]}"'
+        modified = int(os.path.getmtime(path))
+        headers = {"ETag": etag, "Last-Modified": formatdate(modified, usegmt=True),
+                   "Content-Type": "application/json; charset=utf-8"}
+
+        if self.headers.get("If-None-Match") == etag:
+            return self.reply(304, b"", headers)
+        since = self.headers.get("If-Modified-Since")
+        if since and not self.headers.get("If-None-Match"):
+            try:
+                if modified <= parsedate_to_datetime(since).timestamp():
+                    return self.reply(304, b"", headers)
+            except (TypeError, ValueError):
+                pass
+        self.reply(200, body, headers)
+
+    def reply(self, status, body, headers=None):
+        self.server.request_count += 1
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+def start_stub_server(recordings=data_folder, host=stub_host, port=stub_port, fail_rate=0.0, latency=0.0,
+                      verbose=False):
+    """스텁 서버를 백그라운드 스레드로 시작 → (서버, URL 템플릿) (port=0이면 빈 포트 사용)"""
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.recordings = recordings
+    server.fail_rate = fail_rate
+    server.latency = latency
+    server.verbose = verbose
+    server.request_count = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url_template = f"http://{host}:{server.server_address[1]}{stub_path}{{terminal}}"
+    return server, url_template
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="상류 API에서 터미널별 시간표를 동시 수집 (조건부 요청, 재시도, 원자적 저장)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    fetch_parser = subparsers.add_parser("fetch", help="터미널별 시간표 수집")
+    fetch_parser.add_argument("--url", default=os.environ.get(url_env_name),
+                              help=f"URL 템플릿, {{terminal}} 자리에 터미널명 (기본값: 환경변수 {url_env_name})")
+    fetch_parser.add_argument("--terminals", nargs="*", help="수집할 터미널 (기본값: 노선 파일의 모든 출발지)")
+    fetch_parser.add_argument("--strict", action="store_true",
+                              help="노선 파일에 없는 --terminals 이름이 있으면 수집하지 않고 종료")
+    fetch_parser.add_argument("--output", default=data_folder, help=f"저장 폴더 (기본값: {data_folder})")
+    fetch_parser.add_argument("--workers", type=int, default=default_workers, help=f"동시 요청 수 (기본값: {default_workers})")
+    fetch_parser.add_argument("--rate", type=float, default=default_rate, help=f"호스트당 초당 요청 수 (기본값: {default_rate})")
+    fetch_parser.add_argument("--force", action="store_true", help="조건부 요청 기록을 무시하고 모두 다시 받기")
+    fetch_parser.add_argument("--stub", metavar="RECORDINGS",
+                              help="기록된 응답 폴더로 로컬 스텁 서버를 띄워 그 서버에서 수집 (테스트용)")
+    fetch_parser.add_argument("--stub-fail-rate", type=float, default=0.0, help="스텁 서버가 503을 돌려줄 확률 (재시도 확인용)")
+
+    stub_parser = subparsers.add_parser("stub", help="기록된 응답을 재생하는 로컬 스텁 서버 실행")
+    stub_parser.add_argument("--recordings", default=data_folder, help=f"터미널별 응답 JSON 폴더 (기본값: {data_folder})")
+    stub_parser.add_argument("--port", type=int, default=stub_port, help=f"포트 (기본값: {stub_port})")
+    stub_parser.add_argument("--fail-rate", type=float, default=0.0, help="503을 돌려줄 확률")
+    stub_parser.add_argument("--latency", type=float, default=0.0, help="응답마다 추가할 지연 (초)")
+
+    args = parser.parse_args()
+
+    if args.command == "stub":
+        server, url_template = start_stub_server(args.recordings, port=args.port, fail_rate=args.fail_rate,
+                                                 latency=args.latency, verbose=True)
+        print(f"🧪 스텁 서버 실행 중: {url_template} (녹화 폴더: {args.recordings}) - Ctrl+C로 종료")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.shutdown()
+    else:
+        server = None
+        url_template = args.url
+        if args.stub:
+            server, url_template = start_stub_server(args.stub, port=0, fail_rate=args.stub_fail_rate)
+            print(f"🧪 스텁 서버에서 수집합니다: {url_template}")
+        if not url_template or "{terminal}" not in url_template:
+            print(f"❌ URL 템플릿이 필요합니다. --url 또는 환경변수 {url_env_name}에 {{terminal}}을 포함해 지정해주세요.")
+            exit(1)
+
+        if args.terminals:
+            # 🔎 표기가 조금 다른 이름('마포역 (서울가든호텔)')은 노선 파일의 이름으로 맞추고,
+            #    노선 파일에 없는 이름은 후보를 보여준 뒤 입력한 그대로 수집 (새 터미널일 수 있음, --strict면 종료)
+            known = load_terminal_names() if os.path.exists(route_file_path) else []
+            resolver = terminal_names.build_resolver(dict.fromkeys(known, 1))
+            resolved, unknown = terminal_names.resolve_names(resolver, args.terminals)
+            for name, suggestions in unknown.items():
+                hint = f" (혹시: {', '.join(suggestions)})" if suggestions else ""
+                print(f"❓ 노선 파일에 없는 터미널: {name}{hint}")
+            if unknown and args.strict:
+                exit(1)
+            terminals = list(dict.fromkeys(resolved + [name.strip() for name in unknown]))
+        else:
+            terminals = load_terminal_names()
+        results = fetch_all(url_template, terminals, args.output, args.workers, args.rate, args.force)
+        if server is not None:
+            print(f"🧪 스텁 서버 요청 수: {server.request_count}회")
+            server.shutdown()
+        if results["failed"]:
+            exit(1)
@@ -0,0 +1,236 @@
+import os
+import io
+import re
+import csv
+import glob
+import json
+import shutil
+import hashlib
+import zipfile
+import argparse
+import tempfile
+import contextlib
+from datetime import datetime
+
+import app
+import manifest
+import trips
+
+# 📂 경로 설정
+data_folder = "data"
+output_folder = "outputs"
+gtfs_file_name = "gtfs.zip"
+stop_coordinates_file = "route/stop_coordinates.json"  # 선택: {정류장명: [위도, 경도]}
+
+# 🚌 피드 기본값
+site_url = "https://bus.medilocator.co.kr/"
+feed_timezone = "Asia/Seoul"
+feed_lang = "ko"
+route_type = 3  # 버스
+service_id = "DAILY"  # 데이터에 운행 요일 정보가 없어 매일 운행으로 간주
+
+# 📌 zip 항목 시각 고정 (내용이 같으면 항상 같은 바이트의 zip)
+zip_timestamp = (1980, 1, 1, 0, 0, 0)
+
+operator_pattern = re.compile(r"^(.*?)\s*\((.*?)\)")
+
+# 📋 GTFS 파일별 열
+columns = {
+    "agency.txt": ["agency_id", "agency_name", "agency_url", "agency_timezone", "agency_lang"],
+    "stops.txt": ["stop_id", "stop_name", "stop_lat", "stop_lon"],
+    "routes.txt": ["route_id", "agency_id", "route_short_name", "route_long_name", "route_type"],
+    "trips.txt": ["route_id", "service_id", "trip_id", "trip_headsign", "trip_short_name"],
+    "stop_times.txt": ["trip_id", "arrival_time", "departure_time", "stop_id", "stop_sequence"],
+    "calendar.txt": ["service_id", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+                     "start_date", "end_date"],
+    "feed_info.txt": ["feed_publisher_name", "feed_publisher_url", "feed_lang", "feed_version"],
+}
+
+def stable_id(prefix, *parts):
+    """이름 등 내용으로 만든 고정 ID (실행할 때마다 같은 값)"""
+    digest = hashlib.sha1("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f"{prefix}{digest[:12]}"
+
+def split_operator(operator):
+    """'경남여객(일반)' → ('경남여객', '일반')"""
+    match = operator_pattern.match(operator)
+    if match:
+        return match.group(1).strip() or operator, match.group(2).strip()
+    return operator.strip(), ""
+
+def gtfs_time(minutes):
+    """자정부터의 분 → 'HH:MM:SS' (다음날 도착은 24시 이상으로 표기)"""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}:00"
+
+def load_stop_coordinates(path=stop_coordinates_file):
+    """정류장 좌표 (파일이 없으면 빈 dict)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def csv_writer(stream):
+    """GTFS용 CSV 작성기 (UTF-8, 줄바꿈 \\r\\n)"""
+    return csv.writer(stream, lineterminator="\r\n")
+
+def load_terminal_schedules(json_file_path):
+    """데이터 파일 하나 → {도착지: [버스 데이터]} (app.py와 같은 변환, 로그는 생략)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        bus_data = app.read_bus_data(json_file_path)
+        return app.normalize_schedules(bus_data) if bus_data is not None else None
+
+def write_zip_entry(zf, name, source):
+    """임시 파일 또는 bytes를 zip 항목 하나로 기록 (시각 고정, deflate 압축)"""
+    info = zipfile.ZipInfo(name, date_time=zip_timestamp)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    with zf.open(info, "w") as entry:
+        if isinstance(source, bytes):
+            entry.write(source)
+        else:
+            source.seek(0)
+            shutil.copyfileobj(source, entry)
+
+def rows_to_bytes(name, rows):
+    """작은 표(agency, stops 등)를 CSV bytes로 변환"""
+    buffer = io.StringIO()
+    writer = csv_writer(buffer)
+    writer.writerow(columns[name])
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+def export_gtfs(output_path=os.path.join(output_folder, gtfs_file_name), data_pattern=None,
+                allow_missing_coordinates=False):
+    """data/*_schedules.json → GTFS zip
+
+    trips.txt와 stop_times.txt는 출발지 하나씩 처리하며 임시 파일에 바로 쓰므로
+    메모리에는 운행사·정류장·노선 목록(출발 건수와 무관한 크기)만 남습니다.
+    GTFS는 정류장마다 stop_lat·stop_lon이 필수라, 좌표가 없는 정류장이 있으면 zip을 쓰지 않고
+    ValueError를 냅니다 (allow_missing_coordinates=True면 확인용으로 그대로 씀).
+    """
+    data_pattern = data_pattern or os.path.join(data_folder, "*_schedules.json")
+    agencies = {}  # 운행회사 → agency_id
+    stops = {}     # 정류장명 → stop_id
+    routes = {}    # route_id → (agency_id, 긴 이름)
+    counts = {"trips": 0, "stop_times": 0, "dropped_stops": 0}
+
+    folder = os.path.dirname(output_path) or "."
+    os.makedirs(folder, exist_ok=True)
+    with tempfile.TemporaryFile("w+b", dir=folder) as trips_file, \
+            tempfile.TemporaryFile("w+b", dir=folder) as stop_times_file:
+        trips_text = io.TextIOWrapper(trips_file, encoding="utf-8", newline="")
+        stop_times_text = io.TextIOWrapper(stop_times_file, encoding="utf-8", newline="")
+        trips_writer = csv_writer(trips_text)
+        stop_times_writer = csv_writer(stop_times_text)
+        trips_writer.writerow(columns["trips.txt"])
+        stop_times_writer.writerow(columns["stop_times.txt"])
+
+        for json_file_path in sorted(glob.glob(data_pattern)):
+            origin = app.terminal_name_from_path(json_file_path)
+            schedules = load_terminal_schedules(json_file_path)
+            if not schedules:
+                continue
+
+            trip_model = trips.build_trip_patterns(origin, schedules)
+            trip_ids = set()  # ID 중복 확인은 출발지 안에서만 (운행 ID에 출발지가 포함됨)
+            for trip in trip_model["trips"]:
+                # 소요시간을 알 수 없는 정류장(LIN_TIM 0)은 시각을 정할 수 없어 제외
+                trip_stops = [(stop, offset) for stop, offset
+                              in zip(trip_model["patterns"][trip["pattern"]], trip["offsets"]) if offset > 0]
+                counts["dropped_stops"] += len(trip["offsets"]) - len(trip_stops)
+                if not trip_stops:
+                    continue
+
+                agency_name, grade = split_operator(trip["operator"])
+                agency_id = agencies.setdefault(agency_name, stable_id("A", agency_name))
+                final_stop = trip_stops[-1][0]
+                route_id = stable_id("R", agency_name, origin, final_stop)
+                routes.setdefault(route_id, (agency_id, f"{origin} → {final_stop} ({agency_name})"))
+
+                trip_key = (origin, trip["time"], trip["operator"], tuple(stop for stop, _ in trip_stops))
+                trip_id = stable_id("T", *trip_key)
+                suffix = 2
+                while trip_id in trip_ids:  # 완전히 같은 운행이 두 번 있으면 순번으로 구분
+                    trip_id = stable_id("T", *trip_key, suffix)
+                    suffix += 1
+                trip_ids.add(trip_id)
+
+                trips_writer.writerow([route_id, service_id, trip_id, final_stop, grade])
+                hour, minute = trip["time"].split(":")
+                start = int(hour) * 60 + int(minute)
+                origin_id = stops.setdefault(origin, stable_id("S", origin))
+                stop_times_writer.writerow([trip_id, gtfs_time(start), gtfs_time(start), origin_id, 0])
+                for sequence, (stop, offset) in enumerate(trip_stops, 1):
+                    stop_id = stops.setdefault(stop, stable_id("S", stop))
+                    stop_times_writer.writerow([trip_id, gtfs_time(start + offset), gtfs_time(start + offset),
+                                                stop_id, sequence])
+                counts["trips"] += 1
+                counts["stop_times"] += len(trip_stops) + 1
+
+        trips_text.flush()
+        stop_times_text.flush()
+
+        # 📋 작은 표와 임시 파일을 zip에 기록 (임시 파일에 쓴 뒤 rename으로 교체)
+        year = datetime.today().year
+        coordinates = load_stop_coordinates()
+        missing_coordinates = [name for name in stops if name not in coordinates]
+        if missing_coordinates and not allow_missing_coordinates:
+            raise ValueError(f"좌표가 없는 정류장 {len(missing_coordinates)}개 (예: {', '.join(sorted(missing_coordinates)[:5])}) "
+                             f"- {stop_coordinates_file}에 추가해주세요")
+        tables = {
+            "agency.txt": [[agency_id, name, site_url, feed_timezone, feed_lang]
+                           for name, agency_id in sorted(agencies.items(), key=lambda item: item[1])],
+            "stops.txt": [[stop_id, name, *coordinates.get(name, ["", ""])]
+                          for name, stop_id in sorted(stops.items(), key=lambda item: item[1])],
+            "routes.txt": [[route_id, agency_id, "", long_name, route_type]
+                           for route_id, (agency_id, long_name) in sorted(routes.items())],
+            "calendar.txt": [[service_id, 1, 1, 1, 1, 1, 1, 1, f"{year}0101", f"{year + 1}1231"]],
+            "feed_info.txt": [["전국 시외버스 시간표", site_url, feed_lang, f"{year}"]],
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-", suffix=".zip")
+        try:
+            with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w") as zf:
+                for name in ("agency.txt", "stops.txt", "routes.txt"):
+                    write_zip_entry(zf, name, rows_to_bytes(name, tables[name]))
+                write_zip_entry(zf, "trips.txt", trips_file)
+                write_zip_entry(zf, "stop_times.txt", stop_times_file)
+                for name in ("calendar.txt", "feed_info.txt"):
+                    write_zip_entry(zf, name, rows_to_bytes(name, tables[name]))
+            os.chmod(tmp_path, manifest.file_mode)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    counts.update(agencies=len(agencies), stops=len(stops), routes=len(routes),
+                  missing_coordinates=len(missing_coordinates))
+    return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전국 시외버스 시간표를 GTFS 정적 피드(zip)로 내보내기")
+    parser.add_argument("--output", default=os.path.join(output_folder, gtfs_file_name),
+                        help=f"zip 경로 (기본값: {output_folder}/{gtfs_file_name})")
+    parser.add_argument("--allow-missing-coordinates", action="store_true",
+                        help="좌표가 없는 정류장이 있어도 zip 쓰기 (로컬 확인용, 유효한 GTFS 피드가 아니므로 배포 금지)")
+    args = parser.parse_args()
+
+    print("🚀 GTFS 내보내기 시작...")
+    try:
+        counts = export_gtfs(args.output, allow_missing_coordinates=args.allow_missing_coordinates)
+    except ValueError as e:
+        print(f"🚫 GTFS 피드를 만들지 않았습니다: {e}")
+        exit(1)
+    with open(args.output, "rb") as f:
+        content = f.read()
+    if os.path.dirname(os.path.abspath(args.output)) == os.path.abspath(output_folder):
+        manifest.record_stage("gtfs", {os.path.basename(args.output): manifest.file_entry(content, "gtfs")})
+
+    print(f"🎉 GTFS 내보내기 완료: {args.output} ({len(content):,} bytes)")
+    print(f"   🏢 운행사: {counts['agencies']}개 | 🚏 정류장: {counts['stops']}개 | 🛣️ 노선: {counts['routes']}개")
+    print(f"   🚌 운행: {counts['trips']:,}회 | ⏱️ 정차 시각: {counts['stop_times']:,}건")
+    if counts["dropped_stops"]:
+        print(f"   ⚠️  소요시간 정보가 없어 제외한 정차: {counts['dropped_stops']}건")
+    if counts["missing_coordinates"]:
+        print(f"   ⚠️  좌표가 없는 정류장: {counts['missing_coordinates']}개 ({stop_coordinates_file}에 추가해주세요)")
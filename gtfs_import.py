@@ -0,0 +1,272 @@
+import os
+import io
+import csv
+import heapq
+import argparse
+import tempfile
+import zipfile
+from datetime import datetime
+from itertools import groupby
+
+import fetcher
+import manifest
+
+# 📂 기본 경로
+data_folder = "data"
+
+# 📌 외부 정렬 한 덩어리의 최대 행 수 (이 만큼만 메모리에 올려 정렬 후 임시 파일로 내보냄)
+default_chunk_rows = 200000
+
+weekday_columns = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+def read_table(zf, name):
+    """작은 GTFS 표 하나를 dict 목록으로 읽기 (파일이 없으면 빈 목록)"""
+    if name not in zf.namelist():
+        return []
+    with zf.open(name) as raw:
+        return list(csv.DictReader(io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")))
+
+def parse_gtfs_time(value):
+    """'HH:MM:SS' → 자정부터의 분 (24시 이상 허용, 비어 있으면 None)"""
+    value = (value or "").strip()
+    if not value:
+        return None
+    hour, minute, _ = value.split(":")
+    return int(hour) * 60 + int(minute)
+
+def active_services(zf, service_date):
+    """service_date('YYYYMMDD')에 운행하는 service_id 집합 (날짜를 지정하지 않으면 None = 모두 허용)"""
+    if service_date is None:
+        return None
+    weekday = weekday_columns[datetime.strptime(service_date, "%Y%m%d").weekday()]
+    services = {
+        row["service_id"] for row in read_table(zf, "calendar.txt")
+        if row.get(weekday) == "1" and row["start_date"] <= service_date <= row["end_date"]
+    }
+    for row in read_table(zf, "calendar_dates.txt"):
+        if row["date"] != service_date:
+            continue
+        if row["exception_type"] == "1":
+            services.add(row["service_id"])
+        elif row["exception_type"] == "2":
+            services.discard(row["service_id"])
+    return services
+
+def write_sorted_chunk(rows, folder):
+    """정렬한 행 덩어리를 임시 CSV 파일로 저장하고 경로 반환"""
+    rows.sort(key=lambda row: (row[0], row[1]))
+    fd, path = tempfile.mkstemp(dir=folder, prefix="stop_times-", suffix=".csv")
+    with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(rows)
+    return path
+
+def read_sorted_chunk(path):
+    """임시 CSV 파일을 (trip_id, stop_sequence, ...) 튜플로 한 줄씩 읽기"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for trip_id, sequence, arrival, departure, stop_id, pickup, drop_off in csv.reader(f):
+            yield trip_id, int(sequence), arrival, departure, stop_id, pickup, drop_off
+
+def sorted_stop_times(zf, folder, chunk_rows=default_chunk_rows):
+    """stop_times.txt를 스트림으로 읽어 (trip_id, stop_sequence) 순으로 돌려주는 외부 정렬
+
+    chunk_rows 행씩 정렬해 임시 파일로 내보낸 뒤 heapq.merge로 합치므로
+    메모리에는 한 덩어리만 올라갑니다.
+    """
+    chunk_paths = []
+    rows = []
+    with zf.open("stop_times.txt") as raw:
+        for row in csv.DictReader(io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")):
+            rows.append((row["trip_id"], int(row["stop_sequence"]), row.get("arrival_time", ""),
+                         row.get("departure_time", ""), row["stop_id"], row.get("pickup_type", ""),
+                         row.get("drop_off_type", "")))
+            if len(rows) >= chunk_rows:
+                chunk_paths.append(write_sorted_chunk(rows, folder))
+                rows = []
+    if rows:
+        chunk_paths.append(write_sorted_chunk(rows, folder))
+
+    try:
+        yield from heapq.merge(*(read_sorted_chunk(path) for path in chunk_paths),
+                               key=lambda row: (row[0], row[1]))
+    finally:
+        for path in chunk_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+def import_gtfs(gtfs_path, service_date=None, chunk_rows=default_chunk_rows):
+    """GTFS zip → {출발 터미널: {도착지: [{TIM_TIM, LIN_TIM, COR_NAM}]}}
+
+    운행 하나의 각 승차 가능 정류장에서 이후 하차 가능 정류장까지를 출발 한 건으로 만듭니다.
+    """
+    with zipfile.ZipFile(gtfs_path) as zf:
+        # 📋 작은 표 (정류장·노선·운행사·운행은 메모리에, stop_times만 외부 정렬)
+        stop_rows = read_table(zf, "stops.txt")
+        parent_names = {row["stop_id"]: row["stop_name"] for row in stop_rows}
+        stop_names = {row["stop_id"]: parent_names.get(row.get("parent_station") or "", row["stop_name"]).strip()
+                      for row in stop_rows}
+        agencies = {row.get("agency_id", ""): row["agency_name"] for row in read_table(zf, "agency.txt")}
+        default_agency = next(iter(agencies.values()), "정보 없음")
+        route_agencies = {row["route_id"]: agencies.get(row.get("agency_id", ""), default_agency)
+                          for row in read_table(zf, "routes.txt")}
+        services = active_services(zf, service_date)
+        trip_operators = {}
+        for row in read_table(zf, "trips.txt"):
+            if services is not None and row["service_id"] not in services:
+                continue
+            agency = route_agencies.get(row["route_id"], default_agency)
+            grade = (row.get("trip_short_name") or "").strip()
+            trip_operators[row["trip_id"]] = f"{agency}({grade})" if grade else agency
+
+        schedules = {}
+        seen = set()
+        counts = {"stop_times": 0, "trips": 0, "departures": 0}
+        with tempfile.TemporaryDirectory(prefix="gtfs-import-") as folder:
+            for trip_id, trip_rows in groupby(sorted_stop_times(zf, folder, chunk_rows), key=lambda row: row[0]):
+                trip_rows = list(trip_rows)
+                counts["stop_times"] += len(trip_rows)
+                operator = trip_operators.get(trip_id)
+                if operator is None:
+                    continue
+                counts["trips"] += 1
+
+                for i, (_, _, _, departure, origin_id, pickup, _) in enumerate(trip_rows):
+                    departure_minutes = parse_gtfs_time(departure)
+                    if departure_minutes is None or pickup == "1":
+                        continue
+                    origin = stop_names.get(origin_id, origin_id)
+                    for _, _, arrival, _, stop_id, _, drop_off in trip_rows[i + 1:]:
+                        arrival_minutes = parse_gtfs_time(arrival)
+                        destination = stop_names.get(stop_id, stop_id)
+                        if arrival_minutes is None or drop_off == "1" or destination == origin:
+                            continue
+                        minutes = departure_minutes % (24 * 60)
+                        entry = {
+                            "TIM_TIM": f"{minutes // 60:02d}{minutes % 60:02d}",
+                            "LIN_TIM": arrival_minutes - departure_minutes,
+                            "COR_NAM": operator,
+                        }
+                        key = (origin, destination, entry["TIM_TIM"], entry["LIN_TIM"], operator)
+                        if key in seen:  # 운행 요일만 다른 같은 출발은 한 번만
+                            continue
+                        seen.add(key)
+                        schedules.setdefault(origin, {}).setdefault(destination, []).append(entry)
+                        counts["departures"] += 1
+
+    for destinations in schedules.values():
+        for entries in destinations.values():
+            entries.sort(key=lambda entry: (entry["TIM_TIM"], entry["COR_NAM"]))
+    return schedules, counts
+
+def new_departures(existing, imported):
+    """가져온 출발 중 기존 {도착지: [버스]}에 없는 것만 → {도착지: [출발]} (같은 시각·운행사·소요시간은 한 번만)"""
+    added = {}
+    for destination, entries in imported.items():
+        keys = {(bus.get("TIM_TIM"), bus.get("COR_NAM"), bus.get("LIN_TIM")) for bus in existing.get(destination, [])}
+        for entry in entries:
+            key = (entry["TIM_TIM"], entry["COR_NAM"], entry["LIN_TIM"])
+            if key not in keys:
+                keys.add(key)
+                added.setdefault(destination, []).append(entry)
+    return added
+
+def merge_schedules(existing, imported):
+    """기존 {도착지: [버스]}에 가져온 출발을 합침 (같은 시각·운행사·소요시간은 한 번만)"""
+    merged = {destination: list(buses) for destination, buses in existing.items()}
+    for destination, entries in new_departures(existing, imported).items():
+        buses = merged.setdefault(destination, [])
+        buses.extend(entries)
+        buses.sort(key=lambda bus: str(bus.get("TIM_TIM", "")))
+    return merged
+
+def list_schedule_item(entry):
+    """가져온 출발 {TIM_TIM, LIN_TIM, COR_NAM} → 리스트 형태 원본의 스케줄 항목 {출발시각, 차편정보}
+
+    차편정보는 원본과 같은 "운행회사(등급)H:MM 소요" 형식입니다.
+    GTFS에는 등급이 없어 빈 괄호로 운행회사와 소요시간을 구분합니다 (app.py 변환·route_index가 괄호 앞을 운행회사로 읽음).
+    """
+    operator = entry["COR_NAM"]
+    minutes = entry["LIN_TIM"]
+    return {
+        "출발시각": f"{entry['TIM_TIM'][:2]}:{entry['TIM_TIM'][2:]}",
+        "차편정보": f"{operator}{'' if '(' in operator else '()'}{minutes // 60}:{minutes % 60:02d} 소요",
+    }
+
+def merge_list_items(items, origin, imported):
+    """리스트 형태 원본([{출발지, 도착지, 스케줄}])에 가져온 출발을 합침
+
+    imported는 new_departures로 이미 걸러진 새 출발만 받아 리스트 스케줄 형식으로 바꿔 붙입니다.
+    출발지가 origin인 항목에 같은 도착지가 있으면 스케줄 뒤에 붙이고, 없으면 항목을 새로 추가합니다.
+    다른 출발지의 항목은 그대로 둡니다.
+    """
+    merged = [dict(item) if isinstance(item, dict) else item for item in items]
+    positions = {}
+    for i, item in enumerate(merged):
+        if isinstance(item, dict) and (item.get('출발지') or origin) == origin:
+            positions.setdefault(item.get('도착지'), i)
+    for destination, entries in imported.items():
+        schedule = [list_schedule_item(entry) for entry in entries]
+        if destination in positions:
+            item = merged[positions[destination]]
+            item['스케줄'] = list(item.get('스케줄') or []) + schedule
+        else:
+            merged.append({'출발지': origin, '도착지': destination, '스케줄': schedule})
+    return merged
+
+def merge_into_model(model, imported):
+    """app.load_model로 만든 메모리 모델에 가져온 시간표를 합침 (파일을 쓰지 않고 바로 빌드할 때)
+
+    허브·도착지·운행회사 페이지가 읽는 model['raw']에도 합칩니다 (리스트 형태 원본은 새 출발만 스케줄 형식으로 추가).
+    """
+    for origin, destinations in imported.items():
+        existing = model['terminals'].get(origin, {})
+        added = new_departures(existing, destinations)
+        model['terminals'][origin] = merge_schedules(existing, destinations)
+        raw = model['raw'].get(origin, {})
+        if isinstance(raw, list):
+            model['raw'][origin] = merge_list_items(raw, origin, added)
+        else:
+            model['raw'][origin] = model['terminals'][origin]
+    return model
+
+def write_schedules(imported, output_folder=data_folder, replace=False):
+    """터미널별 데이터 파일로 저장 (기존 파일이 있으면 합쳐서 저장) → {status: [터미널]}"""
+    os.makedirs(output_folder, exist_ok=True)
+    results = {"created": [], "merged": [], "unchanged": [], "skipped": []}
+    for origin, destinations in sorted(imported.items()):
+        path = fetcher.data_file_path(output_folder, origin)
+        existing, newline = fetcher.read_existing(path)
+        if existing is not None and not isinstance(existing, dict):
+            print(f"⚠️  {origin}: 기존 파일이 리스트 형식이라 합칠 수 없어 건너뜁니다. ({path})")
+            results["skipped"].append(origin)
+            continue
+
+        data = destinations if existing is None or replace else merge_schedules(existing, destinations)
+        if data == existing:
+            results["unchanged"].append(origin)
+            continue
+        manifest.atomic_write(path, fetcher.serialize_schedules(data, newline))
+        results["created" if existing is None else "merged"].append(origin)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GTFS 정적 피드(zip)를 터미널별 시간표 JSON으로 가져오기")
+    parser.add_argument("gtfs", help="GTFS zip 경로")
+    parser.add_argument("--output", default=data_folder, help=f"저장 폴더 (기본값: {data_folder})")
+    parser.add_argument("--date", help="이 날짜(YYYYMMDD)에 운행하는 운행만 가져오기 (기본값: 모든 운행)")
+    parser.add_argument("--replace", action="store_true", help="기존 파일과 합치지 않고 덮어쓰기")
+    parser.add_argument("--chunk-rows", type=int, default=default_chunk_rows,
+                        help=f"외부 정렬 한 덩어리의 행 수 (기본값: {default_chunk_rows})")
+    args = parser.parse_args()
+
+    print(f"🚀 GTFS 가져오기 시작: {args.gtfs}")
+    imported, counts = import_gtfs(args.gtfs, args.date, args.chunk_rows)
+    print(f"   ⏱️ 정차 시각: {counts['stop_times']:,}건 | 🚌 운행: {counts['trips']:,}회 | "
+          f"🎫 출발: {counts['departures']:,}건 | 🚏 출발 터미널: {len(imported)}개")
+
+    results = write_schedules(imported, args.output, args.replace)
+    print(f"🎉 GTFS 가져오기 완료: {args.output}/")
+    print(f"   ➕ 새 파일: {len(results['created'])}개")
+    print(f"   🔀 합친 파일: {len(results['merged'])}개")
+    print(f"   ⏸️  변경 없음: {len(results['unchanged'])}개")
+    if results["skipped"]:
+        print(f"   ⚠️  건너뜀: {len(results['skipped'])}개")
@@ -0,0 +1,89 @@
+# 🚌 배차 간격 압축
+#   같은 운행회사·같은 소요시간으로 일정한 간격마다 출발하는 연속 구간을
+#   {"start", "end", "headway", "count", "duration", "company"} 한 항목으로 묶고,
+#   나머지 출발은 {"time", "duration", "company"} 항목으로 그대로 둡니다.
+#   HTML 시간표와 JSON 출력이 모두 이 형식을 사용합니다.
+
+# 📌 배차 묶음으로 인정하는 최소 연속 출발 횟수
+min_run_length = 3
+
+def to_minutes(dep_time):
+    """'HH:MM' → 자정부터의 분 (형식이 다르면 None)"""
+    try:
+        hour, minute = dep_time.split(":")
+        return int(hour) * 60 + int(minute)
+    except (AttributeError, ValueError):
+        return None
+
+def from_minutes(minutes):
+    """자정부터의 분 → 'HH:MM'"""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+def run_end(departures, i):
+    """i번째 출발부터 같은 간격·운행회사·소요시간이 이어지는 마지막 위치와 간격 → (j, 간격)"""
+    start = to_minutes(departures[i][0])
+    same = departures[i][1:]
+    if start is None or i + 1 >= len(departures) or departures[i + 1][1:] != same:
+        return i, None
+
+    second = to_minutes(departures[i + 1][0])
+    if second is None or second <= start:
+        return i, None
+
+    headway = second - start
+    j = i + 1
+    while j + 1 < len(departures) and departures[j + 1][1:] == same:
+        following = to_minutes(departures[j + 1][0])
+        if following is None or following - to_minutes(departures[j][0]) != headway:
+            break
+        j += 1
+    return j, headway
+
+def compress_departures(departures, min_run=min_run_length):
+    """출발 목록 [(출발시각 'HH:MM', 소요시간(분), 운행회사)] → 단일/배차 묶음 항목 목록 (순서 유지)"""
+    departures = [tuple(departure) for departure in departures]
+    entries = []
+    i = 0
+    while i < len(departures):
+        dep_time, duration, company = departures[i]
+        j, headway = run_end(departures, i)
+        count = j - i + 1
+        if count >= min_run:
+            entries.append({
+                "start": dep_time,
+                "end": departures[j][0],
+                "headway": headway,
+                "count": count,
+                "duration": duration,
+                "company": company,
+            })
+            i = j + 1
+        else:
+            entries.append({"time": dep_time, "duration": duration, "company": company})
+            i += 1
+    return entries
+
+def is_run(entry):
+    """배차 묶음 항목인지 여부"""
+    return "headway" in entry
+
+def entry_times(entry):
+    """항목 하나의 전체 출발시각 목록"""
+    if not is_run(entry):
+        return [entry["time"]]
+    start = to_minutes(entry["start"])
+    return [from_minutes(start + k * entry["headway"]) for k in range(entry["count"])]
+
+def expand_departures(entries):
+    """compress_departures의 역변환 → [(출발시각, 소요시간, 운행회사)]"""
+    return [
+        (dep_time, entry["duration"], entry["company"])
+        for entry in entries
+        for dep_time in entry_times(entry)
+    ]
+
+def describe(entry):
+    """배차 묶음 요약 문구 (예: '06:00~22:00 매 20분')"""
+    if not is_run(entry):
+        return entry["time"]
+    return f"{entry['start']}~{entry['end']} 매 {entry['headway']}분"
@@ -1,11 +1,98 @@
 import os
 import json
+import argparse
 import glob
 from urllib.parse import quote
 from datetime import datetime
 
-def load_route_data():
-    """data 폴더의 모든 JSON 파일에서 노선 정보를 추출합니다."""
+import assets
+import locales
+import manifest
+import minify
+import profiler
+import route_index
+import service_worker
+import shard
+import size_report
+
+def extract_routes(departure, data, verbose=True):
+    """JSON 원본 하나에서 노선 목록을 추출합니다 (중복 제거 포함)."""
+    file_routes = []  # 이 파일에서만 추출된 노선들
+    
+    # JSON이 딕셔너리인 경우 (목적지별로 스케줄이 정리된 구조)
+    if isinstance(data, dict):
+        destinations = list(data.keys())
+        if verbose:
+            print(f"   📋 딕셔너리 형태: {len(destinations)}개 목적지")
+        
+        for i, arrival in enumerate(destinations):
+            if arrival and departure:  # 출발지와 도착지가 모두 있는 경우
+                route = {
+                    'departure': departure,
+                    'arrival': arrival,
+                    'filename': f"{departure}-에서-{arrival}-가는-시외버스-시간표.html",
+                    'url': f"/{departure}-에서-{arrival}-가는-시외버스-시간표",
+                    'operators': route_index.bus_operators(data[arrival])
+                }
+                file_routes.append(route)
+                
+                # 처음 5개만 로그로 출력
+                if not verbose:
+                    continue
+                if i < 5:
+                    print(f"   🚌 {i+1}: {departure} → {arrival}")
+                elif i == 5:
+                    print(f"   🚌 ... (총 {len(destinations)}개 중 일부만 표시)")
+                    
+    # JSON이 리스트인 경우 (기존 방식)
+    elif isinstance(data, list):
+        if verbose:
+            print(f"   📋 리스트 형태: {len(data)}개 항목")
+        for i, item in enumerate(data):
+            item_departure = item.get('출발지', departure)  # 출발지가 없으면 파일명에서 추출
+            arrival = item.get('도착지', '')
+            
+            if item_departure and arrival:
+                route = {
+                    'departure': item_departure,
+                    'arrival': arrival,
+                    'filename': f"{item_departure}-에서-{arrival}-가는-시외버스-시간표.html",
+                    'url': f"/{item_departure}-에서-{arrival}-가는-시외버스-시간표",
+                    'operators': route_index.bus_operators(item.get('스케줄', []))
+                }
+                file_routes.append(route)
+                
+                # 처음 5개만 로그로 출력
+                if not verbose:
+                    continue
+                if i < 5:
+                    print(f"   🚌 {i+1}: {item_departure} → {arrival}")
+                elif i == 5:
+                    print(f"   🚌 ... (총 {len(data)}개 중 일부만 표시)")
+    elif verbose:
+        print(f"   ⚠️ 알 수 없는 데이터 형태: {type(data)}")
+    
+    # 중복 제거 (같은 노선이 여러 번 나오면 운행회사는 합침)
+    before_count = len(file_routes)
+    unique_routes = []
+    seen = {}
+    
+    for route in file_routes:
+        key = (route['departure'], route['arrival'])
+        if key not in seen:
+            seen[key] = route
+            unique_routes.append(route)
+        else:
+            seen[key]['operators'] = route_index.merge_operators(seen[key]['operators'], route['operators'])
+    
+    after_count = len(unique_routes)
+    if verbose and before_count != after_count:
+        print(f"   🔄 중복 제거: {before_count}개 → {after_count}개")
+    
+    return unique_routes
+
+def load_route_data(shard_spec=None):
+    """data 폴더의 모든 JSON 파일에서 노선 정보를 추출합니다. (shard_spec이 주어지면 담당 출발지만)"""
     routes = []
     
     # data 폴더의 모든 JSON 파일 찾기
@@ -24,75 +111,17 @@ def load_route_data():
                 # 다른 형태의 파일명도 처리
                 departure = filename.replace('.json', '').split('_')[0]
             
+            if not shard.in_shard(departure, shard_spec):
+                continue
+            
             print(f"   🚏 출발지: {departure}")
             
             with open(json_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            file_routes = []  # 이 파일에서만 추출된 노선들
-            
-            # JSON이 딕셔너리인 경우 (목적지별로 스케줄이 정리된 구조)
-            if isinstance(data, dict):
-                destinations = list(data.keys())
-                print(f"   📋 딕셔너리 형태: {len(destinations)}개 목적지")
-                
-                for i, arrival in enumerate(destinations):
-                    if arrival and departure:  # 출발지와 도착지가 모두 있는 경우
-                        route = {
-                            'departure': departure,
-                            'arrival': arrival,
-                            'filename': f"{departure}-에서-{arrival}-가는-시외버스-시간표.html",
-                            'url': f"/{departure}-에서-{arrival}-가는-시외버스-시간표"
-                        }
-                        file_routes.append(route)
-                        
-                        # 처음 5개만 로그로 출력
-                        if i < 5:
-                            print(f"   🚌 {i+1}: {departure} → {arrival}")
-                        elif i == 5:
-                            print(f"   🚌 ... (총 {len(destinations)}개 중 일부만 표시)")
-                            
-            # JSON이 리스트인 경우 (기존 방식)
-            elif isinstance(data, list):
-                print(f"   📋 리스트 형태: {len(data)}개 항목")
-                for i, item in enumerate(data):
-                    item_departure = item.get('출발지', departure)  # 출발지가 없으면 파일명에서 추출
-                    arrival = item.get('도착지', '')
-                    
-                    if item_departure and arrival:
-                        route = {
-                            'departure': item_departure,
-                            'arrival': arrival,
-                            'filename': f"{item_departure}-에서-{arrival}-가는-시외버스-시간표.html",
-                            'url': f"/{item_departure}-에서-{arrival}-가는-시외버스-시간표"
-                        }
-                        file_routes.append(route)
-                        
-                        # 처음 5개만 로그로 출력
-                        if i < 5:
-                            print(f"   🚌 {i+1}: {item_departure} → {arrival}")
-                        elif i == 5:
-                            print(f"   🚌 ... (총 {len(data)}개 중 일부만 표시)")
-            else:
-                print(f"   ⚠️ 알 수 없는 데이터 형태: {type(data)}")
-            
-            # 중복 제거
-            before_count = len(file_routes)
-            unique_routes = []
-            seen = set()
-            
-            for route in file_routes:
-                key = (route['departure'], route['arrival'])
-                if key not in seen:
-                    seen.add(key)
-                    unique_routes.append(route)
-            
-            after_count = len(unique_routes)
-            if before_count != after_count:
-                print(f"   🔄 중복 제거: {before_count}개 → {after_count}개")
-            
+            unique_routes = extract_routes(departure, data)
             routes.extend(unique_routes)
-            print(f"   ✅ 이 파일에서 {after_count}개 노선 추가됨")
+            print(f"   ✅ 이 파일에서 {len(unique_routes)}개 노선 추가됨")
                     
         except Exception as e:
             print(f"❌ {json_file} 파일 처리 중 오류: {e}")
@@ -128,8 +157,101 @@ def group_routes_by_departure(routes):
     
     return grouped
 
-def generate_terminal_page(terminal_name, destinations):
-    """개별 터미널 페이지 HTML을 생성합니다."""
+def terminal_hub(terminal_name, destinations, locale=locales.default_locale):
+    """출발 터미널 허브의 문구와 노선 카드 → (page, cards)
+
+    기본 언어가 아니면 언어 폴더의 같은 파일명으로, 지명은 로마자로 표시하고 카드는 같은 언어의 노선 페이지로 연결합니다.
+    """
+    name = locales.place_name(terminal_name, locale)
+    count = len(destinations)
+    def text(key):
+        return locales.label(locale, key, name=name, count=count)
+    page = {
+        'title': text("hub_title"),
+        'count': text("hub_count"),
+        'description': text("hub_description"),
+        'og_description': text("hub_og_description"),
+        'keywords': text("hub_keywords"),
+        'slug': locales.page_path(f"{terminal_name}-터미널-시외버스-시간표", locale),
+        'heading': text("hub_heading"),
+        'jsonld_description': text("hub_jsonld_description"),
+        'search_placeholder': text("hub_search_placeholder"),
+        'section_title': text("hub_section_title"),
+        'section_subtitle': text("hub_section_subtitle"),
+        'card_suffix': text("hub_card_suffix"),
+        # 📲 서비스 워커 미리 받기 목록은 기본 언어 페이지 기준
+        'sw_terminal': terminal_name if locale == locales.default_locale else None,
+    }
+    if locale == locales.default_locale:
+        cards = [{'url': d['url'], 'key': d['arrival'], 'label': d['arrival']} for d in destinations]
+    else:
+        # 검색은 로마자·한글 어느 쪽으로도 되도록 두 이름을 함께 둠
+        cards = [{'url': "/" + locales.page_path(d['url'].lstrip("/"), locale),
+                  'key': f"{locales.place_name(d['arrival'], locale)} {d['arrival']}",
+                  'label': locales.place_name(d['arrival'], locale)} for d in destinations]
+    return page, cards
+
+def arrival_hub(arrival, routes):
+    """도착지 허브('…로 가는 시외버스')의 문구와 출발지별 노선 카드 → (page, cards)"""
+    import app  # app이 이 모듈을 불러오므로 필요할 때만 불러옴
+    
+    josa = route_index.direction_josa(arrival)
+    page = {
+        'title': f"{arrival}{josa} 가는 시외버스 시간표",
+        'count': f"{len(routes)}개 출발지",
+        'description': f"🚌 {arrival}{josa} 가는 시외버스 시간표를 확인하세요. {len(routes)}개 터미널에서 출발하는 버스 시간표를 한눈에 볼 수 있습니다.",
+        'og_description': f"{arrival}{josa} 가는 시외버스 시간표를 확인하세요. {len(routes)}개 터미널에서 출발하는 버스 시간표를 제공합니다.",
+        'keywords': f"{arrival} 가는 버스, {arrival} 시외버스, {arrival} 버스 시간표, 시외버스 시간표",
+        'slug': f"{app.sanitize_filename(arrival)}-가는-시외버스-시간표",
+        'heading': f"{arrival}{josa} 가는 시외버스",
+        'jsonld_description': f"{arrival}{josa} 가는 시외버스의 출발 터미널별 시간표 정보를 제공합니다.",
+        'search_placeholder': "출발지를 검색하세요... (예: 서울, 부산, 대전)",
+        'section_title': "출발 터미널",
+        'section_subtitle': f"{arrival}{josa} 가는 시외버스가 출발하는 터미널을 선택하여 시간표를 확인하세요",
+        'sw_terminal': None,  # 서비스 워커 미리 받기는 출발 터미널 단위라 여기서는 등록만 함
+    }
+    cards = [{'url': r['url'], 'key': r['departure'], 'label': f"{r['departure']} → {arrival}"} for r in routes]
+    return page, cards
+
+def operator_hub(operator, routes):
+    """운행회사 페이지의 문구와 노선 카드 → (page, cards) - routes는 [(노선, [등급, ...]), ...]"""
+    import app  # app이 이 모듈을 불러오므로 필요할 때만 불러옴
+    
+    grades = sorted({grade for _, route_grades in routes for grade in route_grades})
+    grade_text = f" ({'·'.join(grades)})" if grades else ""
+    page = {
+        'title': f"{operator} 시외버스 노선 시간표",
+        'count': f"{len(routes)}개 노선",
+        'description': f"🚌 {operator}{grade_text}에서 운행하는 시외버스 {len(routes)}개 노선의 시간표를 확인하세요.",
+        'og_description': f"{operator}{grade_text}에서 운행하는 시외버스 {len(routes)}개 노선의 시간표를 제공합니다.",
+        'keywords': f"{operator}, {operator} 시외버스, {operator} 노선, {operator} 시간표, 시외버스 시간표",
+        'slug': f"{app.sanitize_filename(operator)}-시외버스-노선",
+        'heading': f"{operator} 시외버스",
+        'jsonld_description': f"{operator}에서 운행하는 시외버스 노선별 시간표 정보를 제공합니다.",
+        'search_placeholder': "출발지나 도착지를 검색하세요... (예: 서울, 부산, 대전)",
+        'section_title': "운행 노선",
+        'section_subtitle': f"{operator} 노선을 선택하여 시간표를 확인하세요",
+        'sw_terminal': None,
+    }
+    cards = []
+    for route, route_grades in routes:
+        label = f"{route['departure']} → {route['arrival']}"
+        if route_grades:
+            label += f" ({'·'.join(route_grades)})"
+        cards.append({'url': route['url'], 'key': f"{route['departure']} {route['arrival']}", 'label': label})
+    return page, cards
+
+def generate_terminal_page(terminal_name, destinations, fragments=None, locale=locales.default_locale):
+    """개별 터미널 페이지 HTML을 생성합니다. (fragments dict가 주어지면 노선 카드 조각을 담아 줍니다)"""
+    page, cards = terminal_hub(terminal_name, destinations, locale)
+    return generate_hub_page(page, cards, fragments, locale)
+
+def generate_hub_page(page, cards, fragments=None, locale=locales.default_locale):
+    """허브 페이지 HTML 생성 - 출발 터미널·도착지·운행회사 허브가 같은 틀을 씁니다.
+
+    page는 제목·설명 문구 dict, cards는 {"url", "key"(검색어), "label"} 목록입니다.
+    page['alternates']가 있으면 hreflang 링크를 넣고, 기본 언어가 아니면 고정 문구를 번역합니다.
+    """
     
     html_content = f'''<!DOCTYPE html>
 <html lang="ko">
@@ -144,20 +266,20 @@ def generate_terminal_page(terminal_name, destinations):
     <meta name="last-modified" content="{datetime.now().strftime('%Y-%m-%d')}">
 
     <!-- 🎯 SEO 최적화 -->
-    <title>{terminal_name} 터미널 시외버스 시간표 | {len(destinations)}개 노선</title>
-    <meta name="description" content="🚌 {terminal_name} 터미널에서 출발하는 시외버스 시간표를 확인하세요. {len(destinations)}개 목적지로 가는 버스 시간표를 한눈에 볼 수 있습니다.">
-    <meta name="keywords" content="{terminal_name} 터미널, {terminal_name} 시외버스, {terminal_name} 버스 시간표, 시외버스 시간표">
+    <title>{page['title']} | {page['count']}</title>
+    <meta name="description" content="{page['description']}">
+    <meta name="keywords" content="{page['keywords']}">
     <meta name="robots" content="index, follow">
     <meta name="author" content="버스 시간표 서비스">
 
     <!-- 🔗 Canonical URL -->
-    <link rel="canonical" href="https://bus.medilocator.co.kr/{terminal_name}-터미널-시외버스-시간표">
+    <link rel="canonical" href="https://bus.medilocator.co.kr/{page['slug']}">
 
     <!-- 📱 Open Graph -->
-    <meta property="og:title" content="{terminal_name} 터미널 시외버스 시간표 | {len(destinations)}개 노선">
-    <meta property="og:description" content="{terminal_name} 터미널에서 출발하는 시외버스 시간표를 확인하세요. {len(destinations)}개 목적지로 가는 버스 시간표를 제공합니다.">
+    <meta property="og:title" content="{page['title']} | {page['count']}">
+    <meta property="og:description" content="{page['og_description']}">
     <meta property="og:type" content="website">
-    <meta property="og:url" content="https://bus.medilocator.co.kr/{terminal_name}-터미널-시외버스-시간표">
+    <meta property="og:url" content="https://bus.medilocator.co.kr/{page['slug']}">
     <meta property="og:image" content="https://bus.medilocator.co.kr/images/bus.jpg">
     <meta property="og:site_name" content="전국 시외버스 시간표">
     <meta property="og:locale" content="ko_KR">
@@ -166,8 +288,7 @@ def generate_terminal_page(terminal_name, destinations):
     <meta name="theme-color" content="#2563eb">
     
     <!-- 📱 Font & Icons -->
-    <link href="https://fonts.googleapis.com/css2?family=Pretendard:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    {assets.asset_links()}{page.get('alternates', '')}
     
     <style>
         * {{
@@ -465,9 +586,9 @@ def generate_terminal_page(terminal_name, destinations):
     {{
         "@context": "https://schema.org",
         "@type": "WebSite",
-        "name": "{terminal_name} 터미널 시외버스 시간표",
-        "description": "{terminal_name} 터미널에서 출발하는 시외버스 시간표 정보를 제공합니다.",
-        "url": "https://bus.medilocator.co.kr/{terminal_name}-터미널-시외버스-시간표",
+        "name": "{page['title']}",
+        "description": "{page['jsonld_description']}",
+        "url": "https://bus.medilocator.co.kr/{page['slug']}",
         "publisher": {{
             "@type": "Organization",
             "name": "버스 시간표 서비스"
@@ -480,20 +601,20 @@ def generate_terminal_page(terminal_name, destinations):
         <!-- 🎯 메인 헤더 -->
         <div class="main-header">
             <div class="header-content">
-                <h1><i class="fas fa-bus"></i> {terminal_name} 터미널</h1>
+                <h1><i class="fas fa-bus"></i> {page['heading']}</h1>
                 <p class="subtitle">시외버스 시간표 및 노선 안내</p>
             </div>
             <div class="breadcrumb">
                 <a href="/"><i class="fas fa-home"></i> 홈</a>
                 <i class="fas fa-chevron-right"></i>
-                <span>{terminal_name} 터미널</span>
+                <span>{page['heading']}</span>
             </div>
         </div>
 
         <!-- 🔍 검색 섹션 -->
         <div class="search-section">
             <div class="search-box">
-                <input type="text" class="search-input" id="searchInput" placeholder="목적지를 검색하세요... (예: 서울, 부산, 대전)">
+                <input type="text" class="search-input" id="searchInput" placeholder="{page['search_placeholder']}">
                 <i class="fas fa-search search-icon"></i>
             </div>
         </div>
@@ -501,30 +622,34 @@ def generate_terminal_page(terminal_name, destinations):
         <!-- 🚌 노선 목록 -->
         <div class="routes-section">
             <h2 class="routes-title">
-                <i class="fas fa-route"></i> 운행 노선
-                <span class="routes-count">{len(destinations)}개 노선</span>
+                <i class="fas fa-route"></i> {page['section_title']}
+                <span class="routes-count">{page['count']}</span>
             </h2>
-            <p class="routes-subtitle">{terminal_name}에서 출발하는 시외버스 노선을 선택하여 시간표를 확인하세요</p>
+            <p class="routes-subtitle">{page['section_subtitle']}</p>
             
             <div class="routes-grid" id="routesGrid">'''
 
-    if destinations:
-        for destination in destinations:
-            html_content += f'''
-                <a href="{destination['url']}" class="route-card" data-destination="{destination['arrival']}">
+    route_cards = ""
+    if cards:
+        for card in cards:
+            route_cards += f'''
+                <a href="{card['url']}" class="route-card" data-destination="{card['key']}">
                     <div class="route-text">
                         <i class="fas fa-map-marker-alt"></i>
-                        {destination['arrival']} 시간표
+                        {card['label']}{page.get('card_suffix', ' 시간표')}
                     </div>
                     <i class="fas fa-chevron-right route-arrow"></i>
                 </a>'''
     else:
-        html_content += '''
+        route_cards += '''
                 <div class="no-routes">
                     <i class="fas fa-bus"></i>
                     <h3>운행 중인 노선이 없습니다</h3>
                     <p>현재 이 터미널에서 운행하는 시외버스 노선이 없습니다.</p>
                 </div>'''
+    html_content += route_cards
+    if fragments is not None:
+        fragments["related_links"] = route_cards
 
     html_content += f'''
             </div>
@@ -538,8 +663,8 @@ def generate_terminal_page(terminal_name, destinations):
 
     <!-- 📝 푸터 -->
     <div class="footer">
-        <p>&copy; 2025 전국 시외버스 시간표. 최신 업데이트: {datetime.now().strftime('%Y년 %m월 %d일')}</p>
-        <p><a href="/sitemap.xml">사이트맵</a> | <a href="/rss.xml">RSS</a> | <a href="/">메인으로</a></p>
+        <p>&copy; 2025 전국 시외버스 시간표. 최신 업데이트: {locales.format_date(datetime.now(), locale)}</p>
+        <p><a href="/sitemap.xml">사이트맵</a> | <a href="/rss.xml">RSS</a> | <a href="/전국-시외버스-통계">전국 통계</a> | <a href="/">메인으로</a></p>
     </div>
 
     <script>
@@ -574,26 +699,105 @@ def generate_terminal_page(terminal_name, destinations):
             }});
         }});
     </script>
+    {service_worker.registration_script(page['sw_terminal'])}
 </body>
 </html>'''
 
-    return html_content
+    return locales.translate(html_content, locale, "hub")
+
+def write_terminal_page(terminal_name, destinations, manifest_entries=None, minify_pages=False, size_stats=None,
+                        page_sizes=None, locale=locales.default_locale, page_locales=(locales.default_locale,)):
+    """터미널 페이지를 outputs 폴더에 저장하고 파일 경로를 반환합니다. (page_locales는 hreflang 링크를 걸 언어들)"""
+    page, cards = terminal_hub(terminal_name, destinations, locale)
+    page['alternates'] = locales.alternate_links(f"{terminal_name}-터미널-시외버스-시간표", page_locales)
+    return write_hub_page(terminal_name, page, cards, manifest_entries, minify_pages, size_stats, page_sizes, locale)
+
+def write_hub_page(key, page, cards, manifest_entries=None, minify_pages=False, size_stats=None, page_sizes=None,
+                   locale=locales.default_locale):
+    """허브 페이지(출발 터미널·도착지·운행회사)를 outputs 폴더에 저장하고 파일 경로를 반환합니다.
+
+    page_sizes가 주어지면 CSS·JS·JSON-LD·노선 카드별 바이트 수를 기록합니다 (size_report.py 리포트용).
+    """
+    # HTML 생성
+    fragments = {}
+    html_content = generate_hub_page(page, cards, fragments, locale)
+    route_cards = fragments["related_links"]
+    
+    # HTML 압축 (공백·주석 제거, JSON-LD 압축)
+    if minify_pages:
+        raw_size = len(html_content.encode('utf-8'))
+        html_content = minify.minify_html(html_content)
+        if size_stats is not None:
+            minify.record_savings(size_stats, "hubs", raw_size, len(html_content.encode('utf-8')))
+        if page_sizes is not None:
+            route_cards = minify.minify_html(route_cards)
+    
+    # 파일명 생성
+    filename = f"{page['slug']}.html"
+    output_file = f"outputs/{filename}"
+    
+    # 파일 저장
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+    
+    if manifest_entries is not None:
+        manifest_entries[filename] = manifest.file_entry(html_content, "hubs")
+    if page_sizes is not None:
+        # 허브는 템플릿 없이 한 번에 만든 문자열이라 인라인 블록은 렌더링한 문자열에서 잼
+        page_sizes[filename] = dict(
+            size_report.html_breakdown(html_content, {"related_links": len(route_cards.encode('utf-8'))}),
+            terminal=key
+        )
+    
+    return output_file
+
+def fix_route_links(routes, link_targets=None):
+    """노선 카드 링크를 실제로 만들어진 노선 페이지 주소로 고치고, 페이지가 없는 노선은 뺍니다.
 
-def generate_all_terminal_pages():
-    """모든 터미널 페이지를 생성합니다."""
+    link_targets(app.collect_link_targets)를 넘기지 않으면 데이터 파일에서 새로 계산합니다.
+    """
+    import app  # app이 이 모듈을 불러오므로 필요할 때만 불러옴
+    
+    if link_targets is None:
+        link_targets = app.collect_link_targets()
+    fixed = []
+    for route in routes:
+        slug = app.route_slug(route['departure'], route['arrival'])
+        if slug in link_targets:
+            fixed.append(dict(route, filename=f"{slug}.html", url=f"/{slug}"))
+    if len(fixed) != len(routes):
+        print(f"🔗 페이지가 없는 노선 {len(routes) - len(fixed)}개를 허브 링크에서 제외했습니다.")
+    return fixed
+
+def generate_all_terminal_pages(minify_pages=False, shard_spec=None, fix_links=False,
+                                page_locales=(locales.default_locale,)):
+    """모든 터미널 페이지와 도착지·운행회사 허브를 생성합니다. (shard_spec=(i, N)이면 i번째 샤드 담당 페이지만)
+
+    출발 터미널 허브는 page_locales의 언어마다 만들고, 도착지·운행회사 허브는 기본 언어로만 만듭니다.
+    """
     
-    # 노선 데이터 로드
+    # 노선 데이터 로드 (색인은 전체 노선으로 한 번에 만듦)
     routes = load_route_data()
-    grouped_routes = group_routes_by_departure(routes)
+    if fix_links:
+        routes = fix_route_links(routes)
+    indexes = route_index.build_indexes(routes)
+    grouped_routes = group_routes_by_departure(
+        [route for route in routes if shard.in_shard(route['departure'], shard_spec)])
     
-    if not routes:
+    if not routes and not shard_spec:  # 샤드 빌드는 담당 출발지가 없어도 빈 결과 조각을 남김
         print("❌ 노선 데이터가 없습니다.")
         return
     
-    # outputs 폴더 생성
+    # outputs 폴더 생성 (기본 언어가 아닌 페이지는 언어 폴더에)
     os.makedirs('outputs', exist_ok=True)
+    for locale in page_locales:
+        os.makedirs(os.path.join('outputs', locales.locales[locale]["path"]), exist_ok=True)
     
     generated_count = 0
+    manifest_entries = {}
+    size_stats = {}
+    page_sizes = {}
+    index_page_sizes = {"arrivals": {}, "operators": {}}
     
     print(f"🏗️ {len(grouped_routes)}개 터미널 페이지 생성 시작...")
     
@@ -601,31 +805,46 @@ def generate_all_terminal_pages():
     for terminal_name, destinations in grouped_routes.items():
         print(f"📝 {terminal_name} 터미널 페이지 생성 중... ({len(destinations)}개 노선)")
         
-        # HTML 생성
-        html_content = generate_terminal_page(terminal_name, destinations)
-        
-        # 파일명 생성
-        filename = f"{terminal_name}-터미널-시외버스-시간표.html"
-        output_file = f"outputs/{filename}"
-        
-        # 파일 저장
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        # 파일이 실제로 생성되었는지 확인
-        if os.path.exists(output_file):
-            file_size = os.path.getsize(output_file)
-            print(f"✅ {terminal_name} 터미널 페이지 생성 완료 ({len(destinations)}개 노선, {file_size:,} bytes)")
-            generated_count += 1
-        else:
-            print(f"❌ {terminal_name} 터미널 페이지 생성 실패")
+        for locale in page_locales:
+            output_file = write_terminal_page(terminal_name, destinations, manifest_entries, minify_pages, size_stats,
+                                              page_sizes, locale, page_locales)
+            
+            # 파일이 실제로 생성되었는지 확인
+            if os.path.exists(output_file):
+                file_size = os.path.getsize(output_file)
+                language = "" if locale == locales.default_locale else f"{locale}, "
+                print(f"✅ {terminal_name} 터미널 페이지 생성 완료 ({language}{len(destinations)}개 노선, {file_size:,} bytes)")
+                generated_count += 1
+            else:
+                print(f"❌ {terminal_name} 터미널 페이지 생성 실패")
     
-    print(f"🎉 총 {generated_count}개 터미널 페이지 생성 완료!")
+    # 🔎 도착지 허브·운행회사 페이지 (색인 한 번 찾기 = 페이지 하나)
+    index_pages = {"arrivals": arrival_hub, "operators": operator_hub}
+    for kind, build_page in index_pages.items():
+        keys = [key for key in indexes[kind] if shard.in_shard(key, shard_spec)]
+        print(f"🏗️ {size_report.stage_labels[kind]} {len(keys)}개 생성 시작...")
+        for key in keys:
+            page, cards = build_page(key, indexes[kind][key])
+            write_hub_page(key, page, cards, manifest_entries, minify_pages, size_stats, index_page_sizes[kind])
+        print(f"✅ {size_report.stage_labels[kind]} {len(keys)}개 생성 완료")
+        generated_count += len(keys)
+    
+    if shard_spec:
+        shard.save_fragment("hubs", shard_spec, manifest_entries, size_stats=size_stats)
+    else:
+        manifest.record_stage("hubs", manifest_entries)
+    size_report.save_records("hubs", shard_spec, page_sizes)
+    for kind, records in index_page_sizes.items():
+        size_report.save_records(kind, shard_spec, records)
+    print(f"🎉 총 {generated_count}개 허브 페이지 생성 완료!")
+    if size_stats:
+        minify.print_savings(size_stats)
     
     # 생성된 파일들 확인
     print("📁 outputs 폴더 최종 상태:")
     terminal_files = glob.glob('outputs/*-터미널-시외버스-시간표.html')
     route_files = glob.glob('outputs/*-에서-*-가는-시외버스-시간표.html')
+    operator_files = glob.glob('outputs/*-시외버스-노선.html')
     other_files = glob.glob('outputs/*.json') + glob.glob('outputs/*.xml') + glob.glob('outputs/*.txt')
     
     print(f"   🏢 터미널 페이지: {len(terminal_files)}개")
@@ -633,17 +852,41 @@ def generate_all_terminal_pages():
         print(f"      - {os.path.basename(tf)}")
     
     print(f"   🚌 노선 페이지: {len(route_files)}개")
+    print(f"   📍 도착지 허브: {len(glob.glob('outputs/*-가는-시외버스-시간표.html')) - len(route_files)}개")
+    print(f"   🚍 운행회사 페이지: {len(operator_files)}개")
     print(f"   📄 기타 파일: {len(other_files)}개")
     
     return generated_count
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="터미널 허브 페이지 생성")
+    parser.add_argument("--minify", action="store_true", help="공백·주석 제거 및 JSON-LD 압축으로 HTML 크기 줄이기")
+    parser.add_argument("--shard", type=shard.parse_shard, metavar="i/N",
+                        help="출발지를 N개로 나눠 i번째만 생성 (결과는 python shard.py merge로 병합)")
+    parser.add_argument("--fix-links", action="store_true", help="노선 페이지가 없는 카드는 빼고 주소는 파일명에 맞추기")
+    parser.add_argument("--locales", type=locales.parse_locales, default=(locales.default_locale,), metavar="ko,en",
+                        help="출발 터미널 허브를 만들 언어 (쉼표로 구분, 도착지·운행회사 허브는 기본 언어만)")
+    parser.add_argument("--profile", nargs="?", const=profiler.default_folder, metavar="DIR",
+                        help=f"허브 생성 단계 cProfile 결과 저장 (기본 폴더: {profiler.default_folder})")
+    parser.add_argument("--memprofile", nargs="?", const=profiler.default_folder, metavar="DIR",
+                        help=f"허브 생성 단계 tracemalloc 메모리 기록 (기본 폴더: {profiler.default_folder})")
+    args = parser.parse_args()
+    if args.profile:
+        profiler.start(args.profile, profiler.process_label("hub", args.shard))
+    if args.memprofile:
+        profiler.start_memory(args.memprofile, profiler.process_label("hub", args.shard))
+    
     print("🚀 터미널 페이지 생성 시작...")
     
     try:
-        generate_all_terminal_pages()
+        with profiler.stage("hub"):
+            generate_all_terminal_pages(args.minify, args.shard, args.fix_links, args.locales)
+        profiler.snapshot("hub")
         print("🎉 모든 터미널 페이지 생성 완료!")
         
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
         exit(1)
+    finally:
+        profiler.save()
+        profiler.save_memory()
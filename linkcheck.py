@@ -0,0 +1,127 @@
+import os
+import re
+import json
+import time
+import argparse
+from urllib.parse import unquote
+from concurrent.futures import ProcessPoolExecutor
+
+import locales
+
+# 📂 검사 대상
+output_folder = "outputs"
+report_file = os.path.join(output_folder, "link_report.json")  # 배포하지 않는 빌드 산출물
+site_url = "https://bus.medilocator.co.kr/"
+
+# 🏠 outputs에 없지만 저장소 루트에 직접 관리하는 경로 (index.html 등)
+static_paths = {"/", "/index.html", "/CNAME"}
+
+href_pattern = re.compile(r"""href=["']([^"']+)["']""")
+default_workers = os.cpu_count() or 1
+
+def page_index(folders):
+    """폴더들의 모든 파일 → 존재하는 경로 집합 (HTML은 확장자 없는 주소도 포함)"""
+    paths = set(static_paths)
+    for folder in folders:
+        for root, dirs, files in os.walk(folder):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            for name in files:
+                relative = os.path.relpath(os.path.join(root, name), folder).replace(os.sep, "/")
+                paths.add("/" + relative)
+                if relative.endswith(".html"):
+                    paths.add("/" + relative[:-len(".html")])
+    return paths
+
+def internal_path(href):
+    """href → 사이트 내부 경로 (외부 링크·앵커·스크립트면 None)"""
+    if href.startswith(site_url):
+        href = "/" + href[len(site_url):]
+    if not href.startswith("/") or href.startswith("//"):
+        return None
+    return unquote(href.split("#", 1)[0].split("?", 1)[0]) or "/"
+
+def page_links(html):
+    """HTML 내용의 내부 링크 목록 (중복 제거, 나온 순서 유지)"""
+    return list(dict.fromkeys(path for path in map(internal_path, href_pattern.findall(html)) if path))
+
+_index = None
+_folder = None
+
+def _init_worker(index, folder):
+    global _index, _folder
+    _index, _folder = index, folder
+
+def check_pages(paths):
+    """페이지 파일 목록 검사 → ({페이지: [깨진 링크]}, 검사한 링크 수) (작업 프로세스에서 실행)
+
+    페이지는 검사 폴더 기준 경로로 적습니다 (en/X.html과 X.html이 겹치지 않게).
+    """
+    broken = {}
+    checked = 0
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            links = page_links(f.read())
+        checked += len(links)
+        missing = [link for link in links if link not in _index]
+        if missing:
+            broken[os.path.relpath(path, _folder).replace(os.sep, "/")] = missing
+    return broken, checked
+
+def check_site(folder=output_folder, extra_roots=(), workers=default_workers, chunk_size=200):
+    """사이트 전체 내부 링크 검사 → {"pages", "links", "broken": {페이지: [깨진 링크]}, "seconds"}"""
+    started = time.perf_counter()
+    index = page_index([folder, *extra_roots])
+    # 🌐 언어 폴더(outputs/en/ 등)의 페이지도 함께 검사
+    page_folders = [os.path.join(folder, settings["path"]) for settings in locales.locales.values()]
+    pages = sorted(os.path.join(page_folder, name) for page_folder in page_folders if os.path.isdir(page_folder)
+                   for name in os.listdir(page_folder) if name.endswith(".html"))
+    chunks = [pages[i:i + chunk_size] for i in range(0, len(pages), chunk_size)]
+
+    broken = {}
+    checked = 0
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(index, folder)) as executor:
+            results = list(executor.map(check_pages, chunks))
+    else:
+        _init_worker(index, folder)
+        results = [check_pages(chunk) for chunk in chunks]
+    for chunk_broken, chunk_checked in results:
+        broken.update(chunk_broken)
+        checked += chunk_checked
+
+    return {"pages": len(pages), "links": checked, "broken": dict(sorted(broken.items())),
+            "seconds": round(time.perf_counter() - started, 3)}
+
+def print_report(report, limit=20):
+    """검사 결과 출력 (깨진 링크가 많으면 앞의 limit개 페이지만)"""
+    broken_links = sum(len(links) for links in report["broken"].values())
+    print(f"🔗 내부 링크 검사: 페이지 {report['pages']:,}개 | 링크 {report['links']:,}개 | "
+          f"{report['seconds']:.2f}초")
+    if not report["broken"]:
+        print("✅ 깨진 내부 링크가 없습니다.")
+        return
+    print(f"⚠️  깨진 링크 {broken_links:,}개 (페이지 {len(report['broken']):,}개)")
+    for page, links in list(report["broken"].items())[:limit]:
+        print(f"   📄 {page}")
+        for link in links:
+            print(f"      ❌ {link}")
+    if len(report["broken"]) > limit:
+        print(f"   ... 외 {len(report['broken']) - limit}개 페이지")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사이트 전체 내부 링크 검사 (생성된 페이지 목록과 대조)")
+    parser.add_argument("--folder", default=output_folder, help=f"검사할 폴더 (기본값: {output_folder})")
+    parser.add_argument("--root", action="append", default=[], metavar="DIR",
+                        help="링크 대상으로 인정할 추가 폴더 (예: 배포 루트 .)")
+    parser.add_argument("--workers", type=int, default=default_workers, help=f"검사 프로세스 수 (기본값: {default_workers})")
+    parser.add_argument("--report", default=report_file, help=f"결과 JSON 경로 (기본값: {report_file})")
+    parser.add_argument("--strict", action="store_true", help="깨진 링크가 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    report = check_site(args.folder, args.root, args.workers)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print_report(report)
+    print(f"📄 결과 저장: {args.report}")
+    if args.strict and report["broken"]:
+        exit(1)
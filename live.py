@@ -0,0 +1,131 @@
+import os
+import re
+import io
+import json
+import glob
+import time
+import argparse
+import contextlib
+from datetime import datetime, timezone
+
+import app
+import manifest
+
+# 📂 실시간 좌석 파일 경로 (페이지와 별도로 live/{출발지}.json만 자주 갱신)
+live_folder = os.path.join("outputs", "live")
+
+seats_pattern = re.compile(r"(\d+)\s*석(?:\s*/\s*총\s*(\d+)\s*석)?")
+fare_pattern = re.compile(r"[\d,]+")
+
+def parse_seats(text):
+    """'41석/총41석' → (41, 41), '12석' → (12, None) (알 수 없으면 (None, None))"""
+    match = seats_pattern.search(str(text or ""))
+    if not match:
+        return None, None
+    return int(match.group(1)), int(match.group(2)) if match.group(2) else None
+
+def parse_fare(text):
+    """'15,000원' → 15000 (알 수 없으면 None)"""
+    match = fare_pattern.search(str(text or ""))
+    if not match or not match.group(0).replace(",", ""):
+        return None
+    return int(match.group(0).replace(",", ""))
+
+def terminal_overlay(schedules):
+    """출발지 하나의 {도착지: [버스 데이터]} → {도착지: {출발 ID: {seats, total, fare}}}
+
+    출발 ID는 노선 페이지의 행(data-dep)과 같은 규칙(app.assign_departure_ids)으로 만듭니다.
+    """
+    overlay = {}
+    for destination, buses in schedules.items():
+        buses = [bus for bus in buses or [] if bus.get('TIM_TIM') or bus.get('출발시각')]
+        if not app.has_live_fields(buses):
+            continue
+        fields = [app.departure_fields(bus) for bus in buses]
+        dep_ids = app.assign_departure_ids([f[0] for f in fields], [f[2] for f in fields])
+        departures = {}
+        for dep_id, bus in zip(dep_ids, buses):
+            seats, total = parse_seats(bus.get('잔여좌석'))
+            fare = parse_fare(bus.get('어른요금'))
+            if seats is None and fare is None:
+                continue
+            departures[dep_id] = {"seats": seats, "total": total, "fare": fare}
+        if departures:
+            overlay[str(destination)] = departures
+    return overlay
+
+def load_schedules(json_file_path):
+    """데이터 파일 하나 → {도착지: [버스 데이터]} (변환 로그는 생략)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        bus_data = app.read_bus_data(json_file_path)
+        return app.normalize_schedules(bus_data) if bus_data is not None else None
+
+def load_previous(path):
+    """이미 써 둔 좌석 파일의 departures 부분 (없으면 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("departures")
+    except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+        return None
+
+def refresh(output_folder=live_folder, data_folder=app.data_folder, mtimes=None):
+    """바뀐 데이터 파일만 다시 읽어 좌석 파일 갱신 → (갱신 수, 확인한 파일 수)
+
+    mtimes에 파일별 수정 시각을 기록해 두면 다음 호출 때 그대로인 파일은 읽지 않습니다.
+    """
+    mtimes = {} if mtimes is None else mtimes
+    os.makedirs(output_folder, exist_ok=True)
+    updated = checked = 0
+    for json_file_path in sorted(glob.glob(os.path.join(data_folder, "*_schedules.json"))):
+        mtime = os.path.getmtime(json_file_path)
+        if mtimes.get(json_file_path) == mtime:
+            continue
+        mtimes[json_file_path] = mtime
+        checked += 1
+
+        schedules = load_schedules(json_file_path)
+        if schedules is None:
+            continue
+        overlay = terminal_overlay(schedules)
+        terminal = app.terminal_name_from_path(json_file_path)
+        path = os.path.join(output_folder, f"{terminal}.json")
+        if not overlay:
+            if os.path.exists(path):
+                os.remove(path)
+            continue
+        if load_previous(path) == overlay:
+            continue
+
+        content = json.dumps({
+            "terminal": terminal,
+            "updated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "departures": overlay,
+        }, ensure_ascii=False, separators=(",", ":"))
+        manifest.atomic_write(path, content)
+        updated += 1
+        print(f"   🪑 {terminal}: {sum(len(d) for d in overlay.values())}개 출발 좌석 정보 갱신 "
+              f"({len(content.encode('utf-8')):,} bytes)")
+    return updated, checked
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="잔여좌석·요금 실시간 파일(live/{출발지}.json) 생성 - 페이지는 다시 만들지 않음")
+    parser.add_argument("--output", default=live_folder, help=f"좌석 파일 폴더 (기본값: {live_folder})")
+    parser.add_argument("--interval", type=float, default=0,
+                        help=f"N초마다 반복 갱신 (기본값: 한 번만 실행, 페이지는 {app.live_poll_seconds}초마다 다시 읽음)")
+    args = parser.parse_args()
+
+    mtimes = {}
+    print(f"🪑 실시간 좌석 파일 생성: {args.output}/")
+    updated, checked = refresh(args.output, mtimes=mtimes)
+    print(f"✅ 확인 {checked}개, 갱신 {updated}개")
+
+    if args.interval > 0:
+        print(f"🔄 {args.interval}초마다 데이터 변경을 확인합니다. (Ctrl+C로 종료)")
+        try:
+            while True:
+                time.sleep(args.interval)
+                updated, checked = refresh(args.output, mtimes=mtimes)
+                if checked:
+                    print(f"[{datetime.now().strftime('%H:%M:%S')}] 확인 {checked}개, 갱신 {updated}개")
+        except KeyboardInterrupt:
+            print("\n👋 실시간 좌석 갱신을 종료합니다.")
@@ -0,0 +1,281 @@
+import re
+import argparse
+from functools import lru_cache
+
+# 🌐 다국어 페이지 설정
+#   기본 언어(ko)는 지금처럼 사이트 루트에, 다른 언어는 언어 폴더(outputs/en/)에 같은 파일명으로 만듭니다.
+#   언어를 추가하려면 locales·labels·translations에 항목을 더하면 됩니다.
+site_url = "https://bus.medilocator.co.kr/"
+default_locale = "ko"
+
+locales = {
+    "ko": {"path": "", "lang": "ko", "og_locale": "ko_KR"},
+    "en": {"path": "en/", "lang": "en", "og_locale": "en_US"},
+}
+
+# 🏷️ 코드에서 만드는 문구 (템플릿 밖)
+labels = {
+    "ko": {
+        "no_info": "정보 없음",
+        "via_before": "이 노선 버스는 <strong>{stops}</strong>도 경유합니다.",
+        "via_after": "일부 버스는 {arr} 이후 <strong>{stops}</strong>까지 운행합니다.",
+        "trip_name": "{dep}에서 {arr} 가는 시외버스 시간표",
+        "trip_description": "{dep}에서 {arr} 가는 시외버스 시간표, 요금, 소요시간 정보",
+        "station": "{name} 터미널",
+        # 출발 터미널 허브 (hub.terminal_hub)
+        "hub_title": "{name} 터미널 시외버스 시간표",
+        "hub_count": "{count}개 노선",
+        "hub_description": "🚌 {name} 터미널에서 출발하는 시외버스 시간표를 확인하세요. {count}개 목적지로 가는 버스 시간표를 한눈에 볼 수 있습니다.",
+        "hub_og_description": "{name} 터미널에서 출발하는 시외버스 시간표를 확인하세요. {count}개 목적지로 가는 버스 시간표를 제공합니다.",
+        "hub_keywords": "{name} 터미널, {name} 시외버스, {name} 버스 시간표, 시외버스 시간표",
+        "hub_heading": "{name} 터미널",
+        "hub_jsonld_description": "{name} 터미널에서 출발하는 시외버스 시간표 정보를 제공합니다.",
+        "hub_search_placeholder": "목적지를 검색하세요... (예: 서울, 부산, 대전)",
+        "hub_section_title": "운행 노선",
+        "hub_section_subtitle": "{name}에서 출발하는 시외버스 노선을 선택하여 시간표를 확인하세요",
+        "hub_card_suffix": " 시간표",
+    },
+    "en": {
+        "no_info": "N/A",
+        "via_before": "Buses on this route also stop at <strong>{stops}</strong>.",
+        "via_after": "Some buses continue past {arr} to <strong>{stops}</strong>.",
+        "trip_name": "{dep} to {arr} Intercity Bus Timetable",
+        "trip_description": "Intercity bus timetable, fares and travel time from {dep} to {arr}",
+        "station": "{name} Terminal",
+        "hub_title": "{name} Terminal Intercity Bus Timetable",
+        "hub_count": "{count} routes",
+        "hub_description": "🚌 Intercity bus timetables from {name} Terminal. See the timetables for all {count} destinations at a glance.",
+        "hub_og_description": "Intercity bus timetables from {name} Terminal for {count} destinations.",
+        "hub_keywords": "{name} Terminal, {name} intercity bus, {name} bus timetable, Korea intercity bus timetable",
+        "hub_heading": "{name} Terminal",
+        "hub_jsonld_description": "Intercity bus timetables departing from {name} Terminal.",
+        "hub_search_placeholder": "Search destinations... (e.g. Seoul, Busan, Daejeon)",
+        "hub_section_title": "Routes",
+        "hub_section_subtitle": "Choose a route from {name} to see its timetable",
+        "hub_card_suffix": " timetable",
+    },
+}
+
+# 📝 템플릿 문구 번역 (한국어 원문 → 번역, 원문이 들어 있는 템플릿에만 적용)
+#   route: app.py 노선 페이지 템플릿·조각, hub: hub.py 허브 페이지
+#   {dep_name}·{arr_name}·{to_name}은 화면에 보이는 지명(로마자), {dep_terminal} 등은 주소용 원래 이름입니다.
+translations = {
+    "en": {
+        "route": [
+            ('<html lang="ko">', '<html lang="en">'),
+            ('<title>{dep_terminal}에서 {arr_terminal} 가는 시외버스 시간표 | 첫차·막차·소요시간</title>',
+             '<title>{dep_name} to {arr_name} Intercity Bus Timetable | First/Last Bus, Travel Time</title>'),
+            ('content="🚍 {dep_terminal}에서 {arr_terminal} 가는 최신 시외버스 시간표입니다. 총 {bus_count}회 운행 중이며, '
+             '첫차 {first_bus}, 막차 {last_bus}로 운행됩니다. 요금과 소요시간을 확인하고 빠르게 예매하세요."',
+             'content="🚍 Latest intercity bus timetable from {dep_name} to {arr_name}. {bus_count} departures a day, '
+             'first bus {first_bus}, last bus {last_bus}. Check the travel time and book your seat."'),
+            ('content="{dep_terminal} {arr_terminal} 시외버스, {dep_terminal} {arr_terminal} 버스 시간표, '
+             '{dep_terminal} {arr_terminal} 버스 요금, {dep_terminal} {arr_terminal} 버스 예매"',
+             'content="{dep_name} {arr_name} intercity bus, {dep_name} to {arr_name} bus timetable, '
+             '{dep_name} {arr_name} bus fare, {dep_name} {arr_name} bus booking"'),
+            ('content="버스 시간표 서비스"', 'content="Bus Timetable Service"'),
+            ('href="https://bus.medilocator.co.kr/{dep_terminal}-에서-',
+             'href="https://bus.medilocator.co.kr/en/{dep_terminal}-에서-'),
+            ('content="{dep_terminal}에서 {arr_terminal} 가는 시외버스 시간표"',
+             'content="{dep_name} to {arr_name} Intercity Bus Timetable"'),
+            ('content="🚍 {dep_terminal}에서 {arr_terminal} 가는 최신 시외버스 시간표를 확인하고 빠르게 예매하세요!"',
+             'content="🚍 Check the latest intercity bus timetable from {dep_name} to {arr_name} and book quickly!"'),
+            ('content="https://bus.medilocator.co.kr/{dep_terminal}-에서-',
+             'content="https://bus.medilocator.co.kr/en/{dep_terminal}-에서-'),
+            ('<meta property="og:site_name" content="버스 시간표">',
+             '<meta property="og:site_name" content="Korea Bus Timetable">'),
+            ('<meta property="og:locale" content="ko_KR">', '<meta property="og:locale" content="en_US">'),
+            ('{dep_terminal}에서 {arr_terminal}가는 버스 시간표</h1>', '{dep_name} → {arr_name} Bus Timetable</h1>'),
+            ('<p class="subtitle">시외버스 시간표 및 예매 안내</p>',
+             '<p class="subtitle">Intercity bus timetable and booking guide</p>'),
+            ('</i> 기준 연도</div>', '</i> Year</div>'),
+            ('>{year}년</div>', '>{year}</div>'),
+            ('</i> 일일 운행 횟수</div>', '</i> Daily departures</div>'),
+            ('>{bus_count}회</div>', '>{bus_count}</div>'),
+            ('</i> 첫차 시간</div>', '</i> First bus</div>'),
+            ('</i> 막차 시간</div>', '</i> Last bus</div>'),
+            ('</i> 평균 소요시간</div>', '</i> Average travel time</div>'),
+            ('</i> 출발 터미널</div>', '</i> Departure terminal</div>'),
+            ('                                {dep_terminal}\n                            </a>',
+             '                                {dep_name}\n                            </a>'),
+            ('본 페이지는 <strong>버스타고</strong>, <strong>코버스</strong>, <strong>티머니</strong>의 공식 정보를 바탕으로 \n'
+             '                    최신 버스 시간표를 제공합니다. 정확한 운행 일정과 요금을 확인 후 예매하시기 바랍니다.',
+             'This page is based on official information from <strong>Bustago</strong>, <strong>Kobus</strong> and '
+             '<strong>T-money</strong>. \n                    Please confirm the schedule and fare before booking.'),
+            ('</i> 상세 시간표</h2>', '</i> Full timetable</h2>'),
+            ('</i> 출발시간</th>', '</i> Departure</th>'),
+            ('</i> 소요시간</th>', '</i> Travel time</th>'),
+            ('</i> 운행회사</th>', '</i> Operator</th>'),
+            ('</i> 예매하기</th>', '</i> Booking</th>'),
+            ('<strong>최신 업데이트:</strong>', '<strong>Updated:</strong>'),
+            ('<strong>발행일:</strong>', '<strong>Published:</strong>'),
+            ('<strong>수정일:</strong>', '<strong>Modified:</strong>'),
+            ('</i> 빠른 예매하기</h2>', '</i> Book tickets</h2>'),
+            ('아래 공식 예매 사이트에서 실시간 좌석을 확인하고 예약하세요',
+             'Check live seat availability and book on the official sites below'),
+            ('<span>버스타고</span>', '<span>Bustago</span>'),
+            ('<span>티머니</span>', '<span>T-money</span>'),
+            ('<span>코버스</span>', '<span>Kobus</span>'),
+            ('</i> {dep_terminal} 전체 노선 보기</h2>', '</i> All routes from {dep_name}</h2>'),
+            ('{dep_terminal}에서 출발하는 모든 버스 노선을 한 번에 확인하세요',
+             'See every bus route departing from {dep_name} at a glance'),
+            ('<a href="/{dep_terminal}-터미널-시외버스-시간표"', '<a href="/en/{dep_terminal}-터미널-시외버스-시간표"'),
+            ('<span>{dep_terminal} 전체 시간표</span>', '<span>{dep_name} timetables</span>'),
+            ('</i> 기차 시간표도 확인해보세요</h2>', '</i> Compare with train timetables</h2>'),
+            ('버스 외에 기차 시간표도 함께 비교해서 더 편리한 교통편을 선택하세요',
+             'Compare bus and train timetables to choose the most convenient trip'),
+            ('<span>기차 시간표 확인하기</span>', '<span>Train timetables</span>'),
+            ('</i> 자주 묻는 질문 (FAQ)</h2>', '</i> Frequently asked questions</h2>'),
+            ('<span>{dep_terminal}에서 {arr_terminal} 가는 첫차와 막차는 몇 시인가요?</span>',
+             '<span>When are the first and last buses from {dep_name} to {arr_name}?</span>'),
+            ('<p>{dep_terminal}에서 {arr_terminal}로 가는 첫차는 <strong>{first_bus}</strong>이고, 막차는 '
+             '<strong>{last_bus}</strong>입니다. 주말이나 공휴일에는 운행 시간이 달라질 수 있으니 예매 전 확인하시기 바랍니다.</p>',
+             '<p>The first bus from {dep_name} to {arr_name} leaves at <strong>{first_bus}</strong> and the last at '
+             '<strong>{last_bus}</strong>. Times may differ on weekends and holidays, so please check before booking.</p>'),
+            ('<span>{dep_terminal}에서 {arr_terminal}까지 소요시간은 얼마나 걸리나요?</span>',
+             '<span>How long does it take from {dep_name} to {arr_name}?</span>'),
+            ('<p>{dep_terminal}에서 {arr_terminal}까지 평균 소요시간은 <strong>{avg_duration}</strong>입니다. '
+             '교통 상황이나 경유지에 따라 시간이 달라질 수 있습니다.</p>',
+             '<p>The average travel time from {dep_name} to {arr_name} is <strong>{avg_duration}</strong>. '
+             'It may vary with traffic and stops along the way.</p>'),
+            # 시간표 행
+            ('<i class="fas fa-ticket-alt"></i> 예매</a>', '<i class="fas fa-ticket-alt"></i> Book</a>'),
+            ('<span class="headway-info">매 {headway}분 · {count}회</span>',
+             '<span class="headway-info">every {headway} min · {count} trips</span>'),
+            ('<summary>전체 시간 보기</summary>', '<summary>All times</summary>'),
+            # 내부 링크·돌아오는 버스
+            ('<h3>🚌 {dep_terminal}에서 출발하는 다른 주요 노선</h3>', '<h3>🚌 Other routes from {dep_name}</h3>'),
+            ('<a href="/{dep_terminal}-에서-{to_slug}-가는-시외버스-시간표"',
+             '<a href="/en/{dep_terminal}-에서-{to_slug}-가는-시외버스-시간표"'),
+            ('<span class="route-text">{dep_terminal} → {to}</span>', '<span class="route-text">{dep_name} → {to_name}</span>'),
+            ('</i> 돌아오는 시간표</h2>', '</i> Return timetable</h2>'),
+            ('<p class="booking-subtitle"><strong>{arr_terminal}</strong>에서 <strong>{dep_terminal}</strong>로 가는 버스 시간표를 확인하세요</p>',
+             '<p class="booking-subtitle">Check buses from <strong>{arr_name}</strong> back to <strong>{dep_name}</strong></p>'),
+            ('href="https://bus.medilocator.co.kr/{return_slug}"', 'href="https://bus.medilocator.co.kr/en/{return_slug}"'),
+            ('<span>{arr_terminal} → {dep_terminal} 시간표</span>', '<span>{arr_name} → {dep_name} timetable</span>'),
+            # 실시간 좌석 스크립트
+            ("'잔여 '+x.seats", "'Seats '+x.seats"),
+            ("+'석':''", ":''"),
+            ("x.fare.toLocaleString()+'원'", "'₩'+x.fare.toLocaleString()"),
+        ],
+        "hub": [
+            ('<html lang="ko">', '<html lang="en">'),
+            ('<meta name="author" content="버스 시간표 서비스">', '<meta name="author" content="Bus Timetable Service">'),
+            ('<meta property="og:site_name" content="전국 시외버스 시간표">',
+             '<meta property="og:site_name" content="Korea Bus Timetable">'),
+            ('<meta property="og:locale" content="ko_KR">', '<meta property="og:locale" content="en_US">'),
+            ('"name": "버스 시간표 서비스"', '"name": "Bus Timetable Service"'),
+            ('<p class="subtitle">시외버스 시간표 및 노선 안내</p>',
+             '<p class="subtitle">Intercity bus timetables and routes</p>'),
+            ('<i class="fas fa-home"></i> 홈</a>', '<i class="fas fa-home"></i> Home</a>'),
+            ('<h3>운행 중인 노선이 없습니다</h3>', '<h3>No routes in service</h3>'),
+            ('<p>현재 이 터미널에서 운행하는 시외버스 노선이 없습니다.</p>',
+             '<p>There are currently no intercity bus routes from this terminal.</p>'),
+            ('title="메인으로 돌아가기"', 'title="Back to home"'),
+            ('2025 전국 시외버스 시간표. 최신 업데이트:', '2025 Korea Bus Timetable. Updated:'),
+            ('<a href="/sitemap.xml">사이트맵</a>', '<a href="/sitemap-en.xml">Sitemap</a>'),
+            ('<a href="/전국-시외버스-통계">전국 통계</a>', '<a href="/전국-시외버스-통계">Nationwide statistics</a>'),
+            ('<a href="/">메인으로</a>', '<a href="/">Home</a>'),
+        ],
+    },
+}
+
+# 🔤 한글 → 로마자 (국어의 로마자 표기법 기본 규칙, 자음 동화 등 발음 변화는 생략)
+initials = ["g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s", "ss", "", "j", "jj", "ch", "k", "t", "p", "h"]
+medials = ["a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae", "oe", "yo", "u", "wo", "we", "wi",
+           "yu", "eu", "ui", "i"]
+finals = ["", "k", "k", "k", "n", "n", "n", "t", "l", "k", "m", "l", "l", "l", "p", "l", "m", "p", "p", "t", "t",
+          "ng", "t", "t", "k", "t", "p", "t"]
+finals_before_vowel = ["", "g", "kk", "gs", "n", "nj", "n", "d", "r", "lg", "lm", "lb", "ls", "lt", "lp", "r", "m",
+                       "b", "bs", "s", "ss", "ng", "j", "ch", "k", "t", "p", ""]
+word_start = re.compile(r"(^|[\s(\-·,/0-9])([a-z])")
+
+def syllable_parts(char):
+    """한글 음절 → (초성, 중성, 종성) 번호 (한글이 아니면 None)"""
+    if not "가" <= char <= "힣":
+        return None
+    code = ord(char) - ord("가")
+    return code // 588, (code % 588) // 28, code % 28
+
+@lru_cache(maxsize=None)
+def romanize(name):
+    """지명 → 로마자 ('동광양(중마)' → 'Donggwangyang (Jungma)'), 한글이 아닌 글자는 그대로"""
+    parts = [syllable_parts(char) for char in name]
+    out = []
+    for i, char in enumerate(name):
+        part = parts[i]
+        if part is None:
+            out.append(" (" if char == "(" and out and not out[-1].endswith(" ") else char)
+            continue
+        initial, medial, final = part
+        following = parts[i + 1] if i + 1 < len(parts) else None
+        if initial == 5 and (i == 0 or parts[i - 1] is None):
+            out.append("r")  # 단어 첫 ㄹ
+        elif initial == 5 and parts[i - 1][2] == 8:
+            out.append("l")  # ㄹㄹ → ll
+        else:
+            out.append(initials[initial])
+        out.append(medials[medial])
+        if following is not None and following[0] == 11:
+            out.append(finals_before_vowel[final])  # 받침 뒤 ㅇ은 연음
+        else:
+            out.append(finals[final])
+    return word_start.sub(lambda match: match.group(1) + match.group(2).upper(), "".join(out))
+
+def place_name(name, locale):
+    """화면에 보여줄 지명 (기본 언어는 원래 이름)"""
+    return name if locale == default_locale else romanize(name)
+
+def label(locale, key, **values):
+    """코드에서 만드는 문구"""
+    return labels[locale][key].format(**values)
+
+def translate(text, locale, group):
+    """한국어 문구를 번역 (기본 언어면 그대로, 원문이 없는 항목은 건너뜀)"""
+    if locale == default_locale:
+        return text
+    for source, target in translations[locale][group]:
+        if source in text:
+            text = text.replace(source, target)
+    return text
+
+@lru_cache(maxsize=None)
+def localize(template, locale, group="route"):
+    """템플릿을 언어별로 한 번만 번역해 둠 (노선마다 다시 번역하지 않음)"""
+    return translate(template, locale, group)
+
+def format_duration(duration_min, locale):
+    """소요시간(분) → 'N시간 M분' / 'Nh Mm'"""
+    if locale == default_locale:
+        return f"{duration_min//60}시간 {duration_min%60}분"
+    return f"{duration_min//60}h {duration_min%60:02d}m"
+
+def format_date(date, locale):
+    """날짜 → '2025년 01월 31일' / 'January 31, 2025'"""
+    if locale == default_locale:
+        return date.strftime('%Y년 %m월 %d일')
+    return date.strftime('%B %d, %Y')
+
+def page_path(filename, locale):
+    """출력 파일 경로 (outputs 기준, 예: en/부산-에서-서울-가는-시외버스-시간표.html)"""
+    return locales[locale]["path"] + filename
+
+def alternate_links(slug, page_locales, separator="\n    "):
+    """hreflang 대체 링크 (언어가 하나면 빈 문자열, 검색엔진 기본은 기본 언어 페이지)
+
+    separator는 링크 앞에 붙는 줄바꿈·들여쓰기입니다 (압축한 페이지는 "").
+    """
+    if len(page_locales) < 2:
+        return ""
+    links = [f'{separator}<link rel="alternate" hreflang="{locales[locale]["lang"]}" href="{site_url}{locales[locale]["path"]}{slug}">'
+             for locale in page_locales]
+    links.append(f'{separator}<link rel="alternate" hreflang="x-default" href="{site_url}{locales[default_locale]["path"]}{slug}">')
+    return "".join(links)
+
+def parse_locales(text):
+    """'ko,en' → ('ko', 'en') (argparse type, 기본 언어는 항상 포함해 맨 앞에 둠)"""
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    unknown = [name for name in names if name not in locales]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"지원하지 않는 언어: {', '.join(unknown)} (가능: {', '.join(locales)})")
+    return tuple(dict.fromkeys([default_locale] + names))
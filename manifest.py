@@ -0,0 +1,84 @@
+import os
+import json
+import hashlib
+import tempfile
+
+# 📂 빌드 결과 목록 파일 (각 단계가 자신이 만든 파일을 기록)
+output_folder = "outputs"
+manifest_file = os.path.join(output_folder, "manifest.json")
+
+def content_hash(content):
+    """파일 내용(str 또는 bytes)의 sha256 해시"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+def file_entry(content, stage):
+    """매니페스트 항목 생성 (해시, 크기, 생성 단계)"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return {"sha256": content_hash(content), "size": len(content), "stage": stage}
+
+def file_entry_from_path(path, stage):
+    """디스크에 있는 파일로 매니페스트 항목 생성"""
+    with open(path, "rb") as f:
+        return file_entry(f.read(), stage)
+
+# 🔒 umask는 프로세스 전체 설정이라 조회하려고 바꾸는 순간 다른 스레드의 파일 생성에 영향을 줌
+#    → 불러올 때 한 번만 읽어 두고, 임시 파일 권한은 이 값으로 맞춤
+process_umask = os.umask(0)
+os.umask(process_umask)
+file_mode = 0o666 & ~process_umask
+
+def atomic_write(path, content):
+    """같은 폴더의 임시 파일에 쓴 뒤 rename으로 교체 (중간 상태가 보이지 않음)"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    folder = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-", suffix=os.path.basename(path)[-16:])
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        # mkstemp는 0600으로 만들므로 일반 파일과 같은 권한으로 맞춤
+        os.chmod(tmp_path, file_mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def load_manifest(path=manifest_file):
+    """매니페스트 불러오기 (없거나 손상되었으면 빈 매니페스트)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if isinstance(manifest, dict) and isinstance(manifest.get("files"), dict):
+            return manifest
+        print(f"⚠️  매니페스트 형식이 올바르지 않습니다: {path}")
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError:
+        print(f"🚫 매니페스트 파일이 손상되었습니다. 새로 생성합니다: {path}")
+    return {"files": {}}
+
+def save_manifest(manifest, path=manifest_file):
+    """매니페스트 저장 (파일명 정렬로 항상 같은 결과)"""
+    manifest["files"] = dict(sorted(manifest["files"].items()))
+    atomic_write(path, json.dumps(manifest, ensure_ascii=False, indent=2))
+
+def record_stage(stage, entries, removed=(), replace=True, path=manifest_file):
+    """한 빌드 단계의 결과를 매니페스트에 반영
+
+    replace=True면 해당 단계의 기존 항목을 모두 지우고 entries로 교체하고,
+    False면 entries를 덧붙이고 removed에 있는 파일만 지웁니다 (부분 재빌드용).
+    """
+    manifest = load_manifest(path)
+    files = manifest["files"]
+    if replace:
+        for filename in [name for name, entry in files.items() if entry.get("stage") == stage]:
+            del files[filename]
+    for filename in removed:
+        files.pop(filename, None)
+    files.update(entries)
+    save_manifest(manifest, path)
+    return manifest
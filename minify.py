@@ -0,0 +1,181 @@
+import re
+import json
+import string
+from functools import lru_cache
+
+# 📌 앞뒤 공백이 화면에 영향을 주지 않는 블록 태그 (인라인 태그 주변 공백은 한 칸으로 유지)
+block_tags = (
+    "html|head|body|meta|link|title|style|script|noscript|div|p|h[1-6]|table|thead|tbody|tfoot|"
+    "tr|td|th|ul|ol|li|section|nav|header|footer|main|article|br|hr"
+)
+block_tag_pattern = re.compile(r"\s*(<!doctype[^>]*>|</?(?:" + block_tags + r")\b[^>]*>|\x00\d+\x00)\s*", re.I)
+
+# 📌 내용을 그대로 두거나 따로 처리할 블록 (<script>, <style>, <pre>, <textarea>)
+protected_pattern = re.compile(
+    r"(<script\b[^>]*>)(.*?)(</script>)|(<style\b[^>]*>)(.*?)(</style>)|(<pre\b.*?</pre>|<textarea\b.*?</textarea>)",
+    re.S | re.I,
+)
+comment_pattern = re.compile(r"<!--(?!\[if).*?-->", re.S)
+whitespace_pattern = re.compile(r"\s+")
+
+css_comment_pattern = re.compile(r"/\*.*?\*/", re.S)
+css_string_pattern = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+css_space_pattern = re.compile(r"\s*([{};,>])\s*")
+css_colon_pattern = re.compile(r":\s+")
+
+def minify_css(css):
+    """CSS 주석 제거, 공백 압축 (문자열 리터럴 내부는 유지)"""
+    css = css_comment_pattern.sub("", css)
+    parts = css_string_pattern.split(css)
+    for i in range(0, len(parts), 2):
+        part = whitespace_pattern.sub(" ", parts[i])
+        part = css_space_pattern.sub(r"\1", part)
+        parts[i] = css_colon_pattern.sub(":", part)
+    css = "".join(parts).strip()
+    return css.replace(";}", "}")
+
+def compact_json_ld(script_body):
+    """JSON-LD 본문을 공백 없는 JSON으로 변환 (파싱할 수 없으면 그대로 반환)"""
+    try:
+        data = json.loads(script_body)
+    except ValueError:
+        return script_body
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+def minify_json_ld_script(fragment):
+    """<script type="application/ld+json"> 하나로 된 조각을 정규식 없이 압축 (빈 조각은 빈 문자열)"""
+    start = fragment.find("<script")
+    end = fragment.rfind("</script>")
+    if start < 0 or end < 0:
+        return fragment.strip()
+    body_start = fragment.index(">", start) + 1
+    return fragment[start:body_start] + compact_json_ld(fragment[body_start:end]) + "</script>"
+
+def minify_html(html):
+    """HTML 주석 제거, <pre>/<script> 바깥 공백 압축, <style> 압축, JSON-LD 압축"""
+    protected = []
+
+    def protect(match):
+        if match.group(1):
+            opening, body, closing = match.group(1), match.group(2), match.group(3)
+            if "ld+json" in opening.lower():
+                body = compact_json_ld(body)
+            protected.append(opening + body + closing)
+        elif match.group(4):
+            protected.append(match.group(4) + minify_css(match.group(5)) + match.group(6))
+        else:
+            protected.append(match.group(7))
+        return f"\x00{len(protected) - 1}\x00"
+
+    html = protected_pattern.sub(protect, html)
+    html = comment_pattern.sub("", html)
+    html = whitespace_pattern.sub(" ", html)
+    html = block_tag_pattern.sub(r"\1", html)
+    for i, block in enumerate(protected):
+        html = html.replace(f"\x00{i}\x00", block, 1)
+    return html
+
+def _rebuild_template(parsed):
+    """string.Formatter로 파싱한 템플릿을 다시 format 문자열로 조립"""
+    pieces = []
+    for literal, field_name, format_spec, conversion in parsed:
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        field = field_name
+        if conversion:
+            field += "!" + conversion
+        if format_spec:
+            field += ":" + format_spec
+        pieces.append("{" + field + "}")
+    return "".join(pieces)
+
+@lru_cache(maxsize=None)
+def minify_template(template):
+    """str.format 템플릿을 한 번만 압축 (페이지마다 전체를 다시 훑지 않도록)"""
+    minified = minify_html(template)
+    return _rebuild_template(string.Formatter().parse(minified))
+
+@lru_cache(maxsize=None)
+def _template_layout(template):
+    """템플릿 고정 텍스트의 바이트 수와 필드별 등장 횟수"""
+    literal_bytes = 0
+    field_counts = {}
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        literal_bytes += len(literal.encode("utf-8"))
+        if field_name is not None:
+            field_counts[field_name] = field_counts.get(field_name, 0) + 1
+    return literal_bytes, field_counts
+
+def formatted_size(template, values, sizes=None):
+    """template.format(**values)의 바이트 수를 실제로 만들지 않고 계산
+
+    sizes에 있는 필드는 값 대신 주어진 바이트 수를 사용합니다.
+    """
+    sizes = sizes or {}
+    literal_bytes, field_counts = _template_layout(template)
+    return literal_bytes + sum(
+        count * (sizes[name] if name in sizes else len(str(values[name]).encode("utf-8")))
+        for name, count in field_counts.items()
+    )
+
+def field_counts(template):
+    """템플릿 필드별 등장 횟수 (같은 값이 여러 번 들어가는 필드의 크기 계산용)"""
+    return _template_layout(template)[1]
+
+@lru_cache(maxsize=None)
+def template_blocks(template):
+    """템플릿의 인라인 블록 → {"css": (...), "js": (...), "json_ld": (...)} (각 블록도 format 템플릿)
+
+    블록 크기는 formatted_size(블록, values)로 페이지마다 계산할 수 있습니다.
+    """
+    blocks = {"css": [], "js": [], "json_ld": []}
+    for match in protected_pattern.finditer(template):
+        if match.group(1):
+            blocks["json_ld" if "ld+json" in match.group(1).lower() else "js"].append(match.group(0))
+        elif match.group(4):
+            blocks["css"].append(match.group(0))
+    return {kind: tuple(items) for kind, items in blocks.items()}
+
+def block_sizes(html):
+    """완성된 HTML의 인라인 <style>·<script>·JSON-LD 바이트 수 (템플릿 구조가 없는 페이지용)"""
+    sizes = {"css": 0, "js": 0, "json_ld": 0}
+    for match in protected_pattern.finditer(html):
+        if match.group(1):
+            kind = "json_ld" if "ld+json" in match.group(1).lower() else "js"
+        elif match.group(4):
+            kind = "css"
+        else:
+            continue
+        sizes[kind] += len(match.group(0).encode("utf-8"))
+    return sizes
+
+def literal_savings(template):
+    """템플릿 한 번 채울 때 압축으로 줄어드는 고정 텍스트 바이트 수"""
+    return _template_layout(template)[0] - _template_layout(minify_template(template))[0]
+
+def record_savings(size_stats, page_type, raw_size, minified_size):
+    """페이지 종류별 압축 전후 크기 누적"""
+    stats = size_stats.setdefault(page_type, {"pages": 0, "raw": 0, "minified": 0})
+    stats["pages"] += 1
+    stats["raw"] += raw_size
+    stats["minified"] += minified_size
+
+def merge_savings(size_stats, other):
+    """다른 빌드(샤드·체크포인트)에서 모은 크기 통계를 합침"""
+    for page_type, stats in other.items():
+        total = size_stats.setdefault(page_type, {"pages": 0, "raw": 0, "minified": 0})
+        for key in total:
+            total[key] += stats[key]
+
+def print_savings(size_stats):
+    """페이지 종류별 절감 바이트 리포트 출력"""
+    labels = {"routes": "노선 페이지", "hubs": "터미널 허브"}
+    print(f"\n🗜️ HTML 압축 결과:")
+    for page_type, stats in size_stats.items():
+        saved = stats["raw"] - stats["minified"]
+        ratio = saved / stats["raw"] * 100 if stats["raw"] else 0
+        average = saved // stats["pages"] if stats["pages"] else 0
+        print(f"   {labels.get(page_type, page_type)}: {stats['pages']}개 | "
+              f"{stats['raw']:,} → {stats['minified']:,} bytes | "
+              f"{saved:,} bytes 절감 ({ratio:.1f}%, 페이지당 {average:,} bytes)")
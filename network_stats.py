@@ -0,0 +1,301 @@
+import os
+import glob
+import json
+import time
+import argparse
+from array import array
+from collections import Counter
+from itertools import compress, repeat
+from operator import add, itemgetter, mul
+
+import app
+import assets
+import gtfs
+import manifest
+import minify
+import profiler
+
+# 📂 경로 설정
+data_pattern = os.path.join(app.data_folder, "*_schedules.json")
+output_folder = "outputs"
+stats_file = os.path.join(output_folder, "network_stats.json")  # 내부 대시보드용 요약
+page_slug = "전국-시외버스-통계"  # 전국 현황 페이지 (outputs/전국-시외버스-통계.html)
+
+default_top = 10
+max_duration = 24 * 60  # 하루가 넘는 소요시간은 잘못 들어온 값으로 보고 모르는 것으로 처리
+percentiles = (10, 25, 50, 75, 90)
+
+# ⏰ 분 → 시 변환표 (24시 이후 표기 '24:10'도 다음 날 0시로, map으로 한 번에 바꾸기 위함)
+minute_hour = bytes(minute // 60 % 24 for minute in range(48 * 60))
+
+def departure_minute(dep_time):
+    """'HH:MM' → 하루 중 분 (형식이 다르면 None)"""
+    try:
+        hour, minute = str(dep_time).split(":")[:2]
+        value = int(hour) * 60 + int(minute)
+    except ValueError:
+        return None
+    return value if 0 <= value < len(minute_hour) else None
+
+def build_columns(pattern=data_pattern):
+    """모든 출발지 데이터 → 출발 한 건당 한 행인 열 배열
+
+    반환값: {"terminals", "destinations", "operators": [이름, ...],
+             "terminal", "destination", "operator", "minute", "duration": array}
+    이름은 한 번만 저장하고 행에는 번호만 둡니다. 소요시간을 모르면 0입니다.
+    노선 페이지처럼 도착지마다 한 행이라, 여러 도착지를 지나는 버스는 도착지 수만큼 행이 생깁니다.
+    """
+    names = {"terminals": {}, "destinations": {}, "operators": {}}
+    columns = {
+        "terminal": array("H"), "destination": array("I"), "operator": array("H"),
+        "minute": array("H"), "duration": array("H"),
+    }
+    for json_file_path in sorted(glob.glob(pattern)):
+        dep_terminal = app.terminal_name_from_path(json_file_path)
+        schedules = gtfs.load_terminal_schedules(json_file_path)
+        if not schedules:
+            continue
+        terminal_id = names["terminals"].setdefault(dep_terminal, len(names["terminals"]))
+        for arr_terminal, buses in schedules.items():
+            for bus in buses or []:
+                if not str(bus.get('TIM_TIM') or bus.get('출발시각', '')).strip():
+                    continue  # 노선 페이지와 같이 출발시각이 없는 버스는 제외
+                dep_time, duration_min, company = app.departure_fields(bus)
+                minute = departure_minute(dep_time)
+                if minute is None:
+                    continue
+                destination_id = names["destinations"].setdefault(str(arr_terminal), len(names["destinations"]))
+                operator_id = names["operators"].setdefault(company or "정보 없음", len(names["operators"]))
+                columns["terminal"].append(terminal_id)
+                columns["destination"].append(destination_id)
+                columns["operator"].append(operator_id)
+                columns["minute"].append(minute)
+                columns["duration"].append(
+                    duration_min if isinstance(duration_min, int) and 0 < duration_min <= max_duration else 0)
+
+    columns.update({kind: list(ids) for kind, ids in names.items()})  # dict는 넣은 순서 = 번호 순서
+    return columns
+
+def percentile(sorted_values, p):
+    """정렬된 값의 p 백분위수 (nearest-rank, 값이 없으면 None)"""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-p * len(sorted_values) // 100))  # ceil(p/100 * n)
+    return sorted_values[rank - 1]
+
+def aggregate(columns, top=default_top):
+    """열 배열을 한 번씩 훑어 전국 통계 계산
+
+    행마다 파이썬 코드를 돌지 않고 Counter·sorted·set·map·compress에 배열을 통째로 넘겨 C 수준에서 셉니다.
+    파이썬 반복은 노선·출발지·운행회사 수만큼만 돕니다.
+    실제 버스 수는 (출발지, 출발 시각, 운행회사)가 같은 행을 한 번으로 셉니다.
+    """
+    terminal, destination, operator = columns["terminal"], columns["destination"], columns["operator"]
+    minute, duration = columns["minute"], columns["duration"]
+    terminals, destinations, operators = columns["terminals"], columns["destinations"], columns["operators"]
+
+    # 🚌 실제 출발 (같은 버스가 여러 도착지 시간표에 나오면 한 번)
+    departures = set(zip(terminal, minute, operator))
+    terminal_departures = Counter(map(itemgetter(0), departures))
+    operator_departures = Counter(map(itemgetter(2), departures))
+    hour_departures = Counter(map(minute_hour.__getitem__, map(itemgetter(1), departures)))
+
+    # 🛣️ 노선 (출발지·도착지 쌍) 번호 = 출발지 × 도착지 수 + 도착지
+    route = array("I", map(add, map(mul, terminal, repeat(len(destinations))), destination))
+    route_departures = Counter(route)
+    terminal_routes = Counter(route_id // len(destinations) for route_id in route_departures)
+
+    # ⏱️ 소요시간: 전체 분포와 노선별 중앙값 (노선 번호·소요시간 순으로 한 번 정렬한 뒤 구간만 잘라 봄)
+    timed = sorted(compress(zip(route, duration), duration))
+    durations = sorted(map(itemgetter(1), timed))
+    route_durations = []
+    offset = 0
+    for route_id, count in sorted(Counter(map(itemgetter(0), timed)).items()):
+        median = timed[offset + (count - 1) // 2][1]
+        route_durations.append((median, route_id, count))
+        offset += count
+    route_durations.sort()
+
+    def route_row(median, route_id, count):
+        dep_terminal, arr_terminal = terminals[route_id // len(destinations)], destinations[route_id % len(destinations)]
+        return [dep_terminal, arr_terminal, median, route_departures[route_id]]
+
+    total = len(departures)
+    return {
+        "generated": app.today_date,
+        "totals": {
+            "terminals": len(terminal_departures), "destinations": len(set(destination)),
+            "routes": len(route_departures), "operators": len(operator_departures),
+            "departures": total, "route_departures": len(route),
+            "first_departure": format_minute(min(minute)) if minute else None,
+            "last_departure": format_minute(max(minute)) if minute else None,
+        },
+        # [출발지, 실제 출발 수, 노선 수]
+        "busiest_terminals": [[terminals[terminal_id], count, terminal_routes[terminal_id]]
+                              for terminal_id, count in sorted(terminal_departures.items(),
+                                                               key=lambda item: (-item[1], terminals[item[0]]))[:top]],
+        "departures_per_hour": [hour_departures.get(hour, 0) for hour in range(24)],
+        # [운행회사, 실제 출발 수, 점유율(%)]
+        "operators": [[operators[operator_id], count, round(count * 100 / total, 2)]
+                      for operator_id, count in sorted(operator_departures.items(),
+                                                       key=lambda item: (-item[1], operators[item[0]]))],
+        "duration_percentiles": {f"p{p}": percentile(durations, p) for p in percentiles},
+        "duration_max": durations[-1] if durations else None,
+        # [출발지, 도착지, 소요시간 중앙값(분), 운행 편수]
+        "longest_routes": [route_row(*item) for item in reversed(route_durations[-top:])],
+        "shortest_routes": [route_row(*item) for item in route_durations[:top]],
+    }
+
+def format_minute(minute):
+    """하루 중 분 → 'HH:MM'"""
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+def table_rows(rows, cells):
+    """표 행 HTML (cells는 행 → [칸 HTML, ...])"""
+    return "".join("<tr>" + "".join(f"<td>{cell}</td>" for cell in cells(row)) + "</tr>" for row in rows)
+
+def route_link(dep_terminal, arr_terminal):
+    """노선 페이지 링크"""
+    return f'<a href="/{app.route_slug(dep_terminal, arr_terminal)}">{dep_terminal} → {arr_terminal}</a>'
+
+def render_page(stats, top_operators=default_top):
+    """전국 현황 페이지 HTML"""
+    totals = stats["totals"]
+    peak = max(stats["departures_per_hour"]) or 1
+    hour_bars = "".join(
+        f'<div class="bar"><span class="hour">{hour:02d}시</span>'
+        f'<span class="fill" style="width:{count * 100 // peak}%"></span><span class="count">{count:,}</span></div>'
+        for hour, count in enumerate(stats["departures_per_hour"])
+    )
+    quantiles = stats["duration_percentiles"]
+    duration_text = " · ".join(f"{key.upper()} {app.format_duration(value or 0)}" for key, value in quantiles.items())
+
+    return f'''<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>전국 시외버스 운행 통계 | 터미널·시간대·운행회사별 현황</title>
+    <meta name="description" content="🚌 전국 시외버스 {totals['departures']:,}회 운행, {totals['terminals']:,}개 터미널, {totals['routes']:,}개 노선의 시간대별 출발 수와 운행회사 점유율, 가장 긴 노선과 짧은 노선을 한눈에 확인하세요.">
+    <meta name="robots" content="index, follow">
+    <link rel="canonical" href="https://bus.medilocator.co.kr/{page_slug}">
+    <meta property="og:title" content="전국 시외버스 운행 통계">
+    <meta property="og:locale" content="ko_KR">
+    <meta name="theme-color" content="#2563eb">
+    {assets.asset_links()}
+    <style>
+        body {{
+            font-family: 'Pretendard', -apple-system, BlinkMacSystemFont, system-ui, sans-serif;
+            color: #1e293b;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            margin: 0;
+            padding: 20px 0;
+        }}
+        .container {{ max-width: 1000px; margin: 0 auto; padding: 0 20px; }}
+        .card {{ background: white; border-radius: 24px; padding: 30px; margin-bottom: 24px; }}
+        h1 {{ font-size: 32px; margin: 0 0 8px; }}
+        h2 {{ font-size: 22px; margin: 0 0 16px; color: #1e40af; }}
+        .totals {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(140px, 1fr)); gap: 12px; }}
+        .total {{ background: #f8fafc; border-radius: 16px; padding: 16px; text-align: center; }}
+        .total strong {{ display: block; font-size: 24px; color: #2563eb; }}
+        table {{ width: 100%; border-collapse: collapse; }}
+        td {{ padding: 8px; border-bottom: 1px solid #e2e8f0; }}
+        a {{ color: #2563eb; text-decoration: none; }}
+        .bar {{ display: flex; align-items: center; gap: 8px; font-size: 14px; }}
+        .hour {{ width: 40px; }}
+        .fill {{ height: 14px; background: #2563eb; border-radius: 4px; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <!-- 📊 전체 규모 -->
+        <div class="card">
+            <h1><i class="fas fa-chart-bar"></i> 전국 시외버스 운행 통계</h1>
+            <p>{stats['generated']} 시간표 기준 · 첫차 {totals['first_departure']} · 막차 {totals['last_departure']}</p>
+            <div class="totals">
+                <div class="total"><strong>{totals['departures']:,}</strong>하루 운행</div>
+                <div class="total"><strong>{totals['terminals']:,}</strong>출발 터미널</div>
+                <div class="total"><strong>{totals['routes']:,}</strong>노선</div>
+                <div class="total"><strong>{totals['operators']:,}</strong>운행회사</div>
+            </div>
+        </div>
+
+        <!-- ⏰ 시간대별 출발 -->
+        <div class="card">
+            <h2><i class="fas fa-clock"></i> 시간대별 출발</h2>
+            {hour_bars}
+        </div>
+
+        <!-- 🏢 가장 붐비는 터미널 -->
+        <div class="card">
+            <h2><i class="fas fa-building"></i> 출발이 많은 터미널</h2>
+            <table>{table_rows(stats['busiest_terminals'], lambda row: [row[0], f"{row[1]:,}회", f"{row[2]:,}개 노선"])}</table>
+        </div>
+
+        <!-- 🚍 운행회사 점유율 -->
+        <div class="card">
+            <h2><i class="fas fa-bus"></i> 운행회사별 점유율</h2>
+            <table>{table_rows(stats['operators'][:top_operators], lambda row: [row[0], f"{row[1]:,}회", f"{row[2]}%"])}</table>
+        </div>
+
+        <!-- 🛣️ 소요시간 -->
+        <div class="card">
+            <h2><i class="fas fa-route"></i> 가장 긴 노선</h2>
+            <p>소요시간 분포: {duration_text}</p>
+            <table>{table_rows(stats['longest_routes'], lambda row: [route_link(row[0], row[1]), app.format_duration(row[2]), f"하루 {row[3]}회"])}</table>
+            <h2><i class="fas fa-route"></i> 가장 짧은 노선</h2>
+            <table>{table_rows(stats['shortest_routes'], lambda row: [route_link(row[0], row[1]), app.format_duration(row[2]), f"하루 {row[3]}회"])}</table>
+        </div>
+    </div>
+</body>
+</html>'''
+
+def write_outputs(stats, minify_pages=False):
+    """요약 JSON(압축 형식)과 전국 현황 페이지 저장 → manifest 항목"""
+    content = json.dumps(stats, ensure_ascii=False, separators=(",", ":"))
+    page = render_page(stats)
+    if minify_pages:
+        page = minify.minify_html(page)
+    page_file = f"{page_slug}.html"
+    manifest.atomic_write(stats_file, content)
+    manifest.atomic_write(os.path.join(output_folder, page_file), page)
+    return {os.path.basename(stats_file): manifest.file_entry(content, "stats"),
+            page_file: manifest.file_entry(page, "stats")}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전국 출발 데이터를 열 배열로 모아 한 번에 집계 (터미널·시간대·운행회사·소요시간 통계)")
+    parser.add_argument("--top", type=int, default=default_top, help=f"순위 표 길이 (기본값: {default_top})")
+    parser.add_argument("--minify", action="store_true", help="공백·주석 제거로 HTML 크기 줄이기")
+    parser.add_argument("--profile", nargs="?", const=profiler.default_folder, metavar="DIR",
+                        help=f"열 만들기·집계 단계 cProfile 결과 저장 (기본 폴더: {profiler.default_folder})")
+    args = parser.parse_args()
+    if args.profile:
+        profiler.start(args.profile, "network_stats")
+
+    print("🚀 전국 통계 집계 시작...")
+    try:
+        started = time.perf_counter()
+        with profiler.stage("load"):
+            columns = build_columns()
+        loaded = time.perf_counter()
+        if not columns["minute"]:
+            print(f"🚫 {data_pattern}에서 출발 데이터를 찾을 수 없습니다.")
+            exit(1)
+        with profiler.stage("aggregate"):
+            stats = aggregate(columns, args.top)
+        aggregated = time.perf_counter()
+        os.makedirs(output_folder, exist_ok=True)
+        with profiler.stage("write"):
+            manifest.record_stage("stats", write_outputs(stats, args.minify))
+    finally:
+        profiler.save()
+
+    totals = stats["totals"]
+    print(f"📊 열 배열: {len(columns['minute']):,}행 (출발지 {len(columns['terminals'])}개, "
+          f"도착지 {len(columns['destinations']):,}개, 운행회사 {len(columns['operators'])}개) "
+          f"| 읽기 {loaded - started:.2f}초 | 집계 {aggregated - loaded:.3f}초")
+    print(f"🚌 실제 운행 {totals['departures']:,}회 | 노선 {totals['routes']:,}개 | 첫차 {totals['first_departure']} "
+          f"| 막차 {totals['last_departure']}")
+    busiest = ", ".join(f"{name} {count:,}회" for name, count, _ in stats["busiest_terminals"][:3])
+    print(f"🏢 출발이 많은 터미널: {busiest}")
+    print(f"💾 저장: {stats_file}, {os.path.join(output_folder, page_slug)}.html")
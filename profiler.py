@@ -0,0 +1,298 @@
+import os
+import glob
+import json
+import pstats
+import cProfile
+import argparse
+import contextlib
+import tracemalloc
+
+# 📂 프로파일 결과 폴더 (배포하지 않는 빌드 산출물)
+default_folder = os.path.join("outputs", "profile")
+default_top = 15
+memory_detail_every = 10  # 출발지 N개마다 한 번 할당 위치까지 분석하는 상세 스냅샷 (나머지는 사용량만)
+
+# 📌 --profile로 켰을 때만 채워짐 {"folder", "label", "profiles": {단계: cProfile.Profile}, "active": [단계]}
+_session = None
+# 📌 --memprofile로 켰을 때만 채워짐 {"folder", "label", "top", "stages", "active", "snapshots", "previous", ...}
+_memory = None
+_off = contextlib.nullcontext()  # 꺼져 있을 때 stage()가 돌려주는 빈 컨텍스트 (새 객체도 만들지 않음)
+
+def process_label(script, shard=None):
+    """결과 파일 이름 앞부분 (예: app, app-2-of-4) - 샤드 프로세스마다 파일이 겹치지 않게 함"""
+    return f"{script}-{shard[0]}-of-{shard[1]}" if shard else script
+
+def start(folder=default_folder, label="app"):
+    """이 프로세스의 프로파일링 시작 (이후 stage()로 감싼 구간만 측정)"""
+    global _session
+    os.makedirs(folder, exist_ok=True)
+    _session = {"folder": folder, "label": label, "profiles": {}, "active": []}
+
+def enabled():
+    """--profile 또는 --memprofile로 프로파일링 중인지"""
+    return _session is not None or _memory is not None
+
+def stage(name):
+    """단계 하나를 측정하는 컨텍스트 (--profile·--memprofile 둘 다 꺼져 있으면 아무 일도 하지 않음)
+
+    같은 단계를 여러 번 지나면(출발지·페이지마다) 한 프로파일에 누적됩니다.
+    단계 안에서 다른 단계가 시작되면 바깥 단계는 잠시 멈추므로 시간은 겹치지 않습니다.
+    """
+    if _session is None and _memory is None:
+        return _off
+    return _profiled(name)
+
+@contextlib.contextmanager
+def _profiled(name):
+    if _memory is not None:
+        with _memory_stage(name):
+            if _session is None:
+                yield
+            else:
+                with _cprofile_stage(name):
+                    yield
+    else:
+        with _cprofile_stage(name):
+            yield
+
+@contextlib.contextmanager
+def _cprofile_stage(name):
+    profiles, active = _session["profiles"], _session["active"]
+    profile = profiles.setdefault(name, cProfile.Profile())
+    if active:
+        profiles[active[-1]].disable()
+    active.append(name)
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        active.pop()
+        if active:
+            profiles[active[-1]].enable()
+
+def function_label(func):
+    """pstats 함수 키 → 접힌 스택 한 칸 이름 (예: app.py:1285:render_route_page)"""
+    filename, line, name = func
+    if filename == "~":  # 내장 함수
+        return name.replace(";", ",")
+    return f"{os.path.basename(filename)}:{line}:{name}".replace(";", ",")
+
+def collapsed_stacks(stats, max_depth=64, min_fraction=0.0001):
+    """pstats 통계 → {접힌 스택: 마이크로초} (flamegraph.pl·speedscope 등에서 읽는 형식)
+
+    cProfile은 호출자→피호출자 간선별 시간만 기록하므로, 루트부터 간선 시간 비율로 나눠 내려가며
+    각 함수의 자체 시간(tottime)을 스택에 배분한 근사값입니다.
+    """
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+    roots = [func for func, entry in stats.items() if not entry[4]]
+    total = sum(entry[2] for entry in stats.values())
+    threshold = total * min_fraction
+    stacks = {}
+
+    def walk(func, path, on_path, share):
+        own = stats[func][2] * share
+        if own > 0:
+            key = ";".join(path)
+            stacks[key] = stacks.get(key, 0) + own
+        if len(path) >= max_depth:
+            return
+        for callee, edge_time in callees.get(func, ()):
+            callee_total = stats[callee][3]
+            if callee in on_path or not callee_total or edge_time * share < threshold:
+                continue
+            on_path.add(callee)
+            walk(callee, path + [function_label(callee)], on_path,
+                 min(1.0, edge_time * share / callee_total))
+            on_path.discard(callee)
+
+    for root in roots:
+        walk(root, [function_label(root)], {root}, 1.0)
+    return {key: round(seconds * 1000000) for key, seconds in stacks.items() if round(seconds * 1000000) > 0}
+
+def write_stage(stats, path_prefix):
+    """단계 통계를 .pstats와 .collapsed로 저장"""
+    stats.dump_stats(f"{path_prefix}.pstats")
+    with open(f"{path_prefix}.collapsed", "w", encoding="utf-8") as f:
+        for key, micros in sorted(collapsed_stacks(stats.stats).items()):
+            f.write(f"{key} {micros}\n")
+
+def print_summary(stage_stats, top=default_top):
+    """단계별 시간과 자체 시간(tottime) 상위 함수 출력"""
+    print(f"\n⏱️  프로파일 요약 (단계별 측정 시간)")
+    for name, stats in stage_stats.items():
+        print(f"   {name}: {stats.total_tt:.3f}초 ({stats.total_calls:,}회 호출)")
+    if not stage_stats:
+        return
+    combined = pstats.Stats()
+    combined.add(*stage_stats.values())
+    print(f"   🔝 자체 시간 상위 {top}개 함수:")
+    ranked = sorted(combined.stats.items(), key=lambda item: -item[1][2])[:top]
+    for func, (_, calls, tottime, cumtime, _) in ranked:
+        print(f"      {tottime:8.3f}초 (누적 {cumtime:.3f}초, {calls:,}회)  {function_label(func)}")
+
+def save(top=default_top):
+    """측정한 단계별 결과 저장·요약 출력 ({폴더}/{라벨}.{단계}.pstats, .collapsed) 후 프로파일링 종료"""
+    global _session
+    if _session is None:
+        return
+    session, _session = _session, None
+    stage_stats = {}
+    for name, profile in session["profiles"].items():
+        profile.disable()
+        stats = pstats.Stats(profile)
+        write_stage(stats, os.path.join(session["folder"], f"{session['label']}.{name}"))
+        stage_stats[name] = stats
+    print_summary(stage_stats, top)
+    print(f"📄 프로파일 저장: {session['folder']}/{session['label']}.*.pstats, *.collapsed")
+
+def start_memory(folder=default_folder, label="app", top=10, frames=1):
+    """tracemalloc 메모리 프로파일링 시작 (stage()로 감싼 구간의 증가량·최고치와 snapshot() 시점의 스냅샷 기록)
+
+    frames는 할당 위치마다 저장할 호출 단계 수입니다 (1이면 할당한 줄만, 크면 느려짐).
+    """
+    global _memory
+    os.makedirs(folder, exist_ok=True)
+    tracemalloc.start(frames)
+    _memory = {"folder": folder, "label": label, "top": top, "stages": {}, "active": [], "snapshots": [],
+               "previous": None, "peak": 0, "window_peak": 0}
+
+def _observe_memory():
+    """현재 사용량을 읽고, 그 사이의 최고치를 진행 중인 단계·스냅샷 구간·전체 최고치에 반영 → 현재 바이트"""
+    current, peak = tracemalloc.get_traced_memory()
+    for frame in _memory["active"]:
+        frame["peak"] = max(frame["peak"], peak)
+    _memory["window_peak"] = max(_memory["window_peak"], peak)
+    _memory["peak"] = max(_memory["peak"], peak)
+    tracemalloc.reset_peak()
+    return current
+
+@contextlib.contextmanager
+def _memory_stage(name):
+    frame = {"start": _observe_memory(), "peak": 0}
+    _memory["active"].append(frame)
+    try:
+        yield
+    finally:
+        current = _observe_memory()
+        _memory["active"].pop()
+        stats = _memory["stages"].setdefault(name, {"calls": 0, "retained": 0, "peak": 0})
+        stats["calls"] += 1
+        stats["retained"] += current - frame["start"]  # 단계가 끝난 뒤에도 남은 메모리
+        stats["peak"] = max(stats["peak"], frame["peak"] - frame["start"])  # 단계 안에서 더 쓴 최고치
+
+def allocation_site(statistic):
+    """tracemalloc 통계 한 줄 → 할당 위치 이름 (예: app.py:1140)"""
+    frame = statistic.traceback[0]
+    return f"{os.path.basename(frame.filename)}:{frame.lineno}"
+
+def snapshot(name, detailed=True):
+    """단계 경계에서 메모리 사용량 기록 (--memprofile이 꺼져 있으면 아무 일도 하지 않음)
+
+    현재·최고 사용량은 항상 남기고, detailed=True면 tracemalloc 스냅샷으로 크기 상위 할당 위치와
+    직전 상세 스냅샷 이후 가장 많이 늘어난 위치도 남깁니다 (스냅샷 분석은 한 번에 수백 ms 걸림).
+    스냅샷 객체 대신 위치별 합계만 들고 있으므로 여러 번 찍어도 측정 대상 메모리가 크게 늘지 않습니다.
+    """
+    if _memory is None:
+        return
+    current = _observe_memory()
+    record = {"name": name, "current": current, "peak": _memory["window_peak"], "top": [], "growth": []}
+    _memory["snapshots"].append(record)
+    _memory["window_peak"] = current
+    if not detailed:
+        return
+
+    excluded = {tracemalloc.__file__, __file__}
+    statistics = [stat for stat in tracemalloc.take_snapshot().statistics("lineno")
+                  if stat.traceback[0].filename not in excluded]
+    sites = {allocation_site(stat): (stat.size, stat.count) for stat in statistics}
+    top = _memory["top"]
+    record["top"] = [{"site": allocation_site(stat), "size": stat.size, "count": stat.count} for stat in statistics[:top]]
+    previous = _memory["previous"]
+    if previous is not None:
+        growth = [(site, size - previous.get(site, (0, 0))[0], count - previous.get(site, (0, 0))[1])
+                  for site, (size, count) in sites.items()]
+        record["growth"] = [{"site": site, "size_diff": size_diff, "count_diff": count_diff}
+                            for site, size_diff, count_diff in sorted(growth, key=lambda item: -item[1])[:top]
+                            if size_diff > 0]
+    _memory["previous"] = sites
+
+def print_memory_report(report, top=5):
+    """메모리 프로파일 요약 출력"""
+    mb = 1024 * 1024
+    print(f"\n🧠 메모리 프로파일 요약 (최고 {report['peak'] / mb:.1f}MB)")
+    for name, stats in report["stages"].items():
+        print(f"   {name}: 남은 메모리 {stats['retained'] / mb:+.1f}MB | 단계 안 최고 +{stats['peak'] / mb:.1f}MB "
+              f"({stats['calls']:,}회)")
+
+    snapshots = report["snapshots"]
+    print(f"   📸 스냅샷 {len(snapshots)}개:")
+    shown = snapshots if len(snapshots) <= 12 else snapshots[:5] + [None] + snapshots[-5:]
+    for record in shown:
+        if record is None:
+            print("      ...")
+            continue
+        print(f"      {record['name']}: 현재 {record['current'] / mb:.1f}MB | 구간 최고 {record['peak'] / mb:.1f}MB"
+              f"{' 📸' if record['top'] else ''}")
+    detailed = [record for record in snapshots if record["top"]]
+    if detailed:
+        print(f"   🔝 마지막 상세 스냅샷({detailed[-1]['name']})의 할당 위치 상위 {top}개:")
+        for site in detailed[-1]["top"][:top]:
+            print(f"      {site['size'] / mb:8.2f}MB ({site['count']:,}개)  {site['site']}")
+
+    # 출발지 사이(상세 스냅샷 사이)에 계속 늘어나는 위치는 누수이거나 출발지마다 쌓이는 기록
+    terminal_growth = {}
+    for record in snapshots:
+        if record["name"].startswith("render:"):
+            for site in record["growth"]:
+                terminal_growth[site["site"]] = terminal_growth.get(site["site"], 0) + site["size_diff"]
+    if terminal_growth:
+        print(f"   📈 출발지 사이에 늘어난 할당 위치 상위 {top}개:")
+        for site, size in sorted(terminal_growth.items(), key=lambda item: -item[1])[:top]:
+            print(f"      {size / mb:+8.2f}MB  {site}")
+
+def save_memory():
+    """메모리 프로파일 결과를 {폴더}/{라벨}.memory.json으로 저장·요약 출력 후 종료"""
+    global _memory
+    if _memory is None:
+        return
+    _observe_memory()
+    memory, _memory = _memory, None
+    tracemalloc.stop()
+    report = {"label": memory["label"], "peak": memory["peak"], "stages": memory["stages"],
+              "snapshots": memory["snapshots"]}
+    path = os.path.join(memory["folder"], f"{memory['label']}.memory.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print_memory_report(report)
+    print(f"📄 메모리 프로파일 저장: {path}")
+
+def combine(folder=default_folder):
+    """여러 프로세스(샤드·스크립트)의 결과를 단계별로 합쳐 all.{단계}.pstats·.collapsed로 저장 → {단계: Stats}"""
+    paths = {}
+    for path in sorted(glob.glob(os.path.join(folder, "*.pstats"))):
+        label, name = os.path.basename(path)[:-len(".pstats")].rsplit(".", 1)
+        if label != "all":
+            paths.setdefault(name, []).append(path)
+    stage_stats = {}
+    for name, stage_paths in paths.items():
+        stats = pstats.Stats(*stage_paths)
+        write_stage(stats, os.path.join(folder, f"all.{name}"))
+        stage_stats[name] = stats
+    return stage_stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="--profile 결과 합치기 (샤드·스크립트별 파일을 단계별로) 및 요약")
+    parser.add_argument("--folder", default=default_folder, help=f"프로파일 폴더 (기본값: {default_folder})")
+    parser.add_argument("--top", type=int, default=default_top, help=f"보여줄 상위 함수 수 (기본값: {default_top})")
+    args = parser.parse_args()
+
+    stage_stats = combine(args.folder)
+    if not stage_stats:
+        print(f"🚫 프로파일 결과가 없습니다: {args.folder}/ (app.py·hub.py·sitemap.py --profile로 먼저 실행하세요)")
+        exit(1)
+    print_summary(stage_stats, args.top)
+    print(f"📄 합친 결과 저장: {args.folder}/all.*.pstats, all.*.collapsed")
@@ -0,0 +1,117 @@
+import os
+import argparse
+import fnmatch
+
+import manifest
+
+# 📂 배포 폴더에 남기는 배포 기록 (다음 배포 때 변경/삭제 판단용)
+publish_manifest_name = ".publish-manifest.json"
+
+# 📌 배포 기록이 없던 시절에 복사된 생성 페이지 패턴 (첫 배포 때 정리 대상)
+generated_patterns = [
+    "*-에서-*-가는-시외버스-시간표.html",
+    "*-터미널-시외버스-시간표.html",
+]
+
+def plan_publish(build_manifest, published_manifest, target_folder):
+    """빌드 매니페스트와 배포 기록을 비교해 추가/변경/삭제/유지 목록을 계산합니다."""
+    build_files = build_manifest["files"]
+    published_files = published_manifest["files"]
+    added, changed, unchanged = [], [], []
+
+    for filename, entry in build_files.items():
+        target_path = os.path.join(target_folder, filename)
+        if not os.path.exists(target_path):
+            added.append(filename)
+            continue
+
+        previous = published_files.get(filename)
+        if previous is None:
+            # 배포 기록 없이 존재하는 파일은 내용을 직접 비교
+            previous = manifest.file_entry_from_path(target_path, entry["stage"])
+
+        if previous["sha256"] == entry["sha256"]:
+            unchanged.append(filename)
+        else:
+            changed.append(filename)
+
+    # 🗑️ 이전에 배포했지만 이번 빌드에 없는 파일만 삭제 (배포 기록에 없는 파일은 건드리지 않음)
+    previously_published = set(published_files)
+    if not published_files:
+        for name in os.listdir(target_folder):
+            if any(fnmatch.fnmatch(name, pattern) for pattern in generated_patterns):
+                previously_published.add(name)
+    removed = sorted(name for name in previously_published - set(build_files)
+                     if os.path.exists(os.path.join(target_folder, name)))
+
+    return {"added": sorted(added), "changed": sorted(changed), "removed": removed, "unchanged": unchanged}
+
+def publish(source_folder="outputs", target_folder=".", dry_run=False):
+    """빌드 매니페스트 기준으로 바뀐 파일만 배포 폴더에 반영합니다."""
+    build_manifest_path = os.path.join(source_folder, os.path.basename(manifest.manifest_file))
+    published_manifest_path = os.path.join(target_folder, publish_manifest_name)
+
+    build_manifest = manifest.load_manifest(build_manifest_path)
+    if not build_manifest["files"]:
+        print(f"🚫 빌드 매니페스트가 비어 있습니다: {build_manifest_path}")
+        print("   app.py, hub.py, sitemap.py를 먼저 실행해주세요.")
+        return None
+
+    published_manifest = manifest.load_manifest(published_manifest_path)
+    if not published_manifest["files"]:
+        print("📝 배포 기록이 없어 배포 폴더의 기존 파일과 내용을 직접 비교합니다.")
+
+    plan = plan_publish(build_manifest, published_manifest, target_folder)
+
+    # 📋 원본 파일이 없으면 배포하지 않음 (매니페스트와 outputs 불일치)
+    missing = [filename for filename in plan["added"] + plan["changed"]
+               if not os.path.exists(os.path.join(source_folder, filename))]
+    for filename in missing:
+        print(f"⚠️  원본 파일이 없어 건너뜁니다: {filename}")
+        build_manifest["files"].pop(filename)
+    plan["added"] = [f for f in plan["added"] if f not in missing]
+    plan["changed"] = [f for f in plan["changed"] if f not in missing]
+
+    if not dry_run:
+        for filename in plan["added"] + plan["changed"]:
+            target_path = os.path.join(target_folder, filename)
+            # assets/ 처럼 하위 폴더에 있는 파일은 폴더부터 만듦
+            os.makedirs(os.path.dirname(target_path) or target_folder, exist_ok=True)
+            with open(os.path.join(source_folder, filename), "rb") as f:
+                manifest.atomic_write(target_path, f.read())
+
+        for filename in plan["removed"]:
+            os.remove(os.path.join(target_folder, filename))
+
+        # 현재 배포 상태를 기록 (다음 배포의 비교 기준)
+        manifest.save_manifest({"files": build_manifest["files"]}, published_manifest_path)
+
+    prefix = "🔍 [미리보기] " if dry_run else ""
+    print(f"{prefix}📦 배포 결과: {source_folder}/ → {target_folder}/")
+    print(f"   ➕ 추가: {len(plan['added'])}개")
+    print(f"   ✏️  변경: {len(plan['changed'])}개")
+    print(f"   🗑️  삭제: {len(plan['removed'])}개")
+    print(f"   ⏸️  유지: {len(plan['unchanged'])}개")
+
+    for label, key in (("➕", "added"), ("✏️ ", "changed"), ("🗑️ ", "removed")):
+        for filename in plan[key][:10]:
+            print(f"   {label} {filename}")
+        if len(plan[key]) > 10:
+            print(f"   {label} ... 외 {len(plan[key]) - 10}개")
+
+    return plan
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="빌드 매니페스트 기준 증분 배포")
+    parser.add_argument("--source", default="outputs", help="빌드 결과 폴더 (기본값: outputs)")
+    parser.add_argument("--target", default=".", help="배포 폴더 (기본값: 현재 폴더)")
+    parser.add_argument("--dry-run", action="store_true", help="실제로 복사·삭제하지 않고 결과만 출력")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.source):
+        print(f"❌ {args.source} 폴더가 없습니다. app.py를 먼저 실행해주세요.")
+        exit(1)
+
+    os.makedirs(args.target, exist_ok=True)
+    if publish(args.source, args.target, args.dry_run) is None:
+        exit(1)
@@ -0,0 +1,139 @@
+import os
+import json
+import shutil
+import hashlib
+import argparse
+
+import manifest
+
+# 📂 렌더링 캐시 폴더 (브랜치·재실행·CI 작업 사이에 재사용, outputs와 별도)
+default_cache_folder = ".render-cache"
+default_max_mb = 256
+
+def make_key(*parts):
+    """입력값 목록 → 내용 기반 캐시 키 (같은 입력이면 어느 머신에서든 같은 키)"""
+    text = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def open_cache(folder=default_cache_folder, max_mb=default_max_mb):
+    """캐시 상태 dict 생성 (폴더, 용량 한도, 적중·누락 카운터)"""
+    os.makedirs(folder, exist_ok=True)
+    return {"folder": folder, "max_bytes": int(max_mb * 1024 * 1024),
+            "hits": 0, "misses": 0, "stored": 0, "evicted": 0,
+            "fragments": {}}  # 조각 이름 → {"hits", "misses"}
+
+def entry_path(cache, key, suffix):
+    """캐시 항목 경로 (키 앞 2자리로 하위 폴더를 나눠 폴더 하나에 파일이 몰리지 않게 함)"""
+    return os.path.join(cache["folder"], key[:2], f"{key}{suffix}")
+
+def load(cache, key):
+    """캐시에 있으면 (내용, 메타 정보), 없으면 None
+
+    내용은 날짜 같은 빌드마다 바뀌는 값을 자리표시자로 남겨 둔 페이지일 수 있으므로 출력 파일에
+    하드링크하지 않고 돌려줍니다 (채워서 쓰는 것은 호출하는 쪽).
+    """
+    page_path = entry_path(cache, key, ".html")
+    try:
+        with open(entry_path(cache, key, ".json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(page_path, "r", encoding="utf-8", newline="") as f:
+            content = f.read()
+        # LRU 순서를 위해 마지막 사용 시각 갱신
+        os.utime(page_path)
+        os.utime(entry_path(cache, key, ".json"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache["misses"] += 1
+        return None
+    cache["hits"] += 1
+    return content, meta
+
+def store(cache, key, content, meta):
+    """렌더링 결과와 메타 정보(해시·크기 등)를 캐시에 저장"""
+    os.makedirs(os.path.dirname(entry_path(cache, key, ".html")), exist_ok=True)
+    manifest.atomic_write(entry_path(cache, key, ".html"), content)
+    manifest.atomic_write(entry_path(cache, key, ".json"), json.dumps(meta, ensure_ascii=False))
+    cache["stored"] += 1
+
+def fragment(cache, name, key_parts, render):
+    """페이지 조각 하나를 입력 해시로 캐시 (cache가 None이면 그냥 render() 호출)
+
+    조각 값은 JSON으로 저장할 수 있어야 하며, 같은 입력이면 다른 페이지·다른 빌드에서도 재사용됩니다.
+    """
+    if cache is None:
+        return render()
+    stats = cache["fragments"].setdefault(name, {"hits": 0, "misses": 0})
+    path = entry_path(cache, make_key(name, *key_parts), f".{name}.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            value = json.load(f)
+        os.utime(path)
+        stats["hits"] += 1
+        return value
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    stats["misses"] += 1
+    value = render()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    manifest.atomic_write(path, json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+    return value
+
+def cache_entries(folder):
+    """캐시 파일 목록 → [(마지막 사용 시각, 크기, 경로)] (페이지·메타·조각 파일 각각)"""
+    entries = []
+    for root, _, files in os.walk(folder):
+        for name in files:
+            if name.startswith(".tmp-"):
+                continue
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+def prune(cache):
+    """용량 한도를 넘으면 가장 오래 쓰지 않은 파일부터 삭제 → (남은 바이트, 삭제 수)
+
+    페이지와 메타 파일 중 하나만 남으면 restore에서 누락으로 처리되므로 파일 단위로 지워도 안전합니다.
+    """
+    entries = sorted(cache_entries(cache["folder"]))
+    total = sum(size for _, size, _ in entries)
+    evicted = 0
+    for _, size, path in entries:
+        if total <= cache["max_bytes"]:
+            break
+        if os.path.exists(path):
+            os.remove(path)
+        total -= size
+        evicted += 1
+    cache["evicted"] += evicted
+    return total, evicted
+
+def print_stats(cache):
+    """캐시 적중률 리포트 출력"""
+    lookups = cache["hits"] + cache["misses"]
+    ratio = cache["hits"] / lookups * 100 if lookups else 0
+    print(f"\n💾 렌더링 캐시: 적중 {cache['hits']:,}개 | 누락 {cache['misses']:,}개 ({ratio:.1f}% 적중) | "
+          f"저장 {cache['stored']:,}개 | LRU 삭제 {cache['evicted']:,}개")
+    labels = {"table": "시간표", "structured_data": "JSON-LD", "related_links": "내부 링크"}
+    for name, stats in cache["fragments"].items():
+        print(f"   🧩 {labels.get(name, name)} 조각: 적중 {stats['hits']:,}개 | 다시 만듦 {stats['misses']:,}개")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="렌더링 캐시 상태 확인·정리")
+    parser.add_argument("--cache-dir", default=default_cache_folder, help=f"캐시 폴더 (기본값: {default_cache_folder})")
+    parser.add_argument("--max-mb", type=float, default=default_max_mb, help=f"용량 한도 MB (기본값: {default_max_mb})")
+    parser.add_argument("--clear", action="store_true", help="캐시 전체 삭제")
+    args = parser.parse_args()
+
+    if args.clear:
+        shutil.rmtree(args.cache_dir, ignore_errors=True)
+        print(f"🧹 렌더링 캐시 삭제: {args.cache_dir}/")
+        exit(0)
+
+    cache = open_cache(args.cache_dir, args.max_mb)
+    entries = cache_entries(args.cache_dir)
+    print(f"💾 렌더링 캐시: {args.cache_dir}/ | 파일 {len(entries):,}개 | "
+          f"{sum(size for _, size, _ in entries):,} bytes (한도 {cache['max_bytes']:,} bytes)")
+    total, evicted = prune(cache)
+    if evicted:
+        print(f"🧹 LRU 삭제 {evicted:,}개 → {total:,} bytes")
@@ -0,0 +1,56 @@
+import re
+from itertools import groupby
+
+# 🏷️ 운행회사 표기: "금남고속(일반)" / "경남여객(일반)1:10 소요" → ("금남고속", "일반")
+operator_pattern = re.compile(r"^\s*([^()]+)(?:\(([^)]*)\))?")
+
+def operator_grade(text):
+    """운행회사·등급 문자열 → (운행회사, 등급) (등급 표기가 없으면 '', 운행회사가 없으면 None)"""
+    if not text:
+        return None
+    match = operator_pattern.match(str(text))
+    if not match or not match.group(1).strip():
+        return None
+    return match.group(1).strip(), (match.group(2) or "").strip()
+
+def bus_operators(buses):
+    """버스 목록 → 운행회사·등급 쌍 정렬 목록 [[운행회사, 등급], ...] (dict 원본은 COR_NAM, 리스트 원본은 차편정보)"""
+    pairs = set()
+    for bus in buses if isinstance(buses, list) else ():
+        if isinstance(bus, dict):
+            pair = operator_grade(bus.get("COR_NAM") or bus.get("차편정보"))
+            if pair:
+                pairs.add(pair)
+    return [list(pair) for pair in sorted(pairs)]
+
+def merge_operators(*lists):
+    """운행회사·등급 목록 합치기 (중복 제거, 정렬)"""
+    return [list(pair) for pair in sorted({tuple(pair) for pairs in lists for pair in pairs})]
+
+def build_indexes(routes):
+    """노선 목록을 한 번 훑어 역색인 생성
+
+    → {"arrivals": {도착지: [노선, ...]}, "operators": {운행회사: [(노선, [등급, ...]), ...]}}
+    도착지 허브·운행회사 페이지는 이 색인을 한 번 찾아보는 것으로 만들며 데이터 전체를 다시 보지 않습니다.
+    """
+    arrivals = {}
+    operators = {}
+    for route in routes:
+        arrivals.setdefault(route['arrival'], []).append(route)
+        for operator, pairs in groupby(route.get('operators', ()), key=lambda pair: pair[0]):
+            operators.setdefault(operator, []).append((route, [grade for _, grade in pairs if grade]))
+
+    for arrival_routes in arrivals.values():
+        arrival_routes.sort(key=lambda route: route['departure'])
+    for operator_routes in operators.values():
+        operator_routes.sort(key=lambda item: (item[0]['departure'], item[0]['arrival']))
+    return {"arrivals": dict(sorted(arrivals.items())), "operators": dict(sorted(operators.items()))}
+
+def direction_josa(name):
+    """'…로/으로 가는' 조사 - 받침이 있으면 '으로' (ㄹ 받침 제외), 괄호 안 표기는 무시 (예: 녹동(신항) → 녹동으로)"""
+    base = re.sub(r"\([^)]*\)\s*$", "", name).strip() or name
+    last = base[-1] if base else ""
+    if "가" <= last <= "힣":
+        final = (ord(last) - ord("가")) % 28
+        return "로" if final in (0, 8) else "으로"
+    return "로"
@@ -0,0 +1,207 @@
+import os
+import json
+import argparse
+
+import manifest
+
+# 📂 서비스 워커와 터미널별 프리캐시 목록 경로
+output_folder = "outputs"
+service_worker_name = "sw.js"
+precache_folder = "precache"
+
+# 📌 빌드 매니페스트 파일명 → 페이지 URL 규칙
+hub_suffix = "-터미널-시외버스-시간표.html"
+route_suffix = "-가는-시외버스-시간표.html"
+route_separator = "-에서-"
+
+# 🛠️ 서비스 워커 본문 (__VERSION__, __SHARED__ 자리에 빌드 값이 들어감)
+#   - 설치 시 공용 자산(아이콘 CSS·폰트)을 미리 저장
+#   - 페이지가 터미널명을 보내면 precache/{터미널}.json을 받아 허브와 노선 페이지를 저장
+#   - 리비전(빌드 해시)이 바뀐 항목만 다시 받고, 목록에서 빠진 항목은 지움
+#   - 저장된 URL은 캐시에서 바로 응답, 나머지는 네트워크 우선 (실패하면 캐시)
+service_worker_template = """// 🚌 전국 시외버스 시간표 서비스 워커 (service_worker.py가 생성 - 직접 수정하지 마세요)
+const VERSION = __VERSION__;
+const SHARED = __SHARED__;
+const CACHE = "bus-precache";
+const REVISIONS = "/__precache-revisions__";
+
+let queue = Promise.resolve();
+function enqueue(task) {
+    // 리비전 기록을 덮어쓰지 않도록 프리캐시 작업은 하나씩 실행
+    queue = queue.then(task, task);
+    return queue;
+}
+
+async function loadRevisions(cache) {
+    const response = await cache.match(REVISIONS);
+    const revisions = response ? await response.json() : {};
+    return {files: revisions.files || {}, groups: revisions.groups || {}};
+}
+
+async function precacheGroup(group, entries) {
+    const cache = await caches.open(CACHE);
+    const revisions = await loadRevisions(cache);
+    const urls = entries.map(entry => entry[0]);
+
+    // 목록에서 빠진 항목 삭제 (다른 그룹에서 쓰는 URL은 유지)
+    const inUse = new Set(urls);
+    for (const [name, groupUrls] of Object.entries(revisions.groups)) {
+        if (name !== group) groupUrls.forEach(url => inUse.add(url));
+    }
+    for (const url of revisions.groups[group] || []) {
+        if (!inUse.has(url)) {
+            await cache.delete(url);
+            delete revisions.files[url];
+        }
+    }
+
+    // 리비전이 바뀐 항목만 다시 받기
+    const stale = entries.filter(([url, revision]) => revisions.files[url] !== revision);
+    await Promise.all(stale.map(async ([url, revision]) => {
+        try {
+            const response = await fetch(url, {cache: "no-cache"});
+            if (response.ok && !response.redirected) {
+                await cache.put(url, response);
+                revisions.files[url] = revision;
+            }
+        } catch (error) {
+            // 오프라인이면 다음 방문 때 다시 시도
+        }
+    }));
+
+    revisions.groups[group] = urls;
+    await cache.put(REVISIONS, new Response(JSON.stringify(revisions), {
+        headers: {"Content-Type": "application/json"}
+    }));
+}
+
+async function precacheTerminal(terminal) {
+    const response = await fetch("/__PRECACHE_FOLDER__/" + encodeURIComponent(terminal) + ".json", {cache: "no-cache"});
+    if (!response.ok) return;
+    const terminalManifest = await response.json();
+    await precacheGroup("terminal:" + terminal, terminalManifest.entries);
+}
+
+self.addEventListener("install", event => {
+    event.waitUntil(enqueue(() => precacheGroup("shared", SHARED)).then(() => self.skipWaiting()));
+});
+
+self.addEventListener("activate", event => {
+    event.waitUntil(self.clients.claim());
+});
+
+self.addEventListener("message", event => {
+    const data = event.data || {};
+    if (data.type === "precache" && data.terminal) {
+        event.waitUntil(enqueue(() => precacheTerminal(data.terminal).catch(() => {})));
+    }
+});
+
+self.addEventListener("fetch", event => {
+    const request = event.request;
+    if (request.method !== "GET") return;
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) return;
+
+    event.respondWith((async () => {
+        const cache = await caches.open(CACHE);
+        const cached = await cache.match(url.pathname);
+        if (cached) return cached;
+        try {
+            return await fetch(request);
+        } catch (error) {
+            return (await cache.match(request)) || Response.error();
+        }
+    })());
+});
+"""
+
+# 📌 페이지에 넣는 등록 스크립트 (서비스 워커가 없으면 조용히 무시)
+registration_template = (
+    "<script>if('serviceWorker' in navigator){{navigator.serviceWorker.register('/{service_worker}')"
+    ".then(function(){{return navigator.serviceWorker.ready}})"
+    ".then(function(r){{r.active.postMessage({{type:'precache',terminal:{terminal}}})}})"
+    ".catch(function(){{}})}}</script>"
+)
+
+def registration_script(terminal_name):
+    """터미널 허브·노선 페이지에 넣을 서비스 워커 등록 스크립트"""
+    terminal = json.dumps(terminal_name, ensure_ascii=False).replace("</", "<\\/")
+    return registration_template.format(service_worker=service_worker_name, terminal=terminal)
+
+def page_url(filename):
+    """HTML 파일명 → 서비스되는 URL (확장자 없음)"""
+    return "/" + filename[:-len(".html")]
+
+def group_entries(build_files):
+    """빌드 매니페스트를 공용 자산과 터미널별 (허브 + 노선 페이지) 목록으로 나눔"""
+    shared = []
+    terminals = {}
+    for filename, entry in sorted(build_files.items()):
+        revision = entry["sha256"][:16]
+        if entry.get("stage") == "assets":
+            shared.append(["/" + filename, revision])
+        elif os.path.dirname(filename):
+            continue  # 🌐 언어 폴더(en/ 등) 페이지는 미리 받지 않음 (서비스 워커 등록만)
+        elif filename.endswith(hub_suffix):
+            terminal = filename[:-len(hub_suffix)]
+            terminals.setdefault(terminal, []).insert(0, [page_url(filename), revision])
+        elif filename.endswith(route_suffix) and route_separator in filename:
+            terminal = filename.split(route_separator, 1)[0]
+            terminals.setdefault(terminal, []).append([page_url(filename), revision])
+    return shared, terminals
+
+def build_service_worker(build_folder=output_folder):
+    """빌드 매니페스트의 해시로 sw.js와 터미널별 프리캐시 목록을 생성"""
+    build_manifest = manifest.load_manifest(os.path.join(build_folder, os.path.basename(manifest.manifest_file)))
+    if not build_manifest["files"]:
+        print(f"🚫 빌드 매니페스트가 비어 있습니다. app.py, hub.py를 먼저 실행해주세요.")
+        return None
+
+    shared, terminals = group_entries(build_manifest["files"])
+    os.makedirs(os.path.join(build_folder, precache_folder), exist_ok=True)
+    entries = {}
+
+    # 📋 터미널별 프리캐시 목록 (버전 = 항목 리비전의 해시)
+    terminal_versions = []
+    for terminal, terminal_entries in terminals.items():
+        version = manifest.content_hash(json.dumps(terminal_entries, ensure_ascii=False))[:16]
+        content = json.dumps({"version": version, "terminal": terminal, "entries": terminal_entries},
+                             ensure_ascii=False, separators=(",", ":"))
+        filename = f"{precache_folder}/{terminal}.json"
+        manifest.atomic_write(os.path.join(build_folder, filename), content)
+        entries[filename] = manifest.file_entry(content, "sw")
+        terminal_versions.append(version)
+
+    # 🛠️ 서비스 워커 (공용 자산이나 터미널 목록이 바뀌면 내용도 바뀌어 브라우저가 갱신)
+    version = manifest.content_hash(json.dumps([shared, terminal_versions]))[:16]
+    script = (service_worker_template
+              .replace("__VERSION__", json.dumps(version))
+              .replace("__SHARED__", json.dumps(shared, ensure_ascii=False))
+              .replace("__PRECACHE_FOLDER__", precache_folder))
+    manifest.atomic_write(os.path.join(build_folder, service_worker_name), script)
+    entries[service_worker_name] = manifest.file_entry(script, "sw")
+
+    # 🗑️ 사라진 터미널의 프리캐시 목록 정리
+    previous = [name for name, entry in build_manifest["files"].items()
+                if entry.get("stage") == "sw" and name not in entries]
+    for filename in previous:
+        path = os.path.join(build_folder, filename)
+        if os.path.exists(path):
+            os.remove(path)
+
+    manifest.record_stage("sw", entries, path=os.path.join(build_folder, os.path.basename(manifest.manifest_file)))
+
+    page_count = sum(len(terminal_entries) for terminal_entries in terminals.values())
+    print(f"🛠️ 서비스 워커 생성 완료: {service_worker_name} (버전 {version})")
+    print(f"   🎨 공용 자산: {len(shared)}개")
+    print(f"   🚏 터미널 프리캐시 목록: {len(terminals)}개 (페이지 {page_count}개)")
+    return version
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="빌드 매니페스트로 서비스 워커와 오프라인 프리캐시 목록 생성")
+    parser.add_argument("--source", default=output_folder, help=f"빌드 결과 폴더 (기본값: {output_folder})")
+    args = parser.parse_args()
+
+    if build_service_worker(args.source) is None:
+        exit(1)
@@ -0,0 +1,259 @@
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import subprocess
+
+import locales
+import manifest
+import minify
+import profiler
+
+# 📂 샤드별 결과 조각 폴더 (병합 후 조각은 지우고 report.json만 남김)
+output_folder = "outputs"
+fragments_folder = os.path.join(output_folder, "shards")
+report_file = os.path.join(fragments_folder, "report.json")
+
+# 🧩 샤드로 나눠 만들 수 있는 단계 (manifest 단계 이름)
+shard_stages = ["routes", "hubs"]
+
+def parse_shard(text):
+    """'2/4' → (2, 4) (argparse type으로 사용, 번호는 1부터)"""
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}': i/N 형식이어야 합니다 (예: 1/4)")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"'{text}': 샤드 번호는 1~N 사이여야 합니다")
+    return index, count
+
+def shard_of(terminal, count):
+    """출발지 이름의 고정 해시로 샤드 번호(1~count) 결정 (실행 환경과 무관하게 항상 같은 값)"""
+    digest = hashlib.sha1(str(terminal).encode("utf-8")).hexdigest()
+    return int(digest[:8], 16) % count + 1
+
+def in_shard(terminal, shard):
+    """출발지가 이 샤드 담당인지 (shard가 None이면 전체 빌드이므로 항상 True)"""
+    return shard is None or shard_of(terminal, shard[1]) == shard[0]
+
+def fragment_path(stage, shard, folder=fragments_folder):
+    """샤드 결과 조각 파일 경로 (예: outputs/shards/routes-2-of-4.json)"""
+    return os.path.join(folder, f"{stage}-{shard[0]}-of-{shard[1]}.json")
+
+def save_fragment(stage, shard, entries, terminals=None, published_dates=None, failed=(), size_stats=None,
+                  cache_stats=None):
+    """샤드 하나의 결과 조각 저장 - manifest.json·published_dates.json은 병합 단계에서만 씀
+
+    terminals는 [(출발지, [생성한 파일])] 목록이고, published_dates는 이 샤드가 만든 페이지의 발행일입니다.
+    """
+    os.makedirs(fragments_folder, exist_ok=True)
+    fragment = {
+        "stage": stage,
+        "shard": list(shard),
+        "entries": dict(sorted(entries.items())),
+        "terminals": [[terminal, files] for terminal, files in terminals or []],
+        "published_dates": published_dates or {},
+        "failed": list(failed),
+        "size_stats": size_stats or {},
+        "cache_stats": cache_stats or {},
+    }
+    path = fragment_path(stage, shard)
+    manifest.atomic_write(path, json.dumps(fragment, ensure_ascii=False, indent=2))
+    print(f"🧩 샤드 {shard[0]}/{shard[1]} {stage} 결과 조각 저장: {path} ({len(entries)}개 파일)")
+    return path
+
+def load_fragments(input_folders):
+    """입력 폴더들의 결과 조각 → {단계: {샤드 번호: (입력 폴더, 조각)}}
+
+    단계마다 모든 샤드(1~N)가 한 번씩 있어야 하며, 빠지거나 N이 섞여 있으면 ValueError.
+    """
+    fragments = {}
+    counts = {}
+    for folder in input_folders:
+        shard_folder = os.path.join(folder, "shards")
+        if not os.path.isdir(shard_folder):
+            continue
+        for name in sorted(os.listdir(shard_folder)):
+            if not name.endswith(".json") or name == os.path.basename(report_file):
+                continue
+            with open(os.path.join(shard_folder, name), "r", encoding="utf-8") as f:
+                fragment = json.load(f)
+            stage, (index, count) = fragment["stage"], fragment["shard"]
+            if counts.setdefault(stage, count) != count:
+                raise ValueError(f"{stage}: 샤드 수가 다른 조각이 섞여 있습니다 ({counts[stage]}, {count})")
+            if index in fragments.setdefault(stage, {}):
+                raise ValueError(f"{stage}: 샤드 {index}/{count} 조각이 두 번 있습니다")
+            fragments[stage][index] = (folder, fragment)
+
+    for stage, shards in fragments.items():
+        missing = [index for index in range(1, counts[stage] + 1) if index not in shards]
+        if missing:
+            raise ValueError(f"{stage}: 샤드 {', '.join(map(str, missing))}/{counts[stage]} 결과가 없습니다")
+    return fragments
+
+def copy_outputs(folder, entries):
+    """다른 머신에서 만든 샤드 폴더의 파일을 outputs로 복사 (매니페스트 해시로 내용 확인)"""
+    for filename, entry in entries.items():
+        source = os.path.join(folder, filename)
+        with open(source, "rb") as f:
+            if manifest.content_hash(f.read()) != entry["sha256"]:
+                raise ValueError(f"{source}: 결과 조각의 해시와 내용이 다릅니다")
+        dest = os.path.join(output_folder, filename)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)  # 언어 폴더(en/) 페이지
+        shutil.copy2(source, dest)  # 수정 시각도 유지 (rss.xml은 최근에 만든 페이지 순)
+
+def merge(input_folders=(output_folder,), write_sitemap=True):
+    """샤드 결과를 outputs 하나로 병합 → 리포트
+
+    manifest.json과 published_dates.json은 전체 빌드와 같은 순서·내용으로 만들어지므로
+    병합 결과는 한 머신에서 전체 빌드한 결과와 바이트 단위로 같습니다.
+    write_sitemap이면 sitemap.py처럼 sitemap.xml(언어별 sitemap-{언어}.xml 포함)·rss.xml·robots.txt를 만듭니다.
+    """
+    import app  # app이 이 모듈을 import하므로 병합할 때만 불러옴
+    import sitemap
+
+    fragments = load_fragments(input_folders)
+    if not fragments:
+        raise ValueError(f"병합할 결과 조각이 없습니다: {', '.join(input_folders)}")
+
+    os.makedirs(output_folder, exist_ok=True)
+    report = {"stages": {}, "size_stats": {}, "cache_stats": {}, "failed": []}
+    published_dates = app.load_published_dates()
+    for stage in [stage for stage in shard_stages if stage in fragments]:
+        shards = fragments[stage]
+        entries = {}
+        terminals = []
+        dates = {}
+        for index in sorted(shards):
+            folder, fragment = shards[index]
+            if os.path.abspath(folder) != os.path.abspath(output_folder):
+                copy_outputs(folder, fragment["entries"])
+            entries.update(fragment["entries"])
+            terminals.extend(fragment["terminals"])
+            dates.update(fragment["published_dates"])
+            report["failed"].extend(fragment["failed"])
+            minify.merge_savings(report["size_stats"], fragment["size_stats"])
+            for key, count in fragment.get("cache_stats", {}).items():
+                report["cache_stats"][key] = report["cache_stats"].get(key, 0) + count
+
+        # 새 발행일은 전체 빌드처럼 출발지 이름 순서대로 덧붙임 (언어별 페이지는 기본 언어 페이지의 발행일을 씀)
+        for terminal, files in sorted(terminals):
+            for filename in files:
+                if filename in dates:
+                    published_dates.setdefault(filename, dates[filename])
+        manifest.record_stage(stage, entries)
+        report["stages"][stage] = {
+            "shards": len(shards),
+            "files": len(entries),
+            "bytes": sum(entry["size"] for entry in entries.values()),
+            "per_shard": {str(index): len(shards[index][1]["entries"]) for index in sorted(shards)},
+        }
+
+    # 📏 다른 머신에서 만든 샤드의 페이지 크기 기록도 가져옴 (size_report.py)
+    for folder in input_folders:
+        sizes_folder = os.path.join(folder, "sizes")
+        if os.path.abspath(folder) != os.path.abspath(output_folder) and os.path.isdir(sizes_folder):
+            os.makedirs(os.path.join(output_folder, "sizes"), exist_ok=True)
+            for name in os.listdir(sizes_folder):
+                shutil.copyfile(os.path.join(sizes_folder, name), os.path.join(output_folder, "sizes", name))
+
+    if "routes" in fragments:
+        app.save_published_dates(published_dates)
+    if write_sitemap:
+        sitemap.generate_sitemap()
+        sitemap.generate_rss()
+        sitemap.generate_robots_txt()
+
+    # 🧹 병합이 끝난 조각은 지워 다음 빌드에 섞이지 않게 함
+    for folder in input_folders:
+        shard_folder = os.path.join(folder, "shards")
+        if os.path.isdir(shard_folder):
+            for name in os.listdir(shard_folder):
+                if name.endswith(".json") and name != os.path.basename(report_file):
+                    os.remove(os.path.join(shard_folder, name))
+    os.makedirs(fragments_folder, exist_ok=True)
+    manifest.atomic_write(report_file, json.dumps(report, ensure_ascii=False, indent=2))
+    return report
+
+def print_report(report):
+    """병합 리포트 출력"""
+    labels = {"routes": "노선 페이지", "hubs": "터미널 허브"}
+    print(f"🎉 샤드 병합 완료: {output_folder}/ (리포트: {report_file})")
+    for stage, stats in report["stages"].items():
+        per_shard = ", ".join(f"{index}: {count}" for index, count in stats["per_shard"].items())
+        print(f"   {labels.get(stage, stage)}: {stats['files']:,}개 ({stats['bytes']:,} bytes) | "
+              f"샤드 {stats['shards']}개 [{per_shard}]")
+    if report["failed"]:
+        print(f"   ⚠️  오류 도착지: {len(report['failed'])}개")
+    if report["cache_stats"]:
+        cache = report["cache_stats"]
+        print(f"   💾 렌더링 캐시: 적중 {cache.get('hits', 0):,}개 | 누락 {cache.get('misses', 0):,}개 | "
+              f"저장 {cache.get('stored', 0):,}개")
+    if report["size_stats"]:
+        minify.print_savings(report["size_stats"])
+
+def run_local(count, minify_pages=False, render_cache_folder=None, profile_folder=None, memprofile_folder=None,
+              fix_links=False, page_locales=(locales.default_locale,)):
+    """샤드 count개를 이 머신의 프로세스로 동시에 실행 (app.py, hub.py) → 실패한 명령 목록
+
+    profile_folder·memprofile_folder가 주어지면 각 샤드 프로세스가 자기 이름(app-2-of-4 등)으로
+    cProfile·메모리 프로파일을 남깁니다. fix_links·page_locales는 두 스크립트 모두에 전달합니다.
+    """
+    processes = []
+    for script in ("app.py", "hub.py"):
+        for index in range(1, count + 1):
+            command = [sys.executable, script, "--shard", f"{index}/{count}"] + (["--minify"] if minify_pages else [])
+            if fix_links:
+                command += ["--fix-links"]
+            if tuple(page_locales) != (locales.default_locale,):
+                command += ["--locales", ",".join(page_locales)]
+            if script == "app.py" and render_cache_folder:
+                command += ["--render-cache", render_cache_folder]
+            if profile_folder:
+                command += ["--profile", profile_folder]
+            if memprofile_folder:
+                command += ["--memprofile", memprofile_folder]
+            processes.append((command, subprocess.Popen(command, stdout=subprocess.DEVNULL)))
+    print(f"🚀 샤드 프로세스 {len(processes)}개 실행 중... (app.py·hub.py × {count})")
+    return [" ".join(command) for command, process in processes if process.wait() != 0]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="샤드 빌드 병합 (app.py·hub.py --shard i/N 결과를 하나의 outputs로)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    merge_parser = subparsers.add_parser("merge", help="샤드 결과 병합")
+    merge_parser.add_argument("--input", action="append", default=[], metavar="DIR",
+                              help=f"샤드 결과 폴더 (여러 번 지정 가능, 기본값: {output_folder})")
+    merge_parser.add_argument("--no-sitemap", action="store_true", help="병합 후 sitemap·RSS·robots.txt를 만들지 않음")
+
+    local_parser = subparsers.add_parser("local", help="샤드 N개를 로컬 프로세스로 실행한 뒤 병합")
+    local_parser.add_argument("count", type=int, help="샤드 수")
+    local_parser.add_argument("--minify", action="store_true", help="app.py·hub.py에 --minify 전달")
+    local_parser.add_argument("--render-cache", metavar="DIR", help="app.py에 --render-cache 전달 (샤드끼리 캐시 공유)")
+    local_parser.add_argument("--profile", nargs="?", const=profiler.default_folder, metavar="DIR",
+                              help="샤드 프로세스마다 --profile 전달 (python profiler.py로 합쳐 보기)")
+    local_parser.add_argument("--memprofile", nargs="?", const=profiler.default_folder, metavar="DIR",
+                              help="샤드 프로세스마다 --memprofile 전달")
+    local_parser.add_argument("--fix-links", action="store_true", help="app.py·hub.py에 --fix-links 전달")
+    local_parser.add_argument("--locales", type=locales.parse_locales, default=(locales.default_locale,),
+                              metavar="ko,en", help="app.py·hub.py에 --locales 전달")
+    local_parser.add_argument("--no-sitemap", action="store_true", help="병합 후 sitemap·RSS·robots.txt를 만들지 않음")
+    args = parser.parse_args()
+
+    if args.command == "local":
+        failed = run_local(args.count, args.minify, args.render_cache, args.profile, args.memprofile,
+                           args.fix_links, args.locales)
+        if failed:
+            print("🚫 실패한 샤드가 있어 병합하지 않습니다:")
+            for command in failed:
+                print(f"   {command}")
+            exit(1)
+
+    try:
+        report = merge(getattr(args, "input", None) or [output_folder], not args.no_sitemap)
+    except (ValueError, OSError) as e:
+        print(f"🚫 샤드 병합 실패: {e}")
+        exit(1)
+    print_report(report)
@@ -1,8 +1,13 @@
 import os
 import glob
+import argparse
 from datetime import datetime
 from urllib.parse import quote
 
+import locales
+import manifest
+import profiler
+
 def generate_sitemap():
     """sitemap.xml 파일을 생성합니다."""
     base_url = "https://bus.medilocator.co.kr/"
@@ -55,8 +60,46 @@ def generate_sitemap():
     os.makedirs('outputs', exist_ok=True)
     with open('outputs/sitemap.xml', 'w', encoding='utf-8') as f:
         f.write(sitemap_content)
+    manifest.record_stage("seo", {'sitemap.xml': manifest.file_entry(sitemap_content, "seo")}, replace=False)
     
     print(f"✅ Sitemap 생성 완료: 메인 페이지 + {len([f for f in html_files if not f.endswith('index.html')])}개 페이지")
+    generate_locale_sitemaps(lastmod)
+
+def locale_sitemaps():
+    """언어 폴더에 페이지가 있는 언어별 사이트맵 → [(언어, 파일명, 페이지 목록)]"""
+    found = []
+    for locale, settings in locales.locales.items():
+        if locale == locales.default_locale:
+            continue
+        html_files = sorted(glob.glob(os.path.join('outputs', settings["path"], '*.html')))
+        if html_files:
+            found.append((locale, f"sitemap-{locale}.xml", html_files))
+    return found
+
+def generate_locale_sitemaps(lastmod):
+    """언어 폴더(outputs/en/ 등)의 페이지로 언어별 sitemap-{언어}.xml 생성 (기본 언어는 sitemap.xml)"""
+    base_url = "https://bus.medilocator.co.kr/"
+    
+    for locale, filename, html_files in locale_sitemaps():
+        path = locales.locales[locale]["path"]
+        sitemap_content = '''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'''
+        for html_file in html_files:
+            encoded_filename = quote(os.path.basename(html_file).replace('.html', ''), safe='-._~')
+            sitemap_content += f'''
+    <url>
+        <loc>{base_url}{path}{encoded_filename}</loc>
+        <lastmod>{lastmod}</lastmod>
+        <changefreq>daily</changefreq>
+        <priority>0.8</priority>
+    </url>'''
+        sitemap_content += '''
+</urlset>'''
+        
+        with open(f'outputs/{filename}', 'w', encoding='utf-8') as f:
+            f.write(sitemap_content)
+        manifest.record_stage("seo", {filename: manifest.file_entry(sitemap_content, "seo")}, replace=False)
+        print(f"✅ {filename} 생성 완료: {len(html_files)}개 페이지")
 
 def generate_rss():
     """rss.xml 파일을 생성합니다."""
@@ -120,6 +163,7 @@ def generate_rss():
     # rss.xml 파일 저장
     with open('outputs/rss.xml', 'w', encoding='utf-8') as f:
         f.write(rss_content)
+    manifest.record_stage("seo", {'rss.xml': manifest.file_entry(rss_content, "seo")}, replace=False)
     
     print(f"✅ RSS 생성 완료: {len(recent_files)}개 항목")
 
@@ -127,21 +171,35 @@ def generate_robots_txt():
     """robots.txt 파일을 생성합니다."""
     base_url = "https://hyunwoo0815.github.io/bus2/"
     
+    # 언어별 사이트맵이 있으면 함께 알림
+    locale_lines = "".join(f"\nSitemap: {base_url}{filename}" for _, filename, _ in locale_sitemaps())
     robots_content = f'''User-agent: *
 Allow: /
 
 # Sitemap
-Sitemap: {base_url}sitemap.xml
+Sitemap: {base_url}sitemap.xml{locale_lines}
 
 # 크롤링 지연 (1초)
 Crawl-delay: 1'''
     
     with open('outputs/robots.txt', 'w', encoding='utf-8') as f:
         f.write(robots_content)
+    manifest.record_stage("seo", {'robots.txt': manifest.file_entry(robots_content, "seo")}, replace=False)
     
     print("✅ robots.txt 생성 완료")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="sitemap.xml, rss.xml, robots.txt 생성")
+    parser.add_argument("--profile", nargs="?", const=profiler.default_folder, metavar="DIR",
+                        help=f"sitemap·RSS 단계 cProfile 결과 저장 (기본 폴더: {profiler.default_folder})")
+    parser.add_argument("--memprofile", nargs="?", const=profiler.default_folder, metavar="DIR",
+                        help=f"sitemap·RSS 단계 tracemalloc 메모리 기록 (기본 폴더: {profiler.default_folder})")
+    args = parser.parse_args()
+    if args.profile:
+        profiler.start(args.profile, "sitemap")
+    if args.memprofile:
+        profiler.start_memory(args.memprofile, "sitemap")
+
     print("🚀 SEO 파일 생성 시작...")
     
     # outputs 폴더가 있는지 확인
@@ -156,11 +214,18 @@ if __name__ == "__main__":
         exit(1)
     
     try:
-        generate_sitemap()
-        generate_rss()
+        with profiler.stage("sitemap"):
+            generate_sitemap()
+        profiler.snapshot("sitemap")
+        with profiler.stage("rss"):
+            generate_rss()
+        profiler.snapshot("rss")
         generate_robots_txt()
         print("🎉 모든 SEO 파일 생성 완료!")
         
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
         exit(1)
+    finally:
+        profiler.save()
+        profiler.save_memory()
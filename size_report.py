@@ -0,0 +1,171 @@
+import os
+import glob
+import json
+import argparse
+
+import manifest
+import minify
+
+# 📂 페이지별 크기 기록 폴더 (app.py·hub.py가 빌드하면서 남김, 배포하지 않는 빌드 산출물)
+output_folder = "outputs"
+sizes_folder = os.path.join(output_folder, "sizes")
+report_file = os.path.join(output_folder, "size_report.json")
+budgets_file = "size_budgets.json"
+
+# 📊 페이지를 나누는 항목 (other = 전체에서 나머지 항목을 뺀 헤더·본문 마크업)
+parts = ["css", "js", "json_ld", "table", "related_links", "other"]
+part_labels = {"css": "인라인 CSS", "js": "인라인 JS", "json_ld": "JSON-LD", "table": "시간표",
+               "related_links": "내부 링크", "other": "기타 마크업", "page": "페이지 전체"}
+stage_labels = {"routes": "노선 페이지", "hubs": "터미널 허브", "arrivals": "도착지 허브", "operators": "운행회사 페이지"}
+key_labels = {"arrivals": "도착지", "operators": "운행회사"}  # 기록의 "terminal" 값이 출발지가 아닌 단계
+
+def page_breakdown(template, values, total, fields):
+    """템플릿과 채운 값으로 페이지 하나의 항목별 바이트 수 계산 (완성된 HTML을 다시 읽지 않음)
+
+    template의 <style>·<script> 블록은 minify.template_blocks로 한 번만 찾아 두고 값만 채워 크기를 재며,
+    fields는 항목별로 렌더링한 조각이 들어가는 필드 이름({"table": ("bus_rows",), ...})입니다.
+    """
+    breakdown = dict.fromkeys(parts, 0)
+    for kind, blocks in minify.template_blocks(template).items():
+        breakdown[kind] += sum(minify.formatted_size(block, values) for block in blocks)
+    counts = minify.field_counts(template)
+    for kind, names in fields.items():
+        breakdown[kind] += sum(counts.get(name, 0) * len(values[name].encode("utf-8")) for name in names)
+    breakdown["other"] = total - sum(breakdown.values())
+    breakdown["page"] = total
+    return breakdown
+
+def html_breakdown(html, fragments):
+    """템플릿 구조가 없는 페이지(허브)의 항목별 바이트 수 - 렌더링한 문자열의 인라인 블록 크기로 계산"""
+    breakdown = dict.fromkeys(parts, 0)
+    breakdown.update(minify.block_sizes(html))
+    for kind, size in fragments.items():
+        breakdown[kind] += size
+    total = len(html.encode("utf-8"))
+    breakdown["other"] = total - sum(breakdown.values())
+    breakdown["page"] = total
+    return breakdown
+
+def records_path(stage, shard=None, folder=sizes_folder):
+    """단계별 크기 기록 파일 경로 (샤드 빌드는 샤드마다 따로, 예: outputs/sizes/routes-2-of-4.json)"""
+    suffix = f"-{shard[0]}-of-{shard[1]}" if shard else ""
+    return os.path.join(folder, f"{stage}{suffix}.json")
+
+def save_records(stage, shard, records, folder=sizes_folder):
+    """페이지별 크기 기록 저장 {파일명: {"terminal", 항목별 바이트}}
+
+    같은 단계의 이전 기록 중 이번 빌드와 섞이면 안 되는 것(전체 빌드 ↔ 다른 샤드 수)은 지웁니다.
+    """
+    os.makedirs(folder, exist_ok=True)
+    for path in glob.glob(os.path.join(folder, f"{stage}.json")) + glob.glob(os.path.join(folder, f"{stage}-*-of-*.json")):
+        if shard is None or not path.endswith(f"-of-{shard[1]}.json"):
+            os.remove(path)
+    path = records_path(stage, shard, folder)
+    manifest.atomic_write(path, json.dumps(dict(sorted(records.items())), ensure_ascii=False, separators=(",", ":")))
+    return path
+
+def load_records(folder=sizes_folder):
+    """기록 파일 전체 → {단계: {파일명: 기록}}"""
+    records = {}
+    for path in sorted(glob.glob(os.path.join(folder, "*.json"))):
+        stage = os.path.basename(path)[:-len(".json")].split("-", 1)[0]
+        with open(path, "r", encoding="utf-8") as f:
+            records.setdefault(stage, {}).update(json.load(f))
+    return records
+
+def add_sizes(total, breakdown):
+    """항목별 바이트 수를 합계 dict에 더함"""
+    total["pages"] = total.get("pages", 0) + 1
+    for part in parts + ["page"]:
+        total[part] = total.get(part, 0) + breakdown.get(part, 0)
+    return total
+
+def load_budgets(path=budgets_file):
+    """예산 설정 읽기 → {"mode": "warn"|"fail", 단계: {항목: 페이지당 최대 바이트}} (파일이 없으면 빈 예산)"""
+    if not os.path.exists(path):
+        return {"mode": "warn"}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def check_budgets(records, budgets):
+    """예산을 넘은 페이지 → [{"stage", "part", "limit", "pages": [(파일명, 바이트)]}] (큰 순)"""
+    violations = []
+    for stage, limits in budgets.items():
+        if not isinstance(limits, dict):
+            continue
+        for part, limit in limits.items():
+            over = sorted(((name, record[part]) for name, record in records.get(stage, {}).items()
+                           if record.get(part, 0) > limit), key=lambda item: (-item[1], item[0]))
+            if over:
+                violations.append({"stage": stage, "part": part, "limit": limit, "pages": over})
+    return violations
+
+def build_report(records, budgets, top=10):
+    """크기 리포트 생성 - 단계별·출발지별 합계, 가장 큰 페이지, 예산 초과 목록"""
+    report = {"stages": {}, "violations": check_budgets(records, budgets), "mode": budgets.get("mode", "warn")}
+    for stage, stage_records in sorted(records.items()):
+        totals, terminals = {}, {}
+        for record in stage_records.values():
+            add_sizes(totals, record)
+            add_sizes(terminals.setdefault(record.get("terminal", ""), {}), record)
+        largest = sorted(stage_records.items(), key=lambda item: (-item[1]["page"], item[0]))[:top]
+        report["stages"][stage] = {
+            "totals": totals,
+            "terminals": dict(sorted(terminals.items(), key=lambda item: (-item[1]["page"], item[0]))),
+            "largest": [dict(record, file=name) for name, record in largest],
+        }
+    return report
+
+def print_report(report, top_terminals=5):
+    """크기 리포트 출력"""
+    for stage, stats in report["stages"].items():
+        totals = stats["totals"]
+        print(f"\n📏 {stage_labels.get(stage, stage)}: {totals['pages']:,}개 | {totals['page']:,} bytes "
+              f"(평균 {totals['page'] // totals['pages']:,} bytes)")
+        for part in parts:
+            if totals[part]:
+                print(f"   {part_labels[part]}: {totals[part]:,} bytes ({totals[part] / totals['page'] * 100:.1f}%)")
+        print(f"   🏢 {key_labels.get(stage, '출발지')}별 상위 {top_terminals}개:")
+        for terminal, sizes in list(stats["terminals"].items())[:top_terminals]:
+            print(f"      {terminal}: {sizes['pages']:,}개 | {sizes['page']:,} bytes")
+        print(f"   🔝 가장 큰 페이지:")
+        for record in stats["largest"]:
+            print(f"      {record['page']:,} bytes  {record['file']}")
+
+    icon = "🚫" if report["mode"] == "fail" else "⚠️ "
+    for violation in report["violations"]:
+        print(f"\n{icon} 예산 초과 - {stage_labels.get(violation['stage'], violation['stage'])} "
+              f"{part_labels.get(violation['part'], violation['part'])} {violation['limit']:,} bytes: "
+              f"{len(violation['pages']):,}개 페이지")
+        for name, size in violation["pages"][:5]:
+            print(f"      {size:,} bytes  {name}")
+        if len(violation["pages"]) > 5:
+            print(f"      ... 외 {len(violation['pages']) - 5}개 페이지")
+    if not report["violations"]:
+        print("\n✅ 모든 페이지가 크기 예산 안에 있습니다.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="페이지 크기 분석 (항목별 바이트, 출발지별 합계, 크기 예산 검사)")
+    parser.add_argument("--folder", default=sizes_folder, help=f"크기 기록 폴더 (기본값: {sizes_folder})")
+    parser.add_argument("--budgets", default=budgets_file, help=f"예산 설정 JSON (기본값: {budgets_file})")
+    parser.add_argument("--top", type=int, default=10, help="단계마다 보여줄 가장 큰 페이지 수 (기본값: 10)")
+    parser.add_argument("--report", default=report_file, help=f"결과 JSON 경로 (기본값: {report_file})")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--fail", action="store_const", const="fail", dest="mode", help="예산을 넘으면 종료 코드 1")
+    mode.add_argument("--warn", action="store_const", const="warn", dest="mode", help="예산을 넘어도 경고만 출력")
+    args = parser.parse_args()
+
+    records = load_records(args.folder)
+    if not records:
+        print(f"🚫 크기 기록이 없습니다: {args.folder}/ (app.py·hub.py를 먼저 실행하세요)")
+        exit(1)
+    budgets = load_budgets(args.budgets)
+    if args.mode:
+        budgets["mode"] = args.mode
+    report = build_report(records, budgets, args.top)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print_report(report)
+    print(f"\n📄 결과 저장: {args.report}")
+    if report["mode"] == "fail" and report["violations"]:
+        exit(1)
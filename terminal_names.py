@@ -0,0 +1,280 @@
+import os
+import re
+import json
+import glob
+import time
+import argparse
+import unicodedata
+
+import manifest
+
+# 📂 터미널 이름을 모으는 곳 (수집 데이터 + 노선 파일)
+data_pattern = "data/*.json"
+route_file = "route/total_route.json"
+report_file = os.path.join("outputs", "terminal_duplicates.json")  # 배포하지 않는 빌드 산출물
+
+# 🔤 이름 정규화 규칙 - 전각·대괄호는 소괄호로, 공백은 모두 제거 ('마포역 (서울가든호텔)' = '마포역(서울가든호텔)')
+bracket_table = str.maketrans({"（": "(", "）": ")", "[": "(", "]": ")", "〔": "(", "〕": ")"})
+space_pattern = re.compile(r"\s+")
+paren_pattern = re.compile(r"\(([^)]*)\)")
+digit_pattern = re.compile(r"\d+")
+marker_pattern = re.compile(r"국내|국제")  # 숫자처럼 다른 터미널을 가르는 표기 ('김해공항국내'·'김해공항국제')
+
+# 🇰🇷 초성 (가~힣 한 글자 → 19개 초성 중 하나, 588 = 중성 21 × 종성 28)
+choseong = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+duplicate_threshold = 0.75  # 이 이상 비슷한 이름은 같은 터미널일 수 있는 후보로 표시
+
+def normalize(name):
+    """이름 → 검색 키 (NFC, 괄호 통일, 공백 제거, 소문자)"""
+    text = unicodedata.normalize("NFC", str(name)).translate(bracket_table)
+    return space_pattern.sub("", text).lower()
+
+def base_name(key):
+    """검색 키에서 괄호 표기를 뺀 이름 ('잠실역(중앙)' → '잠실역')"""
+    return paren_pattern.sub("", key) or key
+
+def choseong_key(text):
+    """한글은 초성으로, 나머지 글자·숫자는 그대로 ('잠실역(중앙)' → 'ㅈㅅㅇㅈㅇ')"""
+    chars = []
+    for char in text:
+        if "가" <= char <= "힣":
+            chars.append(choseong[(ord(char) - ord("가")) // 588])
+        elif char.isalnum():
+            chars.append(char)
+    return "".join(chars)
+
+def is_choseong_query(key):
+    """초성만으로 된 검색어인지 (예: 'ㄷㅅㅇ')"""
+    return bool(key) and all(char in choseong for char in key)
+
+def trigrams(key):
+    """검색 키 → 글자 3-gram 집합
+
+    앞뒤에 ^·$ 표시를 붙이고 첫 두 글자('^잠')도 넣어 한두 글자 검색어도 색인으로 찾을 수 있습니다.
+    괄호는 빼고 안의 글자는 남깁니다.
+    """
+    text = f"^{key.replace('(', '').replace(')', '')}$"
+    grams = {text[i:i + 3] for i in range(len(text) - 2)}
+    grams.add(text[:2])
+    return grams
+
+def collect_names(data_pattern=data_pattern, route_file=route_file):
+    """data/·노선 파일의 모든 터미널 이름 → {이름: 나온 횟수} (횟수는 같은 점수끼리 순위를 정할 때 사용)"""
+    counts = {}
+
+    def add(name):
+        name = str(name).strip() if name else ""
+        if name:
+            counts[name] = counts.get(name, 0) + 1
+
+    for path in sorted(glob.glob(data_pattern)):
+        filename = os.path.basename(path)
+        add(filename.replace("_schedules.json", "") if "_schedules.json" in filename
+            else filename.replace(".json", "").split("_")[0])
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            for arrival in data:
+                add(arrival)
+        elif isinstance(data, list):
+            for item in data:
+                add(item.get("출발지"))
+                add(item.get("도착지"))
+
+    if os.path.exists(route_file):
+        with open(route_file, "r", encoding="utf-8") as f:
+            routes = json.load(f)
+        for departure, arrivals in routes.items():
+            add(departure)
+            for arrival in arrivals:
+                add(arrival)
+    return counts
+
+def build_resolver(counts):
+    """이름 목록으로 검색 색인을 한 번 만듦 → resolver dict
+
+    3-gram 색인({gram: [이름 번호]})은 비슷한 이름을, 초성 접두사 색인({'ㅈㅅ': [이름 번호]})은
+    초성 검색을 맡습니다. 검색 한 번은 검색어의 gram 몇 개에 해당하는 목록만 훑습니다.
+    """
+    names = sorted(counts)
+    keys = [normalize(name) for name in names]
+    resolver = {
+        "names": names,
+        "keys": keys,
+        "counts": [counts[name] for name in names],
+        "gram_counts": [],
+        "grams": {},
+        "choseong": {},
+        "choseong_lengths": [],
+        "exact": {},
+        "bases": {},
+    }
+    for i, key in enumerate(keys):
+        grams = trigrams(key)
+        resolver["gram_counts"].append(len(grams))
+        for gram in grams:
+            resolver["grams"].setdefault(gram, []).append(i)
+        initials = choseong_key(key)
+        resolver["choseong_lengths"].append(len(initials))
+        for end in range(1, len(initials) + 1):
+            resolver["choseong"].setdefault(initials[:end], []).append(i)
+        resolver["exact"].setdefault(key, []).append(i)
+        resolver["bases"].setdefault(base_name(key), []).append(i)
+    return resolver
+
+def load_resolver(data_pattern=data_pattern, route_file=route_file):
+    """data/·노선 파일의 모든 이름으로 resolver 생성"""
+    return build_resolver(collect_names(data_pattern, route_file))
+
+def candidate_scores(resolver, key):
+    """검색 키 → {이름 번호: 점수(0~1)}"""
+    if is_choseong_query(key):
+        # 초성 검색: 초성이 검색어로 시작하는 이름, 초성 길이가 가까울수록 높게
+        return {i: 0.5 + 0.4 * len(key) / resolver["choseong_lengths"][i]
+                for i in resolver["choseong"].get(key, ())}
+
+    query_grams = trigrams(key)
+    shared = {}
+    for gram in query_grams:
+        for i in resolver["grams"].get(gram, ()):
+            shared[i] = shared.get(i, 0) + 1
+
+    scores = {}
+    for i, count in shared.items():
+        # Dice 계수 (겹치는 gram 수 기준), 앞부분이 같으면 검색어가 차지하는 비율만큼 가산
+        score = 2 * count / (len(query_grams) + resolver["gram_counts"][i])
+        name_key = resolver["keys"][i]
+        if name_key.startswith(key):
+            score = max(score, 0.6 + 0.3 * len(key) / len(name_key))
+        scores[i] = score
+    for i in resolver["bases"].get(key, ()):
+        scores[i] = max(scores.get(i, 0), 0.95)  # 괄호 표기만 다른 이름 ('잠실역' → '잠실역(중앙)')
+    for i in resolver["exact"].get(key, ()):
+        scores[i] = 1.0
+    return scores
+
+def resolve(resolver, query, limit=5, min_score=0.3):
+    """검색어 → [(이름, 점수)] 점수 높은 순 (같으면 많이 나온 이름 먼저)"""
+    key = normalize(query)
+    if not key:
+        return []
+    scores = candidate_scores(resolver, key)
+    ranked = sorted((i for i, score in scores.items() if score >= min_score),
+                    key=lambda i: (-scores[i], -resolver["counts"][i], resolver["names"][i]))
+    return [(resolver["names"][i], round(scores[i], 3)) for i in ranked[:limit]]
+
+def resolve_name(resolver, query):
+    """표기만 다른 같은 이름이면 원래 이름, 아니면 None ('마포역 (서울가든호텔)' → '마포역(서울가든호텔)')"""
+    matches = resolver["exact"].get(normalize(query))
+    if not matches:
+        return None
+    return resolver["names"][max(matches, key=lambda i: resolver["counts"][i])]
+
+def resolve_names(resolver, queries, suggestions=3):
+    """여러 이름을 한 번에 확인 → (찾은 이름 목록, {못 찾은 이름: [비슷한 이름]})"""
+    resolved, unknown = [], {}
+    for query in queries:
+        name = resolve_name(resolver, query)
+        if name is None:
+            unknown[query] = [match for match, _ in resolve(resolver, query, suggestions)]
+        else:
+            resolved.append(name)
+    return resolved, unknown
+
+def duplicate_kind(key_a, key_b, similarity, threshold=duplicate_threshold):
+    """두 검색 키가 같은 터미널일 가능성 → 종류 (아니면 None)
+
+    spacing: 공백·괄호 모양만 다름, qualifier: 한쪽에만 괄호 표기, similar: 글자가 거의 같음.
+    괄호 표기가 서로 다르거나('고성(경남)'·'고성(강원)') 숫자·국내/국제 표기가 다르면
+    ('인천공항1터미널'·'인천공항2터미널', '김해공항국내'·'김해공항국제') 다른 터미널로 봅니다.
+    """
+    if key_a == key_b:
+        return "spacing"
+    if digit_pattern.findall(key_a) != digit_pattern.findall(key_b):
+        return None
+    if marker_pattern.findall(key_a) != marker_pattern.findall(key_b):
+        return None
+    qualifiers_a, qualifiers_b = paren_pattern.findall(key_a), paren_pattern.findall(key_b)
+    if qualifiers_a and qualifiers_b and qualifiers_a != qualifiers_b:
+        return None
+    if base_name(key_a) == base_name(key_b):
+        return "qualifier"
+    if similarity >= threshold:
+        return "similar"
+    return None
+
+def near_duplicates(resolver, threshold=duplicate_threshold):
+    """같은 터미널을 가리킬 가능성이 큰 이름 쌍 → [{"names", "kind", "similarity"}] (비슷한 순)
+
+    이름마다 3-gram 색인으로 겹치는 이름만 후보로 보므로 모든 쌍을 비교하지 않습니다.
+    """
+    names, keys = resolver["names"], resolver["keys"]
+    pairs = {}
+    for i, key in enumerate(keys):
+        shared = {}
+        for gram in trigrams(key):
+            for j in resolver["grams"].get(gram, ()):
+                if j > i:
+                    shared[j] = shared.get(j, 0) + 1
+        for j in resolver["bases"].get(base_name(key), ()):
+            if j > i:
+                shared.setdefault(j, 0)
+        for j, count in shared.items():
+            similarity = 2 * count / (resolver["gram_counts"][i] + resolver["gram_counts"][j])
+            if similarity < threshold and base_name(key) != base_name(keys[j]):
+                continue
+            kind = duplicate_kind(key, keys[j], similarity, threshold)
+            if kind:
+                pairs[(i, j)] = {"names": [names[i], names[j]], "kind": kind, "similarity": round(similarity, 3)}
+    return sorted(pairs.values(), key=lambda pair: (-pair["similarity"], pair["names"]))
+
+def search_entries(resolver):
+    """검색 색인을 만드는 쪽(클라이언트 자동완성 등)에 넘길 이름별 키 목록"""
+    return [{"name": name, "key": key, "choseong": choseong_key(key)}
+            for name, key in zip(resolver["names"], resolver["keys"])]
+
+def print_matches(resolver, query, limit):
+    """검색 결과와 걸린 시간 출력"""
+    started = time.perf_counter()
+    matches = resolve(resolver, query, limit)
+    elapsed = (time.perf_counter() - started) * 1_000_000
+    print(f"🔎 '{query}' ({elapsed:,.0f}µs)")
+    if not matches:
+        print("   ❓ 비슷한 이름이 없습니다.")
+    for name, score in matches:
+        print(f"   {score:.3f}  {name}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="터미널 이름 검색 (표기 차이·부분 입력·초성) 및 중복 의심 이름 찾기")
+    parser.add_argument("queries", nargs="*", help="검색어 (예: 잠실, 부산 서부, ㄷㅅㅇ)")
+    parser.add_argument("--limit", type=int, default=5, help="검색어마다 보여줄 결과 수 (기본값: 5)")
+    parser.add_argument("--duplicates", action="store_true", help="같은 터미널일 가능성이 큰 이름 쌍 찾기")
+    parser.add_argument("--report", default=report_file, help=f"중복 의심 결과 JSON 경로 (기본값: {report_file})")
+    parser.add_argument("--export", metavar="PATH", help="이름별 검색 키(정규화·초성) JSON 저장")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    resolver = load_resolver()
+    print(f"📚 이름 {len(resolver['names']):,}개 색인 완료 ({time.perf_counter() - started:.2f}초, "
+          f"3-gram {len(resolver['grams']):,}개)")
+
+    for query in args.queries:
+        print_matches(resolver, query, args.limit)
+
+    if args.duplicates:
+        duplicates = near_duplicates(resolver)
+        kinds = {"spacing": "공백·괄호 모양", "qualifier": "괄호 표기", "similar": "비슷한 글자"}
+        print(f"\n⚠️  같은 터미널일 수 있는 이름 {len(duplicates):,}쌍")
+        for pair in duplicates[:30]:
+            print(f"   {pair['similarity']:.3f}  {pair['names'][0]} ↔ {pair['names'][1]} ({kinds[pair['kind']]})")
+        if len(duplicates) > 30:
+            print(f"   ... 외 {len(duplicates) - 30}쌍")
+        os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+        manifest.atomic_write(args.report, json.dumps(duplicates, ensure_ascii=False, indent=2))
+        print(f"📄 결과 저장: {args.report}")
+
+    if args.export:
+        os.makedirs(os.path.dirname(args.export) or ".", exist_ok=True)
+        manifest.atomic_write(args.export, json.dumps(search_entries(resolver), ensure_ascii=False, separators=(",", ":")))
+        print(f"💾 검색 키 저장: {args.export}")
@@ -0,0 +1,188 @@
+import os
+import io
+import json
+import glob
+import argparse
+import contextlib
+from collections import defaultdict
+
+import manifest
+
+# 📂 운행 패턴 분석 결과 (페이지에는 배포하지 않는 빌드 산출물)
+output_folder = "outputs"
+trip_patterns_file = os.path.join(output_folder, "trip_patterns.json")
+
+# 🚌 운행(trip) 재구성 규칙
+#   같은 출발지에서 같은 시각에 같은 운행회사(등급 포함)로 출발하는 버스를 한 대로 보고,
+#   도착지들을 소요시간(LIN_TIM) 순으로 정렬해 정차 순서(패턴)를 만듭니다.
+#   우연히 시각이 겹친 다른 버스를 합치지 않도록, 두 도착지의 출발 목록이
+#   작은 쪽 기준 절반 이상 겹칠 때만 같은 운행으로 묶습니다.
+min_shared_ratio = 0.5
+
+def departure_time(bus):
+    """버스 데이터의 출발시각 → 'HH:MM' (없으면 None)"""
+    raw = str(bus.get('TIM_TIM') or bus.get('출발시각') or '').strip()
+    if ':' in raw:
+        return raw
+    if len(raw) >= 4:
+        return f"{raw[:2]}:{raw[2:4]}"
+    return None
+
+def operator_name(bus):
+    """운행회사와 등급 (예: '아성고속(우등)')"""
+    return str(bus.get('COR_NAM') or bus.get('차편정보') or '정보 없음').strip()
+
+def find_root(parents, i):
+    """union-find 루트 찾기 (경로 압축)"""
+    while parents[i] != i:
+        parents[i] = parents[parents[i]]
+        i = parents[i]
+    return i
+
+def build_trip_patterns(origin, schedules):
+    """출발지 하나의 {도착지: [버스 데이터]} → 운행 패턴 모델
+
+    반환값: {"origin", "patterns": [[정류장, ...]], "trips": [{"time", "operator", "pattern", "offsets"}]}
+    offsets는 출발지 기준 각 정류장까지의 소요시간(분)이며, 운행 하나는 한 번만 저장됩니다.
+    """
+    groups = defaultdict(list)  # (출발시각, 운행회사) → [(소요시간, 도착지)]
+    departures = defaultdict(set)  # 도착지 → {(출발시각, 운행회사)}
+    for destination, buses in schedules.items():
+        for bus in buses or []:
+            dep_time = departure_time(bus)
+            if dep_time is None:
+                continue
+            key = (dep_time, operator_name(bus))
+            duration = bus.get('LIN_TIM') or 0
+            groups[key].append((duration if isinstance(duration, int) else 0, str(destination)))
+            departures[str(destination)].add(key)
+
+    linked_cache = {}
+
+    def linked(a, b):
+        pair = (a, b) if a < b else (b, a)
+        if pair not in linked_cache:
+            shared = len(departures[a] & departures[b])
+            linked_cache[pair] = shared >= min_shared_ratio * min(len(departures[a]), len(departures[b]))
+        return linked_cache[pair]
+
+    patterns = []
+    pattern_ids = {}
+    trips = []
+    for (dep_time, operator), stops in sorted(groups.items()):
+        stops.sort()
+        parents = list(range(len(stops)))
+        for i in range(len(stops)):
+            for j in range(i + 1, len(stops)):
+                if stops[i][1] != stops[j][1] and linked(stops[i][1], stops[j][1]):
+                    parents[find_root(parents, j)] = find_root(parents, i)
+
+        clusters = defaultdict(list)
+        for i, stop in enumerate(stops):
+            clusters[find_root(parents, i)].append(stop)
+
+        for cluster in clusters.values():
+            # 같은 도착지가 두 번 나오면 다른 버스이므로 따로 분리
+            trip_stops, extra = [], []
+            seen = set()
+            for duration, destination in cluster:
+                (extra if destination in seen else trip_stops).append((duration, destination))
+                seen.add(destination)
+            for members in [trip_stops] + [[stop] for stop in extra]:
+                sequence = tuple(destination for _, destination in members)
+                if sequence not in pattern_ids:
+                    pattern_ids[sequence] = len(patterns)
+                    patterns.append(list(sequence))
+                trips.append({
+                    "time": dep_time,
+                    "operator": operator,
+                    "pattern": pattern_ids[sequence],
+                    "offsets": [duration for duration, _ in members],
+                })
+
+    trips.sort(key=lambda trip: (trip["time"], trip["operator"], trip["pattern"]))
+    return {"origin": origin, "patterns": patterns, "trips": trips}
+
+def stop_index(trip_model):
+    """도착지별 함께 정차하는 정류장 → {도착지: (앞 정류장 목록, 뒤 정류장 목록)}
+
+    앞 정류장은 해당 도착지보다 먼저 서는 경유지, 뒤 정류장은 그 이후에 서는 곳이며
+    각각 평균 소요시간 순으로 정렬됩니다.
+    """
+    before = defaultdict(lambda: defaultdict(list))
+    after = defaultdict(lambda: defaultdict(list))
+    for trip in trip_model["trips"]:
+        stops = trip_model["patterns"][trip["pattern"]]
+        if len(stops) < 2:
+            continue
+        for i, destination in enumerate(stops):
+            for j, other in enumerate(stops):
+                if j < i:
+                    before[destination][other].append(trip["offsets"][j])
+                elif j > i:
+                    after[destination][other].append(trip["offsets"][j])
+
+    def ordered(offsets_by_stop):
+        return [stop for stop, offsets in sorted(
+            offsets_by_stop.items(), key=lambda item: (sum(item[1]) / len(item[1]), item[0]))]
+
+    destinations = set(before) | set(after)
+    return {destination: (ordered(before[destination]), ordered(after[destination]))
+            for destination in destinations}
+
+def trip_connections(trip_model):
+    """운행별 인접 정류장 구간 목록 (환승 탐색용) → [(출발 정류장, 도착 정류장, 출발 분, 도착 분, 운행회사)]
+
+    출발지 → 모든 도착지 조합 대신 운행마다 이웃한 정류장 사이만 연결합니다.
+    """
+    connections = []
+    for trip in trip_model["trips"]:
+        hour, minute = trip["time"].split(":")
+        start = int(hour) * 60 + int(minute)
+        previous_stop, previous_offset = trip_model["origin"], 0
+        for stop, offset in zip(trip_model["patterns"][trip["pattern"]], trip["offsets"]):
+            connections.append((previous_stop, stop, start + previous_offset, start + offset, trip["operator"]))
+            previous_stop, previous_offset = stop, offset
+    return connections
+
+def summarize(trip_models):
+    """분석 결과 요약 (출발 건수, 운행 수, 패턴 수, 구간 수)"""
+    departures = sum(len(trip["offsets"]) for model in trip_models.values() for trip in model["trips"])
+    trips = sum(len(model["trips"]) for model in trip_models.values())
+    patterns = sum(len(model["patterns"]) for model in trip_models.values())
+    connections = sum(len(trip_connections(model)) for model in trip_models.values())
+    return {"departures": departures, "trips": trips, "patterns": patterns, "connections": connections}
+
+def save_trip_patterns(trip_models, path=trip_patterns_file):
+    """출발지별 운행 패턴 모델을 JSON으로 저장"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    content = json.dumps(dict(sorted(trip_models.items())), ensure_ascii=False, separators=(",", ":"))
+    manifest.atomic_write(path, content)
+    return len(content.encode("utf-8"))
+
+if __name__ == "__main__":
+    import app
+
+    parser = argparse.ArgumentParser(description="출발지별 운행 패턴 재구성 (여러 도착지를 지나는 같은 버스를 한 번만 저장)")
+    parser.add_argument("--output", default=trip_patterns_file, help=f"결과 파일 (기본값: {trip_patterns_file})")
+    args = parser.parse_args()
+
+    print("🚀 운행 패턴 분석 시작...")
+    trip_models = {}
+    for json_file_path in sorted(glob.glob(os.path.join(app.data_folder, "*_schedules.json"))):
+        origin = app.terminal_name_from_path(json_file_path)
+        # 데이터 변환 로그는 생략
+        with contextlib.redirect_stdout(io.StringIO()):
+            bus_data = app.read_bus_data(json_file_path)
+            schedules = app.normalize_schedules(bus_data) if bus_data is not None else None
+        if schedules is None:
+            print(f"⚠️  {json_file_path}: 데이터를 읽을 수 없어 건너뜁니다.")
+            continue
+        trip_models[origin] = build_trip_patterns(origin, schedules)
+
+    size = save_trip_patterns(trip_models, args.output)
+    summary = summarize(trip_models)
+    print(f"🎉 운행 패턴 분석 완료: {args.output} ({size:,} bytes)")
+    print(f"   🚏 출발지: {len(trip_models)}개")
+    print(f"   🚌 출발 {summary['departures']:,}건 → 운행 {summary['trips']:,}회 (패턴 {summary['patterns']:,}개)")
+    print(f"   🔗 환승 탐색 구간: {summary['connections']:,}개")